@@ -10,6 +10,7 @@ SCREEN_WIDTH = 1280
 SCREEN_HEIGHT = 720
 FPS = 60
 TITLE = "青稜中学校・高等学校 経営シミュレーション"
+DIRTY_RECT_RENDERING = True         # プレイ中は変化した部分だけ描き直して画面へ転送する
 
 # =============================================================================
 # フォント設定（日本語対応）
@@ -21,6 +22,7 @@ FONT_SIZE_NORMAL = 22
 FONT_SIZE_LARGE = 28
 FONT_SIZE_TITLE = 48
 FONT_SIZE_HUGE = 64
+TEXT_CACHE_BUDGET_BYTES = 8 * 1024 * 1024   # 描画済みテキストのキャッシュ上限（バイト）
 
 # =============================================================================
 # 初期値
@@ -108,18 +110,46 @@ DROPOUT_RATE_MEDIUM_SATISFACTION = 0.005    # 満足度50: 0.5%/月
 DROPOUT_RATE_LOW_SATISFACTION = 0.02        # 満足度20以下: 2%/月
 DROPOUT_RATE_VERY_LOW = 0.04                # 満足度0: 4%/月
 
+# 卒業関連
+JUNIOR_HIGH_OUTFLOW_RATE = 0.3              # 中3の外部高校進学率
+
 # =============================================================================
 # 時間関連
 # =============================================================================
 GAME_SPEED_NORMAL = 1.0             # 通常速度: 1秒=1日
 GAME_SPEED_FAST = 3.0               # 高速
 GAME_SPEED_FASTER = 10.0            # 超高速
+GAME_SPEED_ULTRA = 100.0            # 早送り
+GAME_SPEED_HYPER = 1000.0           # 長期早送り
+GAME_SPEED_MAX = float('inf')       # 最高速（1フレームで数ヶ月進める）
+MAX_SPEED_MONTHS_PER_FRAME = 12     # 最高速時に1フレームで進める月数
 
 DAYS_PER_MONTH = 30
 MONTHS_PER_YEAR = 12
 START_YEAR = 2024
 START_MONTH = 4                     # 4月スタート
 
+# =============================================================================
+# 大規模シミュレーション設定
+# =============================================================================
+COHORT_POPULATION_THRESHOLD = 50_000    # この生徒数を超えたら集計モードへ自動切替
+COHORT_SATISFACTION_BUCKETS = 20        # 集計モードの満足度区分数
+BUILD_PREVIEW_MONTHS = 12               # 建設ダイアログで試算する月数
+BUILD_PREVIEW_WORKERS = 2               # 建設ダイアログの試算に使うワーカープロセス数
+
+# =============================================================================
+# セーブ設定
+# =============================================================================
+AUTOSAVE_PATH = "autosave.sry"          # オートセーブの保存先
+AUTOSAVE_INTERVAL_MONTHS = 1            # オートセーブする間隔（ゲーム内の月数）
+AUTOSAVE_MIN_INTERVAL_SECONDS = 5.0     # 早送り中に保存しすぎないための最短間隔（実時間）
+JOURNAL_PATH = "journal.jsonl"          # 操作ジャーナルの保存先（シードと操作から再生できる）
+
+# 巻き戻し用の履歴
+TIMELINE_KEYFRAME_INTERVAL = 12         # 完全なスナップショットを取る間隔（月数）
+TIMELINE_MAX_KEYFRAMES = 32             # 保持するスナップショットの上限（超えたら古い方を間引く）
+TIMELINE_RECENT_KEYFRAMES = 8           # 間引かずに残す直近のスナップショット数
+
 # =============================================================================
 # ゲームオーバー条件
 # =============================================================================
@@ -0,0 +1,131 @@
+"""
+オートセーブ - 状態のコピーだけをメインスレッドで取り、書き込みは別スレッドで行う
+"""
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+import config
+from src.core.simulation import Simulation
+from src.core.snapshot import SnapshotData, capture, write_snapshot_file
+
+
+@dataclass
+class AutosaveStats:
+    """オートセーブの計測値（ミリ秒）"""
+    saves: int = 0                  # 書き込み完了数
+    skipped: int = 0                # 書き込み中に新しい状態が来て捨てた数
+    last_capture_ms: float = 0.0    # 状態コピーにかかった時間（メインスレッド）
+    max_capture_ms: float = 0.0
+    last_write_ms: float = 0.0      # シリアライズ・圧縮・書き込みの時間（ワーカー）
+    max_write_ms: float = 0.0
+    last_error: Optional[str] = None
+
+
+class AutosaveService:
+    """
+    月の切り替わりで状態をコピーし、ワーカースレッドでファイルに書き込む
+
+    書き込みが追いつかない場合は最新の状態だけを残す。
+    """
+
+    def __init__(
+        self,
+        path: str = config.AUTOSAVE_PATH,
+        interval_months: int = config.AUTOSAVE_INTERVAL_MONTHS,
+        min_interval_seconds: float = config.AUTOSAVE_MIN_INTERVAL_SECONDS,
+        compress: bool = True,
+    ):
+        self.path = path
+        self.interval_months = interval_months
+        self.min_interval_seconds = min_interval_seconds
+        self.compress = compress
+        self.stats = AutosaveStats()
+
+        self._months_since_save = 0
+        self._last_capture_time: Optional[float] = None
+        self._pending: Optional[SnapshotData] = None
+        self._writing = False
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name='autosave', daemon=True)
+        self._thread.start()
+
+    def on_month_end(self, simulation: Simulation) -> bool:
+        """
+        月次処理の後に呼ぶ（間隔に達していれば保存を依頼）
+
+        Returns:
+            保存を依頼したか
+        """
+        self._months_since_save += 1
+        if self._months_since_save < self.interval_months:
+            return False
+
+        now = time.perf_counter()
+        if (self._last_capture_time is not None
+                and now - self._last_capture_time < self.min_interval_seconds):
+            return False
+
+        self.save(simulation)
+        return True
+
+    def save(self, simulation: Simulation) -> None:
+        """現在の状態をコピーして書き込みを依頼（すぐに戻る）"""
+        start = time.perf_counter()
+        data = capture(simulation)
+        elapsed_ms = (time.perf_counter() - start) * 1000.0
+
+        self._months_since_save = 0
+        self._last_capture_time = start
+        self.stats.last_capture_ms = elapsed_ms
+        self.stats.max_capture_ms = max(self.stats.max_capture_ms, elapsed_ms)
+
+        # 異常終了してもセーブした時点まではジャーナルから再生できるようにする
+        if simulation.journal is not None:
+            simulation.journal.mark_end(simulation.time_manager.absolute_day)
+
+        with self._condition:
+            if self._pending is not None:
+                self.stats.skipped += 1
+            self._pending = data
+            self._condition.notify()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """依頼済みの書き込みが終わるまで待つ"""
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: self._pending is None and not self._writing, timeout)
+
+    def close(self) -> None:
+        """残りを書き込んでワーカーを終了"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending is not None or self._closed)
+                if self._pending is None:
+                    return
+                data, self._pending = self._pending, None
+                self._writing = True
+
+            start = time.perf_counter()
+            try:
+                write_snapshot_file(data, self.path, self.compress)
+            except OSError as error:
+                self.stats.last_error = str(error)
+            else:
+                elapsed_ms = (time.perf_counter() - start) * 1000.0
+                self.stats.saves += 1
+                self.stats.last_write_ms = elapsed_ms
+                self.stats.max_write_ms = max(self.stats.max_write_ms, elapsed_ms)
+                self.stats.last_error = None
+
+            with self._condition:
+                self._writing = False
+                self._condition.notify_all()
@@ -0,0 +1,143 @@
+"""
+履歴の書き出し - 月次処理ごとに1行ずつNDJSON/CSVへ書き出す（メモリに溜めない）
+"""
+import csv
+import gzip
+import io
+import json
+from abc import ABC, abstractmethod
+from dataclasses import asdict
+from typing import IO, Any, Dict, Optional
+
+from src.core.simulation import Simulation
+from src.systems.economy_system import MonthlyReport
+
+# 書き込みバッファのサイズ
+BUFFER_SIZE = 1 << 16
+
+
+class RowWriter(ABC):
+    """1行ずつ書き出す出力先（NDJSON・CSVの共通部分）"""
+
+    def __init__(self, stream: IO[str]):
+        self.stream = stream
+
+    @abstractmethod
+    def write(self, row: Dict[str, Any]) -> None:
+        """1行書き出す"""
+
+    def flush(self) -> None:
+        self.stream.flush()
+
+    def close(self) -> None:
+        self.stream.close()
+
+
+class NDJSONWriter(RowWriter):
+    """1行1オブジェクトのJSON"""
+
+    def write(self, row: Dict[str, Any]) -> None:
+        self.stream.write(json.dumps(row, ensure_ascii=False, separators=(',', ':')))
+        self.stream.write('\n')
+
+
+class CSVWriter(RowWriter):
+    """CSV（列は最初の行で決まる）"""
+
+    def __init__(self, stream: IO[str]):
+        super().__init__(stream)
+        self._writer: Optional[csv.DictWriter] = None
+
+    def write(self, row: Dict[str, Any]) -> None:
+        if self._writer is None:
+            self._writer = csv.DictWriter(self.stream, fieldnames=list(row))
+            self._writer.writeheader()
+        self._writer.writerow(row)
+
+
+def open_writer(path: str) -> RowWriter:
+    """
+    拡張子から形式を決めて出力先を開く
+
+    .csv → CSV、.ndjson / .jsonl → NDJSON。末尾に .gz を付けるとgzip圧縮する。
+    """
+    compressed = path.endswith('.gz')
+    base = path[:-3] if compressed else path
+
+    if compressed:
+        # 圧縮率より速度を優先（レベル1）
+        stream = io.TextIOWrapper(
+            io.BufferedWriter(gzip.open(path, 'wb', compresslevel=1), BUFFER_SIZE),
+            encoding='utf-8', newline='')
+    else:
+        stream = open(path, 'w', encoding='utf-8', newline='', buffering=BUFFER_SIZE)
+
+    if base.endswith('.csv'):
+        return CSVWriter(stream)
+    if base.endswith(('.ndjson', '.jsonl')):
+        return NDJSONWriter(stream)
+    stream.close()
+    raise ValueError(f"対応していない形式です: {path}")
+
+
+class HistoryExporter:
+    """月次処理の結果を出力先へ流す"""
+
+    def __init__(self, writer: RowWriter, flush_interval: int = 12,
+                 constants: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            writer: 出力先
+            flush_interval: 何ヶ月ごとにバッファを書き出すか（0以下なら閉じる時のみ）
+            constants: 全行に付ける列（シード番号など）
+        """
+        self.writer = writer
+        self.flush_interval = flush_interval
+        self.constants = dict(constants or {})
+        self.rows = 0
+        self._simulation: Optional[Simulation] = None
+
+    @classmethod
+    def open(cls, path: str, **kwargs) -> 'HistoryExporter':
+        """ファイルを開いて作成（形式は拡張子で判定）"""
+        return cls(open_writer(path), **kwargs)
+
+    def attach(self, simulation: Simulation) -> None:
+        """シミュレーションの月次処理ごとに書き出す"""
+        self._simulation = simulation
+        simulation.add_month_end_listener(self.on_month_end)
+
+    def on_month_end(self, simulation: Simulation, report: MonthlyReport) -> None:
+        self.writer.write(self.build_row(simulation, report))
+        self.rows += 1
+        if self.flush_interval > 0 and self.rows % self.flush_interval == 0:
+            self.writer.flush()
+
+    def build_row(self, simulation: Simulation, report: MonthlyReport) -> Dict[str, Any]:
+        """1ヶ月分の行（日付・収支・入退学・主要指標）"""
+        school = simulation.school
+        row: Dict[str, Any] = dict(self.constants)
+        row['year'] = simulation.time_manager.year
+        row['month'] = simulation.time_manager.month
+        row.update(asdict(report))
+        row.update(asdict(simulation.current_enrollment))
+        row['reputation'] = round(school.reputation, 4)
+        row['education'] = round(school.education_quality, 4)
+        row['satisfaction'] = round(school.satisfaction, 4)
+        row['students'] = school.student_count
+        row['teachers'] = len(school.teachers)
+        row['promotion_effect'] = round(school.promotion_effect, 4)
+        return row
+
+    def close(self) -> None:
+        if self._simulation is not None:
+            self._simulation.remove_month_end_listener(self.on_month_end)
+            self._simulation = None
+        self.writer.close()
+
+    def __enter__(self) -> 'HistoryExporter':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
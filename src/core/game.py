@@ -79,11 +79,15 @@ class Game:
 
     def _render(self) -> None:
         """描画処理"""
-        if self.game_manager:
-            self.game_manager.render(self.screen)
-        pygame.display.flip()
+        dirty = self.game_manager.render(self.screen) if self.game_manager else None
+        if dirty is None:
+            pygame.display.flip()
+        elif dirty:
+            pygame.display.update(dirty)
 
     def _cleanup(self) -> None:
         """終了処理"""
+        if self.game_manager:
+            self.game_manager.shutdown()
         pygame.quit()
         sys.exit()
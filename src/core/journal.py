@@ -0,0 +1,179 @@
+"""
+操作ジャーナル - プレイヤー操作をゲーム内日付つきで記録し、画面なしで再生する
+
+ファイル形式は1行1レコードのJSON。
+1行目はヘッダ（ルートシードと初期設定）、以降が操作の記録。
+終了時とオートセーブ時には {"end_day": 通算日} を書き、再生はデフォルトで最後に記録された日まで進める。
+"""
+import argparse
+import json
+import time
+from dataclasses import asdict, dataclass, field
+from typing import IO, TYPE_CHECKING, Any, Dict, Iterator, List, Optional
+
+from src.entities.teacher import Teacher
+
+if TYPE_CHECKING:
+    from src.core.simulation import Simulation
+
+JOURNAL_VERSION = 1
+
+# 操作の種類
+ACTION_HIRE = 'hire'
+ACTION_FIRE = 'fire'
+ACTION_PROMOTE = 'promote'
+ACTION_BUILD = 'build'
+ACTION_SPEED = 'speed'
+
+
+@dataclass
+class JournalEntry:
+    """記録された操作"""
+    day: int                    # 操作した通算日（その日のイベント処理の後）
+    action: str
+    args: Dict[str, Any] = field(default_factory=dict)
+
+
+class ActionJournal:
+    """追記のみの操作ジャーナル"""
+
+    def __init__(self, seed: int, start_config: Optional[dict] = None, stream: Optional[IO[str]] = None):
+        """
+        Args:
+            seed: シミュレーションのルートシード
+            start_config: Simulation.new_gameへの引数
+            stream: 書き込み先（Noneならメモリ上にのみ保持）
+        """
+        self.seed = seed
+        self.start_config = dict(start_config or {})
+        self.entries: List[JournalEntry] = []
+        self.end_day: Optional[int] = None     # 記録が続いていた最後の通算日
+        self._stream = stream
+        if stream is not None:
+            self._write_line({'version': JOURNAL_VERSION, 'seed': seed, 'start_config': self.start_config})
+
+    @classmethod
+    def create(cls, path: str, seed: int, start_config: Optional[dict] = None) -> 'ActionJournal':
+        """ファイルに書き込むジャーナルを作成（既存のファイルは上書き）"""
+        return cls(seed, start_config, open(path, 'w', encoding='utf-8'))
+
+    @classmethod
+    def read(cls, path: str) -> 'ActionJournal':
+        """ファイルからジャーナルを読み込む"""
+        with open(path, encoding='utf-8') as file:
+            lines = (json.loads(line) for line in file if line.strip())
+            header = next(lines, None)
+            if header is None or 'seed' not in header:
+                raise ValueError("操作ジャーナルではありません")
+            if header.get('version', 0) > JOURNAL_VERSION:
+                raise ValueError(f"未対応のジャーナルのバージョンです: {header['version']}")
+
+            journal = cls(header['seed'], header.get('start_config'))
+            for record in lines:
+                if 'end_day' in record:
+                    journal.end_day = record['end_day']
+                else:
+                    journal.entries.append(JournalEntry(**record))
+        return journal
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __iter__(self) -> Iterator[JournalEntry]:
+        return iter(self.entries)
+
+    def record(self, day: int, action: str, **args: Any) -> None:
+        """操作を追記"""
+        entry = JournalEntry(day, action, args)
+        self.entries.append(entry)
+        if self._stream is not None:
+            self._write_line(asdict(entry))
+
+    def mark_end(self, day: int) -> None:
+        """ここまで進んだことを記録（再生の終了日になる）"""
+        self.end_day = day
+        if self._stream is not None:
+            self._write_line({'end_day': day})
+
+    def close(self, end_day: Optional[int] = None) -> None:
+        """
+        ファイルを閉じる
+
+        Args:
+            end_day: 終了時の通算日（指定すると終了日として記録する）
+        """
+        if end_day is not None:
+            self.mark_end(end_day)
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+
+    def _write_line(self, record: dict) -> None:
+        # 異常終了しても直前の操作までは残るように1行ごとに書き出す
+        self._stream.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self._stream.flush()
+
+
+def apply_entry(simulation: 'Simulation', entry: JournalEntry) -> bool:
+    """記録された操作を1つ実行（ジャーナルには記録しない）"""
+    args = entry.args
+    if entry.action == ACTION_HIRE:
+        return simulation.hire_teacher(Teacher(**args['teacher']), record=False)
+    if entry.action == ACTION_FIRE:
+        return simulation.fire_teacher(args['teacher_id'], record=False)
+    if entry.action == ACTION_PROMOTE:
+        return simulation.run_promotion(args['promotion_type'], record=False)
+    if entry.action == ACTION_BUILD:
+        return simulation.build_facility(args['type_id'], args['grid_x'], args['grid_y'], record=False)
+    if entry.action == ACTION_SPEED:
+        # 画面なしの再生では速度は関係ない
+        return True
+    raise ValueError(f"不明な操作です: {entry.action}")
+
+
+def replay(journal: ActionJournal, until_day: Optional[int] = None) -> 'Simulation':
+    """
+    シードとジャーナルからゲームを再現（フレームを介さずイベント単位で進める）
+
+    Args:
+        journal: 再生するジャーナル
+        until_day: ここまで進める通算日（Noneなら記録の終了日、なければ最後の操作の日まで）
+    """
+    from src.core.simulation import Simulation
+    simulation = Simulation.new_game(seed=journal.seed, **journal.start_config)
+    for entry in journal:
+        simulation.advance_to_day(entry.day, stop_on_bankruptcy=False)
+        if not apply_entry(simulation, entry):
+            raise ValueError(f"記録と異なる結果になりました: {entry}")
+
+    if until_day is None:
+        until_day = journal.end_day
+    if until_day is not None:
+        simulation.advance_to_day(until_day, stop_on_bankruptcy=False)
+    return simulation
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """コマンドライン: python -m src.core.journal journal.jsonl [--months N] [--save out.sry]"""
+    parser = argparse.ArgumentParser(description="操作ジャーナルを画面なしで再生")
+    parser.add_argument('journal', help="ジャーナルファイル")
+    parser.add_argument('--months', type=int, default=0, help="記録の終了後に進める月数")
+    parser.add_argument('--save', help="再生後の状態を保存するファイル")
+    options = parser.parse_args(argv)
+
+    journal = ActionJournal.read(options.journal)
+    start = time.perf_counter()
+    simulation = replay(journal)
+    if options.months:
+        simulation.run_months(options.months, stop_on_bankruptcy=False)
+    elapsed = time.perf_counter() - start
+
+    school = simulation.school
+    print(f"{len(journal)}件の操作を再生: {simulation.time_manager.date_string} ({elapsed:.2f}秒)")
+    print(f"資金: {school.money:,}円 / 評判: {school.reputation:.1f} / 生徒数: {school.student_count:,}人")
+    if options.save:
+        simulation.save(options.save)
+
+
+if __name__ == '__main__':
+    main()
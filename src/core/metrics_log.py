@@ -0,0 +1,201 @@
+"""
+メトリクスログ - 月次の指標を固定長レコードでメモリマップファイルに追記する
+
+ファイル形式:
+    ヘッダ（1ページ）: マジック 'SRYM', バージョン(u16), レコード長(u16), レコード数(u64)
+    レコード        : RECORD_DTYPE の固定長レコードの並び
+書き込み側は現在のチャンクだけをマップするので、何年分進めてもメモリ使用量は増えない。
+レコード数はレコードを書いた後に更新するので、別プロセスから実行中に読んでもよい。
+"""
+import mmap
+import os
+import struct
+from typing import Optional
+
+import numpy as np
+
+from src.core.simulation import Simulation
+from src.systems.economy_system import MonthlyReport
+
+MAGIC = b'SRYM'
+LOG_VERSION = 1
+
+RECORD_DTYPE = np.dtype([
+    ('month_index', '<i8'),
+    ('money', '<i8'),
+    ('income', '<i8'),
+    ('expense', '<i8'),
+    ('balance', '<i8'),
+    ('teacher_salary', '<i8'),
+    ('facility_maintenance', '<i8'),
+    ('material_cost', '<i8'),
+    ('fixed_cost', '<i8'),
+    ('tuition_income', '<i8'),
+    ('subsidy_income', '<i8'),
+    ('reputation', '<f8'),
+    ('education', '<f8'),
+    ('satisfaction', '<f8'),
+    ('students', '<i8'),
+    ('teachers', '<i8'),
+])
+
+_HEADER = struct.Struct('<4sHHQ')
+_COUNT_OFFSET = 8
+# レコードの先頭をページ境界にそろえる（チャンク単位でマップするため）
+HEADER_SIZE = mmap.ALLOCATIONGRANULARITY
+
+
+class MetricsLogWriter:
+    """メトリクスログの書き込み（チャンク単位でファイルを伸ばしてマップする）"""
+
+    def __init__(self, path: str, chunk_records: int = 4096):
+        """
+        Args:
+            path: ログファイル（既存のファイルは上書き）
+            chunk_records: 1回に確保・マップするレコード数
+        """
+        # チャンクの境界がページ境界になるように切り上げる
+        per_page = mmap.ALLOCATIONGRANULARITY // RECORD_DTYPE.itemsize
+        self.chunk_records = -(-chunk_records // per_page) * per_page
+        self.path = path
+        self.count = 0
+
+        self._file = open(path, 'w+b')
+        self._file.truncate(HEADER_SIZE)
+        self._file.write(_HEADER.pack(MAGIC, LOG_VERSION, RECORD_DTYPE.itemsize, 0))
+        self._file.flush()
+        self._header = mmap.mmap(self._file.fileno(), HEADER_SIZE)
+        self._count_view = np.frombuffer(self._header, dtype='<u8', count=1, offset=_COUNT_OFFSET)
+
+        self._chunk: Optional[mmap.mmap] = None
+        self._records: Optional[np.ndarray] = None
+        self._chunk_start = 0
+        self._simulation: Optional[Simulation] = None
+
+    def attach(self, simulation: Simulation) -> None:
+        """シミュレーションの月次処理ごとに記録する"""
+        self._simulation = simulation
+        simulation.add_month_end_listener(self.on_month_end)
+
+    def on_month_end(self, simulation: Simulation, report: MonthlyReport) -> None:
+        school = simulation.school
+        self.append(
+            month_index=simulation.time_manager.month_index,
+            money=school.money,
+            income=report.income,
+            expense=report.expense,
+            balance=report.balance,
+            teacher_salary=report.teacher_salary,
+            facility_maintenance=report.facility_maintenance,
+            material_cost=report.material_cost,
+            fixed_cost=report.fixed_cost,
+            tuition_income=report.tuition_income,
+            subsidy_income=report.subsidy_income,
+            reputation=school.reputation,
+            education=school.education_quality,
+            satisfaction=school.satisfaction,
+            students=school.student_count,
+            teachers=len(school.teachers),
+        )
+
+    def append(self, **values) -> None:
+        """1レコード追記（RECORD_DTYPEの全フィールドを指定）"""
+        if self._records is None or self.count - self._chunk_start >= self.chunk_records:
+            self._map_next_chunk()
+
+        record = self._records[self.count - self._chunk_start]
+        for name in RECORD_DTYPE.names:
+            record[name] = values[name]
+
+        # レコードを書いてから件数を更新（読み手は件数までしか読まない）
+        self.count += 1
+        self._count_view[0] = self.count
+
+    def _map_next_chunk(self) -> None:
+        if self._chunk is not None:
+            self._records = None
+            self._chunk.close()
+
+        self._chunk_start = self.count
+        offset = HEADER_SIZE + self._chunk_start * RECORD_DTYPE.itemsize
+        length = self.chunk_records * RECORD_DTYPE.itemsize
+        self._file.truncate(offset + length)
+        self._chunk = mmap.mmap(self._file.fileno(), length, offset=offset)
+        self._records = np.frombuffer(self._chunk, dtype=RECORD_DTYPE)
+
+    def flush(self) -> None:
+        """ディスクへ書き出す"""
+        if self._chunk is not None:
+            self._chunk.flush()
+        self._header.flush()
+
+    def close(self) -> None:
+        """閉じる（ファイルは使った分まで切り詰める）"""
+        if self._simulation is not None:
+            self._simulation.remove_month_end_listener(self.on_month_end)
+            self._simulation = None
+        if self._file.closed:
+            return
+        self.flush()
+        self._records = None
+        self._count_view = None
+        if self._chunk is not None:
+            self._chunk.close()
+        self._header.close()
+        self._file.truncate(HEADER_SIZE + self.count * RECORD_DTYPE.itemsize)
+        self._file.close()
+
+    def __enter__(self) -> 'MetricsLogWriter':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class MetricsLogReader:
+    """メトリクスログの読み込み（書き込み中のファイルも読める）"""
+
+    def __init__(self, path: str):
+        self._file = open(path, 'rb')
+        self._map: Optional[mmap.mmap] = None
+        self._mapped_size = 0
+
+        magic, version, record_size, _ = _HEADER.unpack(self._file.read(_HEADER.size))
+        if magic != MAGIC:
+            raise ValueError("メトリクスログではありません")
+        if version > LOG_VERSION or record_size != RECORD_DTYPE.itemsize:
+            raise ValueError(f"未対応のメトリクスログです: バージョン{version}")
+
+        # 件数はヘッダをマップして読む（ファイルのバッファを介さないので常に最新）
+        self._header = mmap.mmap(self._file.fileno(), HEADER_SIZE, access=mmap.ACCESS_READ)
+
+    def __len__(self) -> int:
+        return struct.unpack_from('<Q', self._header, _COUNT_OFFSET)[0]
+
+    def records(self) -> np.ndarray:
+        """
+        記録済みのレコード（ファイルを直接参照する読み取り専用の配列）
+
+        書き込み側がファイルを伸ばした場合は呼ぶたびにマップし直す。
+        """
+        count = len(self)
+        needed = HEADER_SIZE + count * RECORD_DTYPE.itemsize
+        if needed > self._mapped_size:
+            self._remap()
+        return np.frombuffer(self._map, dtype=RECORD_DTYPE, count=count, offset=HEADER_SIZE)
+
+    def _remap(self) -> None:
+        # 以前の配列が参照しているかもしれないので、古いマップは参照が切れた時点で解放させる
+        self._mapped_size = os.fstat(self._file.fileno()).st_size
+        self._map = mmap.mmap(self._file.fileno(), self._mapped_size, access=mmap.ACCESS_READ)
+
+    def close(self) -> None:
+        self._map = None
+        self._header.close()
+        self._file.close()
+
+    def __enter__(self) -> 'MetricsLogReader':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
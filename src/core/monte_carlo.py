@@ -0,0 +1,214 @@
+"""
+モンテカルロ実行 - シード違いのシミュレーションを並列に多数実行して結果を集計する
+"""
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+
+from src.core.exporter import HistoryExporter
+from src.core.simulation import Simulation
+
+# 方針: 毎月の処理前に呼ばれる関数（プロセス間で渡すためモジュールレベルで定義すること）
+Policy = Callable[[Simulation], None]
+
+
+@dataclass
+class RunResult:
+    """1回のシミュレーション結果"""
+    seed: int
+    months: int                         # 実際に進めた月数
+    money: int
+    reputation: float
+    student_count: int
+    bankruptcy_month: Optional[int] = None   # 破産した月（開始からの経過月数）
+
+    @property
+    def bankrupt(self) -> bool:
+        return self.bankruptcy_month is not None
+
+
+@dataclass
+class Distribution:
+    """数値の分布の要約"""
+    mean: float
+    std: float
+    min: float
+    p5: float
+    p50: float
+    p95: float
+    max: float
+
+    @classmethod
+    def from_values(cls, values: Iterable[float]) -> Optional['Distribution']:
+        data = np.asarray(list(values), dtype=np.float64)
+        if len(data) == 0:
+            return None
+        p5, p50, p95 = np.percentile(data, [5, 50, 95])
+        return cls(
+            mean=float(data.mean()),
+            std=float(data.std()),
+            min=float(data.min()),
+            p5=float(p5),
+            p50=float(p50),
+            p95=float(p95),
+            max=float(data.max()),
+        )
+
+
+@dataclass
+class MonteCarloSummary:
+    """モンテカルロ実行の集計結果"""
+    runs: int
+    money: Optional[Distribution]
+    reputation: Optional[Distribution]
+    student_count: Optional[Distribution]
+    bankruptcy_rate: float
+    bankruptcy_month: Optional[Distribution]
+    bankruptcy_month_histogram: Dict[int, int] = field(default_factory=dict)
+
+
+def run_single(seed: int, months: int, start_config: Optional[dict] = None,
+               policy: Optional[Policy] = None, export_path: Optional[str] = None) -> RunResult:
+    """
+    1つのシードでシミュレーションを実行
+
+    Args:
+        seed: 乱数シード
+        months: 進める月数
+        start_config: Simulation.new_gameへの引数（初期資金など）
+        policy: 毎月の処理前に呼ばれる経営方針（乱数は simulation.rng.stream('policy') を使うこと）
+        export_path: 月次の履歴を書き出すファイル（'{seed}' はシードに置き換える、例: 'runs/{seed}.csv.gz'）
+    """
+    simulation = Simulation.new_game(seed=seed, **(start_config or {}))
+    if export_path is None:
+        return simulate(simulation, seed, months, policy)
+
+    with HistoryExporter.open(export_path.format(seed=seed), constants={'seed': seed}) as exporter:
+        exporter.attach(simulation)
+        return simulate(simulation, seed, months, policy)
+
+
+def simulate(simulation: Simulation, seed: int, months: int, policy: Optional[Policy] = None) -> RunResult:
+    """破産するか指定月数に達するまで進める"""
+    bankruptcy_month = None
+    elapsed = 0
+    while elapsed < months:
+        if policy is not None:
+            policy(simulation)
+        simulation.step_month()
+        elapsed += 1
+        if simulation.is_game_over():
+            bankruptcy_month = elapsed
+            break
+
+    school = simulation.school
+    return RunResult(
+        seed=seed,
+        months=elapsed,
+        money=school.money,
+        reputation=school.reputation,
+        student_count=school.student_count,
+        bankruptcy_month=bankruptcy_month,
+    )
+
+
+def _run_batch(seeds: List[int], months: int, start_config: Optional[dict],
+               policy: Optional[Policy], export_path: Optional[str]) -> List[RunResult]:
+    """ワーカープロセスで複数シードを順番に実行"""
+    return [run_single(seed, months, start_config, policy, export_path) for seed in seeds]
+
+
+def iter_monte_carlo(
+    runs: int,
+    months: int,
+    start_config: Optional[dict] = None,
+    policy: Optional[Policy] = None,
+    base_seed: int = 0,
+    max_workers: Optional[int] = None,
+    batch_size: int = 16,
+    export_path: Optional[str] = None,
+) -> Iterator[RunResult]:
+    """
+    シミュレーションを並列実行し、終わったものから順に結果を返す
+
+    Args:
+        runs: 実行回数（シードは base_seed から連番）
+        months: 1回あたりの月数
+        start_config: Simulation.new_gameへの引数
+        policy: 経営方針（pickle可能な関数）
+        base_seed: 最初のシード
+        max_workers: ワーカープロセス数（Noneなら CPU 数）
+        batch_size: 1タスクでまとめて実行するシード数
+        export_path: シードごとの履歴の書き出し先（run_single参照、ワーカーが直接書き込む）
+    """
+    seeds = list(range(base_seed, base_seed + runs))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(_run_batch, seeds[i:i + batch_size], months, start_config, policy, export_path)
+            for i in range(0, len(seeds), batch_size)
+        ]
+        for future in as_completed(futures):
+            yield from future.result()
+
+
+def summarize(results: Iterable[RunResult]) -> MonteCarloSummary:
+    """
+    結果を集計
+
+    RunResultは保持しないが、パーセンタイルを正確に求めるため数値は全件分保持する
+    （メモリは実行回数に比例し、1回あたり数十バイト）。
+    """
+    money: List[int] = []
+    reputation: List[float] = []
+    students: List[int] = []
+    bankruptcy_months: List[int] = []
+    histogram: Dict[int, int] = {}
+    runs = 0
+
+    for result in results:
+        runs += 1
+        money.append(result.money)
+        reputation.append(result.reputation)
+        students.append(result.student_count)
+        if result.bankrupt:
+            bankruptcy_months.append(result.bankruptcy_month)
+            histogram[result.bankruptcy_month] = histogram.get(result.bankruptcy_month, 0) + 1
+
+    return MonteCarloSummary(
+        runs=runs,
+        money=Distribution.from_values(money),
+        reputation=Distribution.from_values(reputation),
+        student_count=Distribution.from_values(students),
+        bankruptcy_rate=len(bankruptcy_months) / runs if runs else 0.0,
+        bankruptcy_month=Distribution.from_values(bankruptcy_months),
+        bankruptcy_month_histogram=dict(sorted(histogram.items())),
+    )
+
+
+def run_monte_carlo(
+    runs: int,
+    months: int,
+    start_config: Optional[dict] = None,
+    policy: Optional[Policy] = None,
+    base_seed: int = 0,
+    max_workers: Optional[int] = None,
+    on_result: Optional[Callable[[RunResult], None]] = None,
+    export_path: Optional[str] = None,
+) -> MonteCarloSummary:
+    """
+    モンテカルロ実行して集計結果を返す
+
+    Args:
+        on_result: 結果が届くたびに呼ばれるコールバック（進捗表示・逐次保存用）
+        export_path: シードごとの履歴の書き出し先（run_single参照）
+    """
+    def stream() -> Iterator[RunResult]:
+        for result in iter_monte_carlo(runs, months, start_config, policy, base_seed, max_workers,
+                                       export_path=export_path):
+            if on_result is not None:
+                on_result(result)
+            yield result
+
+    return summarize(stream())
@@ -0,0 +1,132 @@
+"""
+もしも試算 - 現在の状態を分岐させ、操作をした場合の数ヶ月先を予測する
+"""
+from concurrent.futures import Executor, Future
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+from src.core.journal import ACTION_BUILD, ACTION_FIRE, JournalEntry, apply_entry
+from src.core.simulation import Simulation
+from src.core.snapshot import SnapshotData, capture, restore
+
+# 試算できる月数の範囲
+MIN_PREVIEW_MONTHS = 12
+MAX_PREVIEW_MONTHS = 60
+
+
+@dataclass
+class Projection:
+    """試算結果（月ごとの推移）"""
+    money: List[int]
+    reputation: List[float]
+    applied: bool                           # 操作が実行できたか（資金不足などで失敗するとFalse）
+    bankruptcy_month: Optional[int] = None  # 破産する月（試算開始からの経過月数）
+
+    @property
+    def final_money(self) -> int:
+        return self.money[-1] if self.money else 0
+
+    @property
+    def final_reputation(self) -> float:
+        return self.reputation[-1] if self.reputation else 0.0
+
+
+def project(simulation: Simulation, months: int,
+            actions: Sequence[JournalEntry] = ()) -> Projection:
+    """
+    分岐した状態で操作を実行し、指定月数だけ進める
+
+    Args:
+        simulation: 元のシミュレーション（変更されない）
+        months: 試算する月数（MIN_PREVIEW_MONTHS〜MAX_PREVIEW_MONTHS、範囲外はValueError）
+        actions: 分岐直後に実行する操作（日付は無視される）
+    """
+    _check_months(months)
+    return _project(simulation.fork(), months, actions)
+
+
+def project_snapshot(data: SnapshotData, months: int,
+                     actions: Sequence[JournalEntry] = ()) -> Projection:
+    """スナップショットから試算（並列実行用、同じdataを複数のワーカーで共有してよい）"""
+    return _project(restore(data, copy_arrays=True), months, actions)
+
+
+def _check_months(months: int) -> None:
+    if not MIN_PREVIEW_MONTHS <= months <= MAX_PREVIEW_MONTHS:
+        raise ValueError(f"試算する月数は{MIN_PREVIEW_MONTHS}〜{MAX_PREVIEW_MONTHS}にしてください: {months}")
+
+
+def _project(fork: Simulation, months: int, actions: Sequence[JournalEntry]) -> Projection:
+    _check_months(months)
+    # 途中で失敗しても残りの操作は実行する
+    applied = all([apply_entry(fork, action) for action in actions])
+
+    money: List[int] = []
+    reputation: List[float] = []
+    bankruptcy_month = None
+    for month in range(1, months + 1):
+        fork.step_month()
+        money.append(fork.school.money)
+        reputation.append(fork.school.reputation)
+        if fork.is_game_over():
+            bankruptcy_month = month
+            break
+
+    return Projection(money, reputation, applied, bankruptcy_month)
+
+
+def compare(
+    simulation: Simulation,
+    options: Dict[str, Sequence[JournalEntry]],
+    months: int = MIN_PREVIEW_MONTHS,
+    executor: Optional[Executor] = None,
+) -> Dict[str, Projection]:
+    """
+    何もしない場合と各選択肢の試算を比較
+
+    並列実行では状態のコピーを1回だけ取り、各ワーカーが生徒の配列を複製して復元する。
+
+    Args:
+        options: 選択肢名 → 実行する操作
+        executor: 並列実行に使うExecutor（ProcessPool・ThreadPoolどちらでもよい、Noneなら順番に実行）
+
+    Returns:
+        'baseline'（何もしない場合）と各選択肢の試算結果
+    """
+    if executor is None:
+        scenarios: Dict[str, Sequence[JournalEntry]] = {'baseline': (), **options}
+        return {name: project(simulation, months, actions) for name, actions in scenarios.items()}
+
+    futures = submit_compare(simulation, options, months, executor)
+    return {name: future.result() for name, future in futures.items()}
+
+
+def submit_compare(
+    simulation: Simulation,
+    options: Dict[str, Sequence[JournalEntry]],
+    months: int,
+    executor: Executor,
+) -> Dict[str, Future]:
+    """
+    compareの試算をExecutorに依頼し、結果を待たずに返す（画面の更新を止めないため）
+
+    Returns:
+        'baseline' と各選択肢の Future（結果は Projection）
+    """
+    _check_months(months)
+    data = capture(simulation)
+    scenarios: Dict[str, Sequence[JournalEntry]] = {'baseline': (), **options}
+    return {
+        name: executor.submit(project_snapshot, data, months, actions)
+        for name, actions in scenarios.items()
+    }
+
+
+def build_action(type_id: str, grid_x: int, grid_y: int) -> JournalEntry:
+    """施設建設の操作を作成"""
+    return JournalEntry(0, ACTION_BUILD, {'type_id': type_id, 'grid_x': grid_x, 'grid_y': grid_y})
+
+
+def fire_action(teacher_id: str) -> JournalEntry:
+    """教師解雇の操作を作成"""
+    return JournalEntry(0, ACTION_FIRE, {'teacher_id': teacher_id})
@@ -0,0 +1,98 @@
+"""
+乱数管理 - 再現可能な乱数ストリーム
+"""
+import zlib
+from typing import Dict, Optional, Sequence, TypeVar
+
+import numpy as np
+
+T = TypeVar('T')
+
+
+class RandomStream:
+    """NumPy Generatorによる乱数ストリーム
+
+    random モジュールと同じ random() / randint() / choice() / getrandbits() を持つ。
+    スカラーの一様乱数はまとめて生成したバッファから取り出す。
+    配列単位の抽選には generator を直接使う。
+    """
+
+    def __init__(self, seed_sequence: Optional[np.random.SeedSequence] = None, buffer_size: int = 1024):
+        self.seed_sequence = seed_sequence or np.random.SeedSequence()
+        self.generator = np.random.Generator(np.random.PCG64(self.seed_sequence))
+        self.buffer_size = buffer_size
+        self._buffer = np.empty(0)
+        self._position = 0
+
+    def random(self) -> float:
+        """[0, 1) の一様乱数"""
+        if self._position >= len(self._buffer):
+            self._buffer = self.generator.random(self.buffer_size)
+            self._position = 0
+        value = self._buffer[self._position]
+        self._position += 1
+        return float(value)
+
+    def randint(self, a: int, b: int) -> int:
+        """a以上b以下の整数"""
+        return a + int(self.random() * (b - a + 1))
+
+    def choice(self, seq: Sequence[T]) -> T:
+        """シーケンスから1つ選ぶ"""
+        return seq[int(self.random() * len(seq))]
+
+    def getrandbits(self, k: int) -> int:
+        """kビットの非負整数（IDの生成用）"""
+        return int(self.generator.integers(0, 1 << k, dtype=np.uint64))
+
+    def spawn(self) -> 'RandomStream':
+        """独立した子ストリームを生成"""
+        return RandomStream(self.seed_sequence.spawn(1)[0], self.buffer_size)
+
+    def get_state(self) -> dict:
+        """現在の状態（保存用）"""
+        return {
+            'bit_generator': self.generator.bit_generator.state,
+            'buffer': self._buffer[self._position:].tolist(),
+        }
+
+    def set_state(self, state: dict) -> None:
+        """get_stateで取得した状態を復元"""
+        self.generator.bit_generator.state = state['bit_generator']
+        self._buffer = np.asarray(state['buffer'], dtype=np.float64)
+        self._position = 0
+
+
+class SimulationRNG:
+    """シミュレーション全体の乱数
+
+    ルートシードからサブシステム名ごとに独立したストリームを作る。
+    ストリームは名前だけで決まるので、作成順に関係なく再現できる。
+    """
+
+    def __init__(self, seed: Optional[int] = None):
+        root = np.random.SeedSequence(seed)
+        self.seed: int = root.entropy
+        self._streams: Dict[str, RandomStream] = {}
+
+    def stream(self, name: str) -> RandomStream:
+        """サブシステム用のストリームを取得（なければ作成）"""
+        if name not in self._streams:
+            key = zlib.crc32(name.encode('utf-8'))
+            self._streams[name] = RandomStream(np.random.SeedSequence(self.seed, spawn_key=(key,)))
+        return self._streams[name]
+
+    def get_state(self) -> dict:
+        """全ストリームの状態（保存用）"""
+        return {
+            'seed': self.seed,
+            'streams': {name: stream.get_state() for name, stream in self._streams.items()},
+        }
+
+    @classmethod
+    def from_state(cls, state: dict) -> 'SimulationRNG':
+        """get_stateで取得した状態から復元"""
+        rng = cls(state['seed'])
+        for name, stream_state in state['streams'].items():
+            rng.stream(name).set_state(stream_state)
+        return rng
@@ -0,0 +1,224 @@
+"""
+実験結果データベース - バッチ実行・モンテカルロの結果をSQLiteに保存して集計する
+
+書き込みは1つのプロセス（集計側）だけが行い、ワーカーは結果を返すだけにする。
+"""
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from src.core.monte_carlo import Policy, RunResult, simulate
+from src.core.simulation import Simulation
+from src.systems.economy_system import MonthlyReport
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY,
+    experiment TEXT NOT NULL,
+    seed INTEGER NOT NULL,
+    months INTEGER NOT NULL,
+    money INTEGER NOT NULL,
+    reputation REAL NOT NULL,
+    student_count INTEGER NOT NULL,
+    bankruptcy_month INTEGER
+);
+CREATE INDEX IF NOT EXISTS runs_seed ON runs (seed);
+CREATE INDEX IF NOT EXISTS runs_experiment ON runs (experiment);
+
+CREATE TABLE IF NOT EXISTS run_parameters (
+    run_id INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    value,
+    PRIMARY KEY (run_id, name)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS run_parameters_value ON run_parameters (name, value);
+
+CREATE TABLE IF NOT EXISTS month_metrics (
+    run_id INTEGER NOT NULL,
+    month INTEGER NOT NULL,
+    money INTEGER NOT NULL,
+    income INTEGER NOT NULL,
+    expense INTEGER NOT NULL,
+    balance INTEGER NOT NULL,
+    reputation REAL NOT NULL,
+    education REAL NOT NULL,
+    satisfaction REAL NOT NULL,
+    students INTEGER NOT NULL,
+    teachers INTEGER NOT NULL,
+    PRIMARY KEY (run_id, month)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS month_metrics_month ON month_metrics (month);
+"""
+
+_METRIC_COLUMNS = ('money', 'income', 'expense', 'balance', 'reputation',
+                   'education', 'satisfaction', 'students', 'teachers')
+
+# month_metrics の1行（run_id を除く）
+MonthRow = Tuple[int, int, int, int, int, float, float, float, int, int]
+
+
+@dataclass
+class RecordedRun:
+    """1回分の実行結果（月次の記録つき）"""
+    result: RunResult
+    parameters: Dict[str, Any]
+    month_rows: List[MonthRow] = field(default_factory=list)
+
+
+@dataclass
+class BankruptcyRate:
+    """パラメータ値ごとの破産率"""
+    value: Any
+    runs: int
+    bankruptcy_rate: float
+    mean_bankruptcy_month: Optional[float]
+
+
+class RunDatabase:
+    """実験結果のSQLiteデータベース"""
+
+    def __init__(self, path: str):
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __enter__(self) -> 'RunDatabase':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    # === 書き込み ===
+    def add_runs(self, runs: Sequence[RecordedRun], experiment: str = "") -> List[int]:
+        """
+        実行結果をまとめて追加（1トランザクション）
+
+        Returns:
+            追加した実行のID
+        """
+        run_ids = []
+        parameter_rows = []
+        metric_rows = []
+        with self.connection:
+            for run in runs:
+                result = run.result
+                cursor = self.connection.execute(
+                    "INSERT INTO runs (experiment, seed, months, money, reputation, student_count, bankruptcy_month)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (experiment, result.seed, result.months, result.money, result.reputation,
+                     result.student_count, result.bankruptcy_month),
+                )
+                run_id = cursor.lastrowid
+                run_ids.append(run_id)
+                parameter_rows.extend((run_id, name, value) for name, value in run.parameters.items())
+                metric_rows.extend((run_id, *row) for row in run.month_rows)
+
+            self.connection.executemany(
+                "INSERT INTO run_parameters (run_id, name, value) VALUES (?, ?, ?)", parameter_rows)
+            self.connection.executemany(
+                "INSERT INTO month_metrics VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", metric_rows)
+        return run_ids
+
+    # === 集計 ===
+    def query(self, sql: str, parameters: Sequence[Any] = ()) -> List[tuple]:
+        """任意のSQLを実行して全行を返す"""
+        return self.connection.execute(sql, parameters).fetchall()
+
+    def bankruptcy_rate_by(self, parameter: str, experiment: Optional[str] = None) -> List[BankruptcyRate]:
+        """
+        パラメータの値ごとの破産率
+
+        例: bankruptcy_rate_by('money') で初期資金ごとの破産率
+        """
+        sql = (
+            "SELECT p.value, COUNT(*), AVG(r.bankruptcy_month IS NOT NULL), AVG(r.bankruptcy_month)"
+            " FROM run_parameters p JOIN runs r ON r.run_id = p.run_id"
+            " WHERE p.name = ?"
+        )
+        arguments: List[Any] = [parameter]
+        if experiment is not None:
+            sql += " AND r.experiment = ?"
+            arguments.append(experiment)
+        sql += " GROUP BY p.value ORDER BY p.value"
+        return [BankruptcyRate(*row) for row in self.query(sql, arguments)]
+
+    def month_series(self, run_id: int, column: str = 'money') -> List[Tuple[int, Any]]:
+        """1回分の実行の月次推移"""
+        if column not in _METRIC_COLUMNS:
+            raise ValueError(f"不明な列です: {column}")
+        return self.query(
+            f"SELECT month, {column} FROM month_metrics WHERE run_id = ? ORDER BY month", (run_id,))
+
+
+# =============================================================================
+# 実行
+# =============================================================================
+def run_recorded(seed: int, months: int, start_config: Optional[dict] = None,
+                 policy: Optional[Policy] = None, record_months: bool = True) -> RecordedRun:
+    """1つのシードで実行し、月次の記録つきで結果を返す"""
+    simulation = Simulation.new_game(seed=seed, **(start_config or {}))
+    rows: List[MonthRow] = []
+
+    def record(simulation: Simulation, report: MonthlyReport) -> None:
+        school = simulation.school
+        rows.append((
+            simulation.time_manager.month_index, school.money, report.income, report.expense,
+            report.balance, school.reputation, school.education_quality, school.satisfaction,
+            school.student_count, len(school.teachers),
+        ))
+
+    if record_months:
+        simulation.add_month_end_listener(record)
+    result = simulate(simulation, seed, months, policy)
+    return RecordedRun(result, dict(start_config or {}), rows)
+
+
+def _run_tasks(tasks: List[Tuple[int, dict]], months: int, policy: Optional[Policy],
+               record_months: bool) -> List[RecordedRun]:
+    """ワーカープロセスで複数の (シード, 初期設定) を順番に実行"""
+    return [run_recorded(seed, months, config, policy, record_months) for seed, config in tasks]
+
+
+def run_experiment(
+    database: RunDatabase,
+    configs: Iterable[dict],
+    seeds: Iterable[int],
+    months: int,
+    experiment: str = "",
+    policy: Optional[Policy] = None,
+    max_workers: Optional[int] = None,
+    batch_size: int = 16,
+    record_months: bool = True,
+) -> int:
+    """
+    初期設定×シードの全組み合わせを並列実行してデータベースに保存
+
+    ワーカーは結果を返すだけで、書き込みはこのプロセスがバッチごとに行う。
+
+    Args:
+        database: 保存先
+        configs: Simulation.new_gameへの引数の候補（例: [{'money': 5_000_000}, {'money': 10_000_000}]）
+        seeds: 各設定で使うシード
+        months: 1回あたりの月数
+        experiment: 実験名（集計時の絞り込み用）
+        record_months: 月次の記録も保存するか
+
+    Returns:
+        保存した実行数
+    """
+    seeds = list(seeds)
+    tasks = [(seed, dict(config)) for config in configs for seed in seeds]
+    saved = 0
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(_run_tasks, tasks[i:i + batch_size], months, policy, record_months)
+            for i in range(0, len(tasks), batch_size)
+        ]
+        for future in as_completed(futures):
+            saved += len(database.add_runs(future.result(), experiment))
+    return saved
@@ -0,0 +1,305 @@
+"""
+シミュレーションコア - pygameに依存しないゲーム進行エンジン
+"""
+from dataclasses import asdict
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+import config
+from src.core.journal import (
+    ACTION_BUILD, ACTION_FIRE, ACTION_HIRE, ACTION_PROMOTE, ACTION_SPEED, ActionJournal,
+)
+from src.core.rng import SimulationRNG
+from src.entities.school import School
+from src.entities.teacher import Teacher
+from src.systems.time_manager import TimeManager
+from src.systems.economy_system import EconomySystem, MonthlyReport
+from src.systems.education_system import EducationSystem
+from src.systems.enrollment_system import EnrollmentReport, EnrollmentSystem
+from src.systems.event_scheduler import EventScheduler
+from src.data.teacher_data import generate_random_teacher
+
+# 同じ日に発生するイベントの実行順
+PRIORITY_MONTHLY = 0
+PRIORITY_PROMOTION_DECAY = 10
+PRIORITY_GRADUATION = 20
+PRIORITY_ENROLLMENT = 30
+
+# 月初の処理（その日の全イベント）が終わった後に呼ばれる関数
+MonthEndListener = Callable[['Simulation', MonthlyReport], None]
+
+
+class Simulation:
+    """学校経営シミュレーション本体（画面なしで実行可能）"""
+
+    def __init__(
+        self,
+        school: School,
+        time_manager: Optional[TimeManager] = None,
+        rng: Optional[SimulationRNG] = None,
+        event_days: Optional[Dict[str, int]] = None,
+    ):
+        self.school = school
+        self.time_manager = time_manager or TimeManager()
+        self.school.ledger.clock = lambda: self.time_manager.absolute_day
+
+        # 乱数（サブシステムごとに独立したストリームを使う）
+        self.rng = rng or SimulationRNG()
+
+        # システム
+        self.economy_system = EconomySystem(self.school)
+        self.education_system = EducationSystem(self.school)
+        self.enrollment_system = EnrollmentSystem(self.school, rng=self.rng.stream('enrollment'))
+
+        # 直近の月次レポート
+        self.current_report: Optional[MonthlyReport] = None
+        self._new_reports: List[MonthlyReport] = []
+
+        # 今月の入退学（月初の処理と同じ日の卒業・入学を含む）
+        self.current_enrollment = EnrollmentReport()
+
+        # イベントスケジューラ（月次・年次処理や一時的なイベント）
+        self.scheduler = EventScheduler()
+        self._register_events(event_days or {})
+
+        # 操作ジャーナル（設定されていればプレイヤー操作を記録）
+        self.journal: Optional[ActionJournal] = None
+
+        # 月次処理の完了通知先
+        self._month_end_listeners: List[MonthEndListener] = []
+
+    @classmethod
+    def new_game(
+        cls,
+        initial_teachers: int = config.INITIAL_TEACHERS,
+        initial_students: int = config.INITIAL_STUDENTS,
+        seed: Optional[int] = None,
+        **school_fields,
+    ) -> 'Simulation':
+        """
+        初期状態の学校でシミュレーションを作成
+
+        Args:
+            initial_teachers: 初期教師数
+            initial_students: 初期生徒数
+            seed: 乱数のルートシード（Noneなら毎回異なる）
+            **school_fields: Schoolの初期値（money, reputation など）
+        """
+        rng = SimulationRNG(seed)
+        setup = rng.stream('setup')
+        school = School(**school_fields)
+
+        # 初期教師配置
+        for _ in range(initial_teachers):
+            school.hire_teacher(generate_random_teacher(setup))
+
+        # 初期生徒配置（学年バランスを考慮）
+        grades = setup.generator.integers(1, 7, size=initial_students)
+        for grade, count in enumerate(np.bincount(grades, minlength=7)):
+            school.students.add_many(int(count), grade, setup.generator)
+        school.update_population_mode()
+        school.invalidate_cache()
+
+        return cls(school, rng=rng)
+
+    # === 月次処理の通知 ===
+    def add_month_end_listener(self, listener: MonthEndListener) -> None:
+        """月次処理（同じ日の年次処理を含む）の完了時に呼ぶ関数を登録"""
+        self._month_end_listeners.append(listener)
+
+    def remove_month_end_listener(self, listener: MonthEndListener) -> None:
+        """登録した関数を解除"""
+        self._month_end_listeners.remove(listener)
+
+    # === イベント登録 ===
+    def _register_events(self, event_days: Dict[str, int]) -> None:
+        """
+        月次・年次処理をスケジューラに登録
+
+        Args:
+            event_days: イベント名ごとの次回発生日（セーブデータからの復元用）
+        """
+        days_per_month = config.DAYS_PER_MONTH
+        days_per_year = days_per_month * config.MONTHS_PER_YEAR
+
+        recurring = [
+            ('monthly', self._on_month_start, PRIORITY_MONTHLY, days_per_month, None),
+            ('promotion_decay', self._on_promotion_decay, PRIORITY_PROMOTION_DECAY, days_per_month, None),
+            ('graduation', self._on_graduation, PRIORITY_GRADUATION, days_per_year, 3),
+            ('enrollment', self._on_enrollment, PRIORITY_ENROLLMENT, days_per_year, 4),
+        ]
+        for name, callback, priority, interval, month in recurring:
+            day = event_days.get(name, self._next_month_start(month))
+            self.scheduler.schedule(day, callback, name=name, priority=priority, interval=interval)
+
+    def recurring_event_days(self) -> Dict[str, int]:
+        """繰り返しイベントの次回発生日（セーブ用）"""
+        return {event.name: event.day for event in self.scheduler.events() if event.interval is not None}
+
+    def _next_month_start(self, month: Optional[int] = None) -> int:
+        """次に来る月初（monthを指定するとその月の1日）の通算日数"""
+        month_index = self.time_manager.month_index + 1
+        if month is not None:
+            month_index += (month - 1 - month_index) % config.MONTHS_PER_YEAR
+        return month_index * config.DAYS_PER_MONTH
+
+    def _on_month_start(self, day: int) -> None:
+        self.current_enrollment = EnrollmentReport()
+        self._new_reports.append(self.process_monthly())
+
+    def _on_promotion_decay(self, day: int) -> None:
+        self.enrollment_system.decay_promotion_effect()
+
+    def _on_graduation(self, day: int) -> None:
+        graduates, advanced = self.enrollment_system.process_yearly_graduation()
+        self.current_enrollment.graduates += graduates
+        self.current_enrollment.advanced += advanced
+
+    def _on_enrollment(self, day: int) -> None:
+        self.current_enrollment.new_students += self.enrollment_system.process_yearly_enrollment()
+
+    # === プレイヤー操作 ===
+    def hire_teacher(self, teacher: Teacher, record: bool = True) -> bool:
+        """教師を雇用"""
+        if not self.school.hire_teacher(teacher):
+            return False
+        self._record(record, ACTION_HIRE, teacher=asdict(teacher))
+        return True
+
+    def fire_teacher(self, teacher_id: str, record: bool = True) -> bool:
+        """教師をIDで解雇"""
+        teacher = self.school.teachers.get(teacher_id)
+        if teacher is None or not self.school.fire_teacher(teacher):
+            return False
+        self._record(record, ACTION_FIRE, teacher_id=teacher_id)
+        return True
+
+    def run_promotion(self, promotion_type: str, record: bool = True) -> bool:
+        """宣伝を実行"""
+        if not self.enrollment_system.run_promotion(promotion_type):
+            return False
+        self._record(record, ACTION_PROMOTE, promotion_type=promotion_type)
+        return True
+
+    def build_facility(self, type_id: str, grid_x: int, grid_y: int, record: bool = True) -> bool:
+        """施設を建設"""
+        if not self.school.add_facility(type_id, grid_x, grid_y):
+            return False
+        self._record(record, ACTION_BUILD, type_id=type_id, grid_x=grid_x, grid_y=grid_y)
+        return True
+
+    def set_speed(self, speed: float, record: bool = True) -> None:
+        """ゲーム速度を変更"""
+        self.time_manager.set_speed(speed)
+        self._record(record, ACTION_SPEED, speed=speed)
+
+    def _record(self, record: bool, action: str, **args: Any) -> None:
+        if record and self.journal is not None:
+            self.journal.record(self.time_manager.absolute_day, action, **args)
+
+    # === 月次処理 ===
+    def process_monthly(self) -> MonthlyReport:
+        """月次処理（評判・教師・退学・経済）"""
+        # 評判更新
+        self.education_system.update_reputation()
+
+        # 教師月次更新
+        self.education_system.update_teachers_monthly()
+
+        # 退学処理
+        satisfaction = self.school.satisfaction
+        self.current_enrollment.dropouts += self.enrollment_system.process_monthly_dropouts(satisfaction)
+
+        # 経済処理
+        self.current_report = self.economy_system.process_monthly(self.time_manager.month_index)
+
+        return self.current_report
+
+    # === 時間の進行 ===
+    def advance_to_day(self, target_day: int, stop_on_bankruptcy: bool = True) -> List[MonthlyReport]:
+        """
+        指定した通算日まで、イベントからイベントへ直接進める
+
+        Args:
+            target_day: 到達する通算日数
+            stop_on_bankruptcy: 破産した時点で停止するか（時刻はその日で止まる）
+
+        Returns:
+            この間に作成された月次レポート
+        """
+        self._new_reports = []
+        while True:
+            next_day = self.scheduler.next_day()
+            if next_day is None or next_day > target_day:
+                break
+            self.time_manager.advance_days(next_day - self.time_manager.absolute_day)
+            report_count = len(self._new_reports)
+            self.scheduler.run_day(next_day)
+            if len(self._new_reports) > report_count:
+                for listener in list(self._month_end_listeners):
+                    listener(self, self._new_reports[-1])
+            if stop_on_bankruptcy and self.is_game_over():
+                return self._new_reports
+
+        self.time_manager.advance_days(target_day - self.time_manager.absolute_day)
+        return self._new_reports
+
+    def update(self, dt: float) -> List[MonthlyReport]:
+        """フレームの経過時間（秒）だけ進める"""
+        return self.advance_to_day(self.time_manager.absolute_day + self.time_manager.consume(dt))
+
+    def advance_days(self, days: int, stop_on_bankruptcy: bool = True) -> List[MonthlyReport]:
+        """指定日数だけ進める"""
+        return self.advance_to_day(self.time_manager.absolute_day + days, stop_on_bankruptcy)
+
+    def advance_to(self, year: int, month: int, stop_on_bankruptcy: bool = True) -> List[MonthlyReport]:
+        """指定した年月の1日まで進める"""
+        month_index = year * config.MONTHS_PER_YEAR + (month - 1)
+        return self.advance_to_day(month_index * config.DAYS_PER_MONTH, stop_on_bankruptcy)
+
+    def step_month(self) -> Optional[MonthlyReport]:
+        """次の月の1日まで進めて月次・年次処理を実行"""
+        reports = self.advance_to_day(self._next_month_start())
+        return reports[-1] if reports else None
+
+    def run_months(self, months: int, stop_on_bankruptcy: bool = True) -> List[MonthlyReport]:
+        """
+        指定した月数だけシミュレーションを進める
+
+        Args:
+            months: 進める月数
+            stop_on_bankruptcy: 破産した時点で停止するか
+
+        Returns:
+            各月の月次レポート
+        """
+        target_month = self.time_manager.month_index + months
+        return self.advance_to_day(target_month * config.DAYS_PER_MONTH, stop_on_bankruptcy)
+
+    # === 分岐 ===
+    def fork(self) -> 'Simulation':
+        """
+        現在の状態から独立したシミュレーションを作成（もしもの試算用）
+
+        生徒は配列のコピーのみで複製する。乱数の状態も引き継ぐので、
+        操作をしなければ元と同じ結果になる。ジャーナルは引き継がない。
+        """
+        from src.core.snapshot import capture, restore
+        return restore(capture(self))
+
+    # === セーブ・ロード ===
+    def save(self, path: str, compress: bool = True) -> None:
+        """ゲーム状態をバイナリファイルに保存"""
+        from src.core.snapshot import save
+        save(self, path, compress)
+
+    @classmethod
+    def load(cls, path: str) -> 'Simulation':
+        """保存したファイルからシミュレーションを復元"""
+        from src.core.snapshot import load
+        return load(path)
+
+    def is_game_over(self) -> bool:
+        """ゲームオーバー判定"""
+        return self.school.is_bankrupt()
@@ -0,0 +1,511 @@
+"""
+セーブデータ - ゲーム状態全体のバイナリスナップショット
+
+形式（リトルエンディアン）:
+    ヘッダ  : マジック 'SRYS', バージョン(u16), フラグ(u16)
+    本体    : セクションの並び（フラグ FLAG_ZLIB が立っていれば本体全体をzlib圧縮）
+    セクション: タグ(4バイト), 長さ(u64), データ
+生徒・月次レポート・仕訳は固定長レコード（生徒は列ごとの配列）、教師・施設・イベントは
+長さ付きの文字列と固定長の数値で格納する。
+未知のタグは長さ分読み飛ばすので、セクションの追加は互換性を壊さない。
+"""
+import os
+import struct
+import zlib
+from dataclasses import astuple, dataclass, fields
+from typing import BinaryIO, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.core.rng import SimulationRNG
+from src.core.simulation import Simulation
+from src.entities.cohort_population import CohortPopulation
+from src.entities.facility import Facility
+from src.entities.school import School
+from src.entities.student_roster import ROSTER_COLUMNS, StudentRoster
+from src.entities.teacher import Teacher
+from src.systems.economy_system import MonthlyReport
+from src.systems.kpi_store import KPIStore
+from src.systems.ledger import ENTRY_DTYPE, Ledger
+from src.systems.time_manager import TimeManager
+
+MAGIC = b'SRYS'
+SNAPSHOT_VERSION = 1
+FLAG_ZLIB = 0x1
+
+_HEADER = struct.Struct('<4sHH')
+_SECTION = struct.Struct('<4sQ')
+
+# money, reputation, capacity, promotion_effect, cohort_threshold(-1でなし)
+_SCHOOL = struct.Struct('<qdqdq')
+# year, month, day, game_speed, day_accumulator, paused
+_TIME = struct.Struct('<iiiddB')
+# 文字列は長さ付きで格納し、その後に数値を並べる
+# skill, salary, experience, morale（前に id, name, subject）
+_TEACHER = struct.Struct('<iiid')
+# grid_x, grid_y（前に type_id）
+_FACILITY = struct.Struct('<ii')
+_REPORT_FIELDS = tuple(f.name for f in fields(MonthlyReport))
+_REPORT = struct.Struct('<' + 'q' * len(_REPORT_FIELDS))
+# PCG64 state, inc, has_uint32, uinteger, バッファ長
+_RNG_STREAM = struct.Struct('<16s16sBII')
+# 次回発生日（前に名前）
+_EVENT = struct.Struct('<q')
+
+_COUNT = struct.Struct('<I')
+_ROSTER_HEADER = struct.Struct('<Qq')
+_COHORT_HEADER = struct.Struct('<II')
+
+_READ_CHUNK = 1 << 16
+
+
+@dataclass
+class SnapshotData:
+    """保存対象の状態のコピー（シミュレーション本体とは独立）"""
+    school_name: str
+    school_values: Tuple
+    time_values: Tuple
+    roster_columns: Optional[Dict[str, np.ndarray]]
+    roster_next_id: int
+    cohort_counts: Optional[np.ndarray]
+    teachers: List[Tuple]
+    facilities: List[Tuple]
+    reports: List[Tuple]
+    rng_state: dict
+    event_days: Dict[str, int]
+    ledger_entries: np.ndarray
+    kpi_state: Optional[dict] = None
+
+
+def capture(simulation: Simulation) -> SnapshotData:
+    """シミュレーションの状態をコピーして取得（配列はメモリコピーのみ）"""
+    school = simulation.school
+    time_manager = simulation.time_manager
+
+    roster_columns = None
+    roster_next_id = 0
+    cohort_counts = None
+    if school.is_cohort_mode:
+        cohort_counts = school.students.counts.copy()
+    else:
+        roster_columns = {name: column.copy() for name, column in school.students.columns().items()}
+        roster_next_id = school.students.next_id
+
+    return SnapshotData(
+        school_name=school.name,
+        school_values=(
+            school.money, school.reputation, school.capacity, school.promotion_effect,
+            -1 if school.cohort_threshold is None else school.cohort_threshold,
+        ),
+        time_values=(
+            time_manager.year, time_manager.month, time_manager.day,
+            time_manager.game_speed, time_manager._day_accumulator, time_manager.paused,
+        ),
+        roster_columns=roster_columns,
+        roster_next_id=roster_next_id,
+        cohort_counts=cohort_counts,
+        teachers=[
+            (t.id, t.name, t.subject, t.skill, t.salary, t.experience, t.morale)
+            for t in school.teachers
+        ],
+        facilities=[(f.type_id, f.grid_x, f.grid_y) for f in school.facilities],
+        reports=[astuple(simulation.current_report)] if simulation.current_report else [],
+        rng_state=simulation.rng.get_state(),
+        event_days=simulation.recurring_event_days(),
+        kpi_state=simulation.economy_system.history.get_state(),
+        # 仕訳は追記のみで書き換えないので、コピーせずに記帳済みの範囲を参照する
+        ledger_entries=school.ledger.entries,
+    )
+
+
+# =============================================================================
+# 書き込み
+# =============================================================================
+def write_snapshot(data: SnapshotData, stream: BinaryIO, compress: bool = True) -> None:
+    """スナップショットをストリームに書き込む"""
+    stream.write(_HEADER.pack(MAGIC, SNAPSHOT_VERSION, FLAG_ZLIB if compress else 0))
+
+    compressor = zlib.compressobj(level=1) if compress else None
+
+    def emit(chunk: bytes) -> None:
+        stream.write(compressor.compress(chunk) if compressor else chunk)
+
+    def section(tag: bytes, *payload: bytes) -> None:
+        emit(_SECTION.pack(tag, sum(len(part) for part in payload)))
+        for part in payload:
+            emit(part)
+
+    section(b'SCHL', _SCHOOL.pack(*data.school_values), data.school_name.encode('utf-8'))
+    section(b'TIME', _TIME.pack(*data.time_values))
+
+    if data.roster_columns is not None:
+        count = len(data.roster_columns['ids'])
+        columns = [memoryview(data.roster_columns[name]).cast('B') for name, _ in ROSTER_COLUMNS]
+        section(b'STUD', _ROSTER_HEADER.pack(count, data.roster_next_id), *columns)
+    else:
+        grades, buckets = data.cohort_counts.shape
+        section(b'COHO', _COHORT_HEADER.pack(grades, buckets),
+                np.ascontiguousarray(data.cohort_counts, dtype='<i8').tobytes())
+
+    section(b'TEAC', _COUNT.pack(len(data.teachers)), *(
+        part
+        for tid, name, subject, skill, salary, experience, morale in data.teachers
+        for part in (*_pack_text(tid), *_pack_text(name), *_pack_text(subject),
+                     _TEACHER.pack(skill, salary, experience, morale))
+    ))
+    section(b'FACI', _COUNT.pack(len(data.facilities)), *(
+        part
+        for type_id, grid_x, grid_y in data.facilities
+        for part in (*_pack_text(type_id), _FACILITY.pack(grid_x, grid_y))
+    ))
+    section(b'REPT', _COUNT.pack(len(data.reports)), b''.join(
+        _REPORT.pack(*report) for report in data.reports
+    ))
+    section(b'RNG ', *_pack_rng(data.rng_state))
+    section(b'EVNT', _COUNT.pack(len(data.event_days)), *(
+        part
+        for name, day in data.event_days.items()
+        for part in (*_pack_text(name), _EVENT.pack(day))
+    ))
+    if data.kpi_state is not None:
+        section(b'KPIS', *_pack_kpis(data.kpi_state))
+    section(b'LEDG', _COUNT.pack(len(data.ledger_entries)), data.ledger_entries.tobytes())
+    section(b'END ')
+
+    if compressor:
+        stream.write(compressor.flush())
+
+
+def _pack_rng(state: dict) -> List[bytes]:
+    seed = state['seed']
+    seed_bytes = seed.to_bytes((seed.bit_length() + 7) // 8 or 1, 'little')
+    parts = [_COUNT.pack(len(seed_bytes)), seed_bytes, _COUNT.pack(len(state['streams']))]
+    for name, stream_state in state['streams'].items():
+        generator_state = stream_state['bit_generator']
+        buffer = np.asarray(stream_state['buffer'], dtype='<f8')
+        name_bytes = name.encode('utf-8')
+        parts.append(_COUNT.pack(len(name_bytes)))
+        parts.append(name_bytes)
+        parts.append(_RNG_STREAM.pack(
+            generator_state['state']['state'].to_bytes(16, 'little'),
+            generator_state['state']['inc'].to_bytes(16, 'little'),
+            generator_state['has_uint32'],
+            generator_state['uinteger'],
+            len(buffer),
+        ))
+        parts.append(buffer.tobytes())
+    return parts
+
+
+def _pack_text(text: str) -> List[bytes]:
+    encoded = text.encode('utf-8')
+    return [_COUNT.pack(len(encoded)), encoded]
+
+
+def _pack_kpis(state: dict) -> List[bytes]:
+    parts = _pack_text(','.join(state['metrics']))
+    parts.append(struct.pack('<qI', state['recorded'], len(state['tiers'])))
+    for name, tier in state['tiers'].items():
+        parts += _pack_text(name)
+        parts.append(_COUNT.pack(len(tier['months'])))
+        parts.append(np.ascontiguousarray(tier['months'], dtype='<i4').tobytes())
+        parts.append(np.ascontiguousarray(tier['values'], dtype='<f8').tobytes())
+    parts.append(_COUNT.pack(len(state['pending'])))
+    for name, pending in state['pending'].items():
+        parts += _pack_text(name)
+        parts.append(struct.pack('<qI', pending['bucket'], pending['count']))
+        parts.append(np.asarray(pending['sum'], dtype='<f8').tobytes())
+        parts.append(np.asarray(pending['last'], dtype='<f8').tobytes())
+    return parts
+
+
+def dumps(simulation: Simulation, compress: bool = True) -> bytes:
+    """スナップショットをバイト列として取得"""
+    import io
+    buffer = io.BytesIO()
+    write_snapshot(capture(simulation), buffer, compress)
+    return buffer.getvalue()
+
+
+def save(simulation: Simulation, path: str, compress: bool = True) -> None:
+    """ファイルに保存（一時ファイルに書いてから置き換える）"""
+    write_snapshot_file(capture(simulation), path, compress)
+
+
+def write_snapshot_file(data: SnapshotData, path: str, compress: bool = True) -> None:
+    """スナップショットを一時ファイル経由で原子的に書き込む"""
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'wb') as file:
+        write_snapshot(data, file, compress)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temp_path, path)
+
+
+# =============================================================================
+# 読み込み（ストリーミング）
+# =============================================================================
+class _ZlibReader:
+    """zlib圧縮されたストリームを少しずつ展開して読むリーダー"""
+
+    def __init__(self, raw: BinaryIO):
+        self._raw = raw
+        self._decompressor = zlib.decompressobj()
+        self._pending = b''
+
+    def readinto(self, buffer) -> int:
+        view = memoryview(buffer).cast('B')
+        filled = 0
+        while filled < len(view):
+            if not self._pending:
+                chunk = self._raw.read(_READ_CHUNK)
+                if not chunk:
+                    self._pending = self._decompressor.flush()
+                    if not self._pending:
+                        break
+                else:
+                    self._pending = self._decompressor.decompress(chunk)
+                    continue
+            taken = min(len(self._pending), len(view) - filled)
+            view[filled:filled + taken] = self._pending[:taken]
+            self._pending = self._pending[taken:]
+            filled += taken
+        return filled
+
+
+def _read_exact(stream, size: int) -> bytearray:
+    buffer = bytearray(size)
+    if stream.readinto(buffer) != size:
+        raise ValueError("セーブデータが途中で終わっています")
+    return buffer
+
+
+def read_snapshot(stream: BinaryIO) -> Simulation:
+    """ストリームからスナップショットを読み込み、シミュレーションを復元"""
+    return restore(read_snapshot_data(stream))
+
+
+def read_snapshot_data(stream: BinaryIO) -> SnapshotData:
+    """ストリームからスナップショットを読み込む（シミュレーションはまだ作らない）"""
+    magic, version, flags = _HEADER.unpack(_read_exact(stream, _HEADER.size))
+    if magic != MAGIC:
+        raise ValueError("セーブデータではありません")
+    if version > SNAPSHOT_VERSION:
+        raise ValueError(f"未対応のセーブデータのバージョンです: {version}")
+
+    body = _ZlibReader(stream) if flags & FLAG_ZLIB else stream
+    data = SnapshotData(
+        school_name="", school_values=(), time_values=(),
+        roster_columns=None, roster_next_id=0, cohort_counts=None,
+        teachers=[], facilities=[], reports=[], rng_state={}, event_days={},
+        ledger_entries=np.zeros(0, dtype=ENTRY_DTYPE),
+    )
+
+    while True:
+        tag, length = _SECTION.unpack(_read_exact(body, _SECTION.size))
+        if tag == b'END ':
+            break
+
+        if tag == b'STUD':
+            # 生徒の列はバッファに直接読み込み、そのまま配列として使う
+            count, data.roster_next_id = _ROSTER_HEADER.unpack(_read_exact(body, _ROSTER_HEADER.size))
+            data.roster_columns = {}
+            for name, dtype in ROSTER_COLUMNS:
+                dtype = np.dtype(dtype).newbyteorder('<')
+                data.roster_columns[name] = np.frombuffer(
+                    _read_exact(body, count * dtype.itemsize), dtype=dtype)
+            continue
+
+        payload = _read_exact(body, length)
+        if tag == b'SCHL':
+            data.school_values = _SCHOOL.unpack_from(payload)
+            data.school_name = payload[_SCHOOL.size:].decode('utf-8')
+        elif tag == b'TIME':
+            data.time_values = _TIME.unpack(payload)
+        elif tag == b'COHO':
+            grades, buckets = _COHORT_HEADER.unpack_from(payload)
+            counts = np.frombuffer(payload, dtype='<i8', offset=_COHORT_HEADER.size)
+            data.cohort_counts = counts.reshape(grades, buckets)
+        elif tag == b'TEAC':
+            data.teachers = _unpack_teachers(payload)
+        elif tag == b'FACI':
+            data.facilities = _unpack_facilities(payload)
+        elif tag == b'REPT':
+            data.reports = list(struct.iter_unpack(_REPORT.format, payload[_COUNT.size:]))
+        elif tag == b'RNG ':
+            data.rng_state = _unpack_rng(payload)
+        elif tag == b'EVNT':
+            data.event_days = _unpack_events(payload)
+        elif tag == b'KPIS':
+            data.kpi_state = _unpack_kpis(payload)
+        elif tag == b'LEDG':
+            (count,) = _COUNT.unpack_from(payload)
+            data.ledger_entries = np.frombuffer(payload, dtype=ENTRY_DTYPE, count=count, offset=_COUNT.size)
+        # 未知のセクションは読み飛ばす
+
+    return data
+
+
+def restore(data: SnapshotData, copy_arrays: bool = False) -> Simulation:
+    """
+    スナップショットからシミュレーションを組み立てる
+
+    生徒の配列は通常コピーせずにそのまま使うので、同じデータから2回復元する場合は
+    copy_arrays=True にすること。
+    """
+    money, reputation, capacity, promotion, threshold = data.school_values
+    school = School(
+        name=data.school_name,
+        money=money,
+        reputation=reputation,
+        capacity=capacity,
+        promotion_effect=promotion,
+        cohort_threshold=None if threshold < 0 else threshold,
+        teachers=[
+            Teacher(name=name, skill=skill, salary=salary, subject=subject,
+                    id=tid, experience=experience, morale=morale)
+            for tid, name, subject, skill, salary, experience, morale in data.teachers
+        ],
+        facilities=[Facility(type_id, grid_x, grid_y) for type_id, grid_x, grid_y in data.facilities],
+    )
+    if data.roster_columns is not None:
+        columns = data.roster_columns
+        if copy_arrays:
+            columns = {name: column.copy() for name, column in columns.items()}
+        school.students = StudentRoster.from_columns(columns, data.roster_next_id)
+    elif data.cohort_counts is not None:
+        school.students = CohortPopulation.from_counts(data.cohort_counts)
+    school.ledger = Ledger.from_entries(data.ledger_entries)
+
+    year, month, day, speed, accumulator, paused = data.time_values
+    time_manager = TimeManager(year=year, month=month, day=day, game_speed=speed, paused=bool(paused))
+    time_manager._day_accumulator = accumulator
+
+    simulation = Simulation(school, time_manager, rng=SimulationRNG.from_state(data.rng_state),
+                            event_days=data.event_days)
+    if data.kpi_state is not None:
+        simulation.economy_system.history = KPIStore.from_state(data.kpi_state)
+    simulation.current_report = MonthlyReport(*data.reports[-1]) if data.reports else None
+    return simulation
+
+
+def _unpack_teachers(payload: bytes) -> List[Tuple]:
+    reader = _PayloadReader(payload)
+    (count,) = reader.unpack(_COUNT.format)
+    return [
+        (reader.text(), reader.text(), reader.text(), *reader.unpack(_TEACHER.format))
+        for _ in range(count)
+    ]
+
+
+def _unpack_facilities(payload: bytes) -> List[Tuple]:
+    reader = _PayloadReader(payload)
+    (count,) = reader.unpack(_COUNT.format)
+    return [(reader.text(), *reader.unpack(_FACILITY.format)) for _ in range(count)]
+
+
+def _unpack_events(payload: bytes) -> Dict[str, int]:
+    reader = _PayloadReader(payload)
+    (count,) = reader.unpack(_COUNT.format)
+    events = {}
+    for _ in range(count):
+        name = reader.text()
+        (events[name],) = reader.unpack(_EVENT.format)
+    return events
+
+
+def _unpack_rng(payload: bytes) -> dict:
+    offset = 0
+
+    def take_count() -> int:
+        nonlocal offset
+        (value,) = _COUNT.unpack_from(payload, offset)
+        offset += _COUNT.size
+        return value
+
+    seed_length = take_count()
+    seed = int.from_bytes(payload[offset:offset + seed_length], 'little')
+    offset += seed_length
+
+    streams = {}
+    for _ in range(take_count()):
+        name_length = take_count()
+        name = payload[offset:offset + name_length].decode('utf-8')
+        offset += name_length
+        state, inc, has_uint32, uinteger, buffer_length = _RNG_STREAM.unpack_from(payload, offset)
+        offset += _RNG_STREAM.size
+        buffer = np.frombuffer(payload, dtype='<f8', count=buffer_length, offset=offset)
+        offset += buffer_length * 8
+        streams[name] = {
+            'bit_generator': {
+                'bit_generator': 'PCG64',
+                'state': {
+                    'state': int.from_bytes(state, 'little'),
+                    'inc': int.from_bytes(inc, 'little'),
+                },
+                'has_uint32': has_uint32,
+                'uinteger': uinteger,
+            },
+            'buffer': buffer,
+        }
+    return {'seed': seed, 'streams': streams}
+
+
+class _PayloadReader:
+    """セクションのデータを先頭から順に読む"""
+
+    def __init__(self, payload: bytes):
+        self.payload = payload
+        self.offset = 0
+
+    def unpack(self, fmt: str) -> tuple:
+        values = struct.unpack_from(fmt, self.payload, self.offset)
+        self.offset += struct.calcsize(fmt)
+        return values
+
+    def text(self) -> str:
+        (length,) = self.unpack('<I')
+        value = bytes(self.payload[self.offset:self.offset + length]).decode('utf-8')
+        self.offset += length
+        return value
+
+    def array(self, dtype: str, count: int) -> np.ndarray:
+        values = np.frombuffer(self.payload, dtype=dtype, count=count, offset=self.offset)
+        self.offset += values.nbytes
+        return values
+
+
+def _unpack_kpis(payload: bytes) -> dict:
+    reader = _PayloadReader(payload)
+    metrics = tuple(reader.text().split(','))
+    recorded, tier_count = reader.unpack('<qI')
+    tiers = {}
+    for _ in range(tier_count):
+        name = reader.text()
+        (count,) = reader.unpack('<I')
+        months = reader.array('<i4', count)
+        values = reader.array('<f8', count * len(metrics)).reshape(count, len(metrics))
+        tiers[name] = {'months': months, 'values': values}
+    pending = {}
+    for _ in range(reader.unpack('<I')[0]):
+        name = reader.text()
+        bucket, count = reader.unpack('<qI')
+        pending[name] = {
+            'bucket': bucket,
+            'count': count,
+            'sum': reader.array('<f8', len(metrics)),
+            'last': reader.array('<f8', len(metrics)),
+        }
+    return {'metrics': metrics, 'recorded': recorded, 'tiers': tiers, 'pending': pending}
+
+
+def loads(data: bytes) -> Simulation:
+    """バイト列からシミュレーションを復元"""
+    import io
+    return read_snapshot(io.BytesIO(data))
+
+
+def load(path: str) -> Simulation:
+    """ファイルからシミュレーションを復元"""
+    with open(path, 'rb') as file:
+        return read_snapshot(file)
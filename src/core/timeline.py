@@ -0,0 +1,220 @@
+"""
+タイムライン - 過去の月へ巻き戻すための履歴
+
+一定間隔の完全なスナップショット（キーフレーム）と、毎月の小さな差分を記録する。
+過去の月の数値は差分から求め、状態の復元は直前のキーフレームから
+操作ジャーナルを適用しつつ再計算する（乱数も保存されているので同じ結果になる）。
+キーフレームが上限を超えたら古いものから間引くので、長期間でもメモリは一定に収まる。
+"""
+import io
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+import config
+from src.core.journal import apply_entry
+from src.core.simulation import Simulation
+from src.core.snapshot import capture, read_snapshot, write_snapshot
+from src.systems.economy_system import MonthlyReport
+from src.systems.time_manager import TimeManager
+
+GRADES = 6
+
+# 毎月の差分（前月との差分で記録する値と、そのまま記録する値）
+DELTA_DTYPE = np.dtype([
+    ('month_index', np.int32),
+    ('money_delta', np.int64),
+    ('reputation', np.float64),
+    ('promotion_effect', np.float64),
+    ('grade_delta', np.int32, (GRADES,)),
+])
+
+
+@dataclass
+class Keyframe:
+    """完全なスナップショット"""
+    month_index: int
+    day: int                    # 取得した通算日
+    data: bytes                 # 圧縮したスナップショット
+    journal_length: int         # 取得時点のジャーナルの操作数
+    money: int
+    reputation: float
+    promotion_effect: float
+    grade_counts: Tuple[int, ...]
+
+
+@dataclass
+class MonthSummary:
+    """過去の月の主要な数値"""
+    year: int
+    month: int
+    money: int
+    reputation: float
+    promotion_effect: float
+    grade_counts: List[int]
+    hired: Tuple[str, ...] = ()     # その月に雇用された教師ID
+    fired: Tuple[str, ...] = ()     # その月に解雇された教師ID
+
+    @property
+    def student_count(self) -> int:
+        return sum(self.grade_counts)
+
+
+class Timeline:
+    """月ごとの履歴を記録し、過去の月を復元する"""
+
+    def __init__(
+        self,
+        simulation: Simulation,
+        keyframe_interval: int = config.TIMELINE_KEYFRAME_INTERVAL,
+        max_keyframes: int = config.TIMELINE_MAX_KEYFRAMES,
+        recent_keyframes: int = config.TIMELINE_RECENT_KEYFRAMES,
+    ):
+        """
+        Args:
+            simulation: 記録するシミュレーション（操作の再現に使うのでジャーナルを設定しておくこと）
+        """
+        if simulation.journal is None:
+            raise ValueError("タイムラインには操作ジャーナルが必要です（simulation.journal を設定してください）")
+        self.simulation = simulation
+        self.journal = simulation.journal
+        self.keyframe_interval = keyframe_interval
+        self.max_keyframes = max_keyframes
+        self.recent_keyframes = recent_keyframes
+
+        self.keyframes: List[Keyframe] = []
+        self._deltas = np.zeros(64, dtype=DELTA_DTYPE)
+        self._delta_count = 0
+        self._teacher_changes: Dict[int, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {}
+
+        school = simulation.school
+        self._money = school.money
+        self._grade_counts = np.asarray(school.students.grade_counts(), dtype=np.int64)
+        self._teacher_ids = {teacher.id for teacher in school.teachers}
+        self._add_keyframe()
+
+        simulation.add_month_end_listener(self._on_month_end)
+
+    def detach(self) -> None:
+        """記録を停止"""
+        self.simulation.remove_month_end_listener(self._on_month_end)
+
+    @property
+    def first_month(self) -> int:
+        return self.keyframes[0].month_index
+
+    @property
+    def last_month(self) -> int:
+        if self._delta_count:
+            return int(self._deltas['month_index'][self._delta_count - 1])
+        return self.first_month
+
+    @property
+    def memory_bytes(self) -> int:
+        """履歴が使っているおおよそのメモリ量"""
+        return (sum(len(keyframe.data) for keyframe in self.keyframes)
+                + self._deltas.nbytes + 64 * len(self._teacher_changes))
+
+    # === 記録 ===
+    def _on_month_end(self, simulation: Simulation, report: MonthlyReport) -> None:
+        school = simulation.school
+        month_index = simulation.time_manager.month_index
+
+        grade_counts = np.asarray(school.students.grade_counts(), dtype=np.int64)
+        teacher_ids = {teacher.id for teacher in school.teachers}
+        hired = tuple(teacher_ids - self._teacher_ids)
+        fired = tuple(self._teacher_ids - teacher_ids)
+        if hired or fired:
+            self._teacher_changes[month_index] = (hired, fired)
+
+        if self._delta_count == len(self._deltas):
+            self._deltas = np.resize(self._deltas, len(self._deltas) * 2)
+        self._deltas[self._delta_count] = (
+            month_index,
+            school.money - self._money,
+            school.reputation,
+            school.promotion_effect,
+            grade_counts - self._grade_counts,
+        )
+        self._delta_count += 1
+
+        self._money = school.money
+        self._grade_counts = grade_counts
+        self._teacher_ids = teacher_ids
+
+        if month_index - self.keyframes[-1].month_index >= self.keyframe_interval:
+            self._add_keyframe()
+
+    def _add_keyframe(self) -> None:
+        simulation = self.simulation
+        buffer = io.BytesIO()
+        write_snapshot(capture(simulation), buffer)
+        self.keyframes.append(Keyframe(
+            month_index=simulation.time_manager.month_index,
+            day=simulation.time_manager.absolute_day,
+            data=buffer.getvalue(),
+            journal_length=len(self.journal),
+            money=self._money,
+            reputation=simulation.school.reputation,
+            promotion_effect=simulation.school.promotion_effect,
+            grade_counts=tuple(self._grade_counts.tolist()),
+        ))
+        self._thin_keyframes()
+
+    def _thin_keyframes(self) -> None:
+        """上限を超えたら、最初と直近以外のキーフレームを1つおきに間引く"""
+        if len(self.keyframes) <= self.max_keyframes:
+            return
+        first = self.keyframes[0]
+        older = self.keyframes[1:-self.recent_keyframes]
+        recent = self.keyframes[-self.recent_keyframes:]
+        self.keyframes = [first] + older[1::2] + recent
+
+    # === 参照 ===
+    def summary(self, month_index: int) -> MonthSummary:
+        """過去の月の数値（状態は復元しない）"""
+        keyframe = self._keyframe_at(month_index)
+        deltas = self._deltas[:self._delta_count]
+        months = deltas['month_index']
+        span = deltas[(months > keyframe.month_index) & (months <= month_index)]
+
+        year, month = TimeManager.month_from_index(month_index)
+        money = keyframe.money + int(span['money_delta'].sum())
+        grade_counts = (np.asarray(keyframe.grade_counts) + span['grade_delta'].sum(axis=0)).tolist()
+        if len(span):
+            reputation = float(span['reputation'][-1])
+            promotion_effect = float(span['promotion_effect'][-1])
+        else:
+            reputation, promotion_effect = keyframe.reputation, keyframe.promotion_effect
+
+        hired, fired = self._teacher_changes.get(month_index, ((), ()))
+        return MonthSummary(year, month, money, reputation, promotion_effect, grade_counts, hired, fired)
+
+    def restore(self, month_index: int) -> Simulation:
+        """
+        過去の月（月初の処理が終わった時点）のシミュレーションを復元
+
+        直前のキーフレームから、記録された操作を適用しながら再計算する。
+        """
+        keyframe = self._keyframe_at(month_index)
+        simulation = read_snapshot(io.BytesIO(keyframe.data))
+
+        target_day = max(month_index * config.DAYS_PER_MONTH, keyframe.day)
+        for entry in self.journal.entries[keyframe.journal_length:]:
+            # 目標日の操作は月初の処理より後に行われたもの
+            if entry.day >= target_day:
+                break
+            simulation.advance_to_day(entry.day, stop_on_bankruptcy=False)
+            apply_entry(simulation, entry)
+
+        simulation.advance_to_day(target_day, stop_on_bankruptcy=False)
+        return simulation
+
+    def _keyframe_at(self, month_index: int) -> Keyframe:
+        if not self.first_month <= month_index <= self.last_month:
+            raise ValueError(f"記録されていない月です: {month_index}")
+        for keyframe in reversed(self.keyframes):
+            if keyframe.month_index <= month_index:
+                return keyframe
+        return self.keyframes[0]
@@ -1,7 +1,6 @@
 """
 教師生成用データ
 """
-import random
 from typing import Tuple
 
 import config
@@ -32,54 +31,57 @@ SUBJECTS = [
 TEACHER_NAMES = TEACHER_SURNAMES
 
 
-def generate_random_name() -> str:
-    """ランダムな教師名を生成"""
-    surname = random.choice(TEACHER_SURNAMES)
-    first_name = random.choice(TEACHER_FIRST_NAMES)
+def generate_random_name(rng) -> str:
+    """ランダムな教師名を生成（rngはシミュレーションの乱数ストリーム）"""
+    surname = rng.choice(TEACHER_SURNAMES)
+    first_name = rng.choice(TEACHER_FIRST_NAMES)
     return f"{surname} {first_name}"
 
 
-def generate_skill_and_salary() -> Tuple[int, int]:
+def generate_skill_and_salary(rng) -> Tuple[int, int]:
     """スキルと給与を生成（相関あり）"""
     # スキル分布に従ってスキルを決定
-    rand = random.random()
+    rand = rng.random()
     cumulative = 0.0
 
     for tier_data in config.TEACHER_SKILL_DISTRIBUTION.values():
         cumulative += tier_data['probability']
         if rand < cumulative:
             skill_min, skill_max = tier_data['range']
-            skill = random.randint(skill_min, skill_max)
+            skill = rng.randint(skill_min, skill_max)
             break
     else:
         # フォールバック
-        skill = random.randint(40, 60)
+        skill = rng.randint(40, 60)
 
     # スキルに応じた給与（スキル高いほど高給）
     base_salary = config.TEACHER_SALARY_MIN
     skill_bonus = (skill / 100) * (config.TEACHER_SALARY_MAX - config.TEACHER_SALARY_MIN)
     # 少しランダム性を加える
-    variation = random.randint(-20000, 20000)
+    variation = rng.randint(-20000, 20000)
     salary = int(base_salary + skill_bonus + variation)
     salary = max(config.TEACHER_SALARY_MIN, min(config.TEACHER_SALARY_MAX, salary))
 
     return skill, salary
 
 
-def generate_random_teacher() -> Teacher:
+def generate_random_teacher(rng) -> Teacher:
     """ランダムな教師を生成"""
-    name = generate_random_name()
-    skill, salary = generate_skill_and_salary()
-    subject = random.choice(SUBJECTS)
+    name = generate_random_name(rng)
+    skill, salary = generate_skill_and_salary(rng)
+    subject = rng.choice(SUBJECTS)
+    # IDも乱数から作る（同じシードなら再生時に同じIDになる）
+    teacher_id = format(rng.getrandbits(32), '08x')
 
     return Teacher(
         name=name,
         skill=skill,
         salary=salary,
-        subject=subject
+        subject=subject,
+        id=teacher_id,
     )
 
 
-def generate_teacher_candidates(count: int = 3) -> list:
+def generate_teacher_candidates(count: int, rng) -> list:
     """雇用候補の教師リストを生成"""
-    return [generate_random_teacher() for _ in range(count)]
+    return [generate_random_teacher(rng) for _ in range(count)]
@@ -1,5 +1,8 @@
 from .school import School
 from .teacher import Teacher
 from .student import Student
+from .student_roster import StudentRoster
+from .cohort_population import CohortPopulation
+from .registry import Registry
 
-__all__ = ['School', 'Teacher', 'Student']
+__all__ = ['School', 'Teacher', 'Student', 'StudentRoster', 'CohortPopulation', 'Registry']
@@ -0,0 +1,152 @@
+"""
+集計モードの生徒集団 - 個々の生徒を持たず（学年, 満足度区分）ごとの人数だけを保持する
+"""
+from typing import Iterator, List, Tuple
+
+import numpy as np
+
+import config
+from src.entities.student import ACADEMIC_DEFAULT, Student, calculate_dropout_rate
+
+GRADES = 6
+
+
+class CohortPopulation:
+    """学年×満足度区分の人数表による生徒集団
+
+    StudentRosterと同じインターフェースを持ち、School.studentsの
+    代わりに使える。月次処理のコストは生徒数に依存しない。
+    """
+
+    def __init__(self, buckets: int = config.COHORT_SATISFACTION_BUCKETS):
+        self.buckets = buckets
+        self.bucket_width = 100.0 / buckets
+        # counts[学年-1, 満足度区分]
+        self.counts = np.zeros((GRADES, buckets), dtype=np.int64)
+        self._size = 0
+
+    @classmethod
+    def from_roster(cls, roster, buckets: int = config.COHORT_SATISFACTION_BUCKETS) -> 'CohortPopulation':
+        """個別名簿を集計して作成"""
+        population = cls(buckets)
+        grade_index = roster.grade.astype(np.intp) - 1
+        bucket_index = population._bucket_of(roster.satisfaction)
+        np.add.at(population.counts, (grade_index, bucket_index), 1)
+        population._size = len(roster)
+        return population
+
+    @classmethod
+    def from_counts(cls, counts: np.ndarray) -> 'CohortPopulation':
+        """人数表から作成"""
+        population = cls(counts.shape[1])
+        population.counts = np.array(counts, dtype=np.int64)
+        population._size = int(population.counts.sum())
+        return population
+
+    @property
+    def bucket_centers(self) -> np.ndarray:
+        """各満足度区分の代表値"""
+        return (np.arange(self.buckets) + 0.5) * self.bucket_width
+
+    # --- コンテナとしての振る舞い ---
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[Student]:
+        """
+        区分の代表値を持つStudentを人数分生成（大規模時は非常に重いので注意）
+
+        IDは生成順の連番、学力は代表値（集計モードでは個人の値を持たないため）。
+        """
+        centers = self.bucket_centers
+        serial = 0
+        for grade_index, bucket in zip(*np.nonzero(self.counts)):
+            for _ in range(int(self.counts[grade_index, bucket])):
+                yield Student(grade=int(grade_index) + 1, id=format(serial, '08x'),
+                              satisfaction=float(centers[bucket]), academic=ACADEMIC_DEFAULT)
+                serial += 1
+
+    def __contains__(self, student) -> bool:
+        return self.counts[student.grade - 1, self._bucket_of(student.satisfaction)] > 0
+
+    # --- 追加・削除 ---
+    def append(self, student: Student) -> None:
+        """生徒を1人追加（人数を加算）"""
+        self.counts[student.grade - 1, self._bucket_of(student.satisfaction)] += 1
+        self._size += 1
+
+    def add_many(self, count: int, grade: int, rng: np.random.Generator) -> None:
+        """同じ学年の新入生をまとめて追加"""
+        if count <= 0:
+            return
+        self.counts[grade - 1, self._bucket_of(50.0)] += count
+        self._size += count
+
+    def remove(self, student) -> bool:
+        """該当する区分から1人減らす"""
+        cell = (student.grade - 1, self._bucket_of(student.satisfaction))
+        if self.counts[cell] <= 0:
+            return False
+        self.counts[cell] -= 1
+        self._size -= 1
+        return True
+
+    def remove_many(self, student_ids) -> int:
+        """集計モードでは個々のIDを持たないため、ID指定の削除は行わない"""
+        return 0
+
+    def clear(self) -> None:
+        """全員を削除"""
+        self.counts[:] = 0
+        self._size = 0
+
+    # --- 月次・年次処理 ---
+    def process_monthly(self, school_satisfaction: float, rng: np.random.Generator) -> int:
+        """
+        区分ごとの二項分布で退学者を抽選し、満足度区分を更新
+
+        Returns:
+            退学者数
+        """
+        dropout_rate = calculate_dropout_rate(school_satisfaction)
+        dropouts_by_cell = rng.binomial(self.counts, dropout_rate)
+        self.counts -= dropouts_by_cell
+        dropouts = int(dropouts_by_cell.sum())
+        self._size -= dropouts
+
+        # 個人満足度を学校満足度に近づける（区分の代表値を移動して再集計）
+        moved = self.bucket_centers * 0.8 + school_satisfaction * 0.2
+        targets = self._bucket_of(moved)
+        updated = np.zeros_like(self.counts)
+        np.add.at(updated.T, targets, self.counts.T)
+        self.counts = updated
+
+        return dropouts
+
+    def process_graduation(self, rng: np.random.Generator) -> Tuple[int, int]:
+        """
+        卒業・進級処理（3月）
+
+        Returns:
+            (卒業者数, 進級者数)
+        """
+        # 高3は全員卒業、中3は一定割合が外部高校へ
+        outflow = rng.binomial(self.counts[2], config.JUNIOR_HIGH_OUTFLOW_RATE)
+        graduates = int(self.counts[5].sum() + outflow.sum())
+        self.counts[2] -= outflow
+
+        # 学年を1つずらす
+        self.counts[1:] = self.counts[:-1].copy()
+        self.counts[0] = 0
+
+        self._size -= graduates
+        return graduates, self._size
+
+    def grade_counts(self) -> List[int]:
+        """学年別の人数（1年〜6年）"""
+        return self.counts.sum(axis=1).tolist()
+
+    def _bucket_of(self, satisfaction):
+        """満足度を区分番号に変換"""
+        index = np.floor_divide(satisfaction, self.bucket_width).astype(np.intp)
+        return np.clip(index, 0, self.buckets - 1)
@@ -0,0 +1,69 @@
+"""
+依存関係付き派生値キャッシュ
+"""
+from typing import Any, Callable, Dict, Iterable, List, Set
+
+
+class DerivedCache:
+    """派生値ごとに入力を宣言し、入力が変わった値だけを再計算するキャッシュ
+
+    入力名は基本データ（'teachers' など）でも他の派生値名でもよい。
+    無効化は依存先へ推移的に伝わる。
+    """
+
+    def __init__(self):
+        self._compute: Dict[str, Callable[[], Any]] = {}
+        self._values: Dict[str, Any] = {}
+        self._dependents: Dict[str, List[str]] = {}
+
+        # 計測用カウンター
+        self.hits: Dict[str, int] = {}
+        self.misses: Dict[str, int] = {}
+
+    def define(self, name: str, compute: Callable[[], Any], inputs: Iterable[str]) -> None:
+        """派生値を登録"""
+        self._compute[name] = compute
+        self.hits[name] = 0
+        self.misses[name] = 0
+        for source in inputs:
+            self._dependents.setdefault(source, []).append(name)
+
+    def get(self, name: str) -> Any:
+        """派生値を取得（キャッシュがなければ計算）"""
+        if name in self._values:
+            self.hits[name] += 1
+            return self._values[name]
+
+        self.misses[name] += 1
+        value = self._compute[name]()
+        self._values[name] = value
+        return value
+
+    def invalidate(self, *sources: str) -> None:
+        """入力の変更を通知し、依存する派生値を破棄"""
+        pending = list(sources)
+        visited: Set[str] = set()
+        while pending:
+            source = pending.pop()
+            if source in visited:
+                continue
+            visited.add(source)
+            self._values.pop(source, None)
+            pending.extend(self._dependents.get(source, ()))
+
+    def invalidate_all(self) -> None:
+        """全ての派生値を破棄"""
+        self._values.clear()
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """派生値ごとのヒット・ミス回数"""
+        return {
+            name: {'hits': self.hits[name], 'misses': self.misses[name]}
+            for name in self._compute
+        }
+
+    def reset_stats(self) -> None:
+        """カウンターをリセット"""
+        for name in self._compute:
+            self.hits[name] = 0
+            self.misses[name] = 0
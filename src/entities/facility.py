@@ -1,4 +1,3 @@
-import pygame
 from typing import Tuple
 import config
 
@@ -37,4 +36,6 @@ class Facility:
     @property
     def rect(self):
         """描画用矩形を取得（MapRendererでサイズ調整が必要だが基本値を返す）"""
+        # ヘッドレス実行のため、pygameは描画時のみ読み込む
+        import pygame
         return pygame.Rect(self.grid_x, self.grid_y, self.width, self.height)
\ No newline at end of file
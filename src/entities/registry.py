@@ -0,0 +1,77 @@
+"""
+ID索引付きエンティティ一覧 - O(1)の追加・削除を提供する
+"""
+from typing import Dict, Generic, Iterable, Iterator, List, Optional, TypeVar
+
+T = TypeVar('T')
+
+
+class Registry(Generic[T]):
+    """ID（.id属性）で索引付けされた一覧
+
+    削除は末尾要素との入れ替え（swap-remove）で行うため、
+    削除後は並び順が変わることがある。末尾の削除では順序は保たれる。
+    """
+
+    def __init__(self, items: Iterable[T] = ()):
+        self._items: List[T] = []
+        self._index: Dict[str, int] = {}
+        for item in items:
+            self.append(item)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._items)
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+    def __contains__(self, item) -> bool:
+        return getattr(item, 'id', None) in self._index
+
+    def __repr__(self) -> str:
+        return f"Registry({self._items!r})"
+
+    def get(self, item_id: str) -> Optional[T]:
+        """IDから要素を取得"""
+        position = self._index.get(item_id)
+        return None if position is None else self._items[position]
+
+    def append(self, item: T) -> None:
+        """要素を追加"""
+        self._index[item.id] = len(self._items)
+        self._items.append(item)
+
+    def remove(self, item: T) -> bool:
+        """要素を削除"""
+        return self.remove_id(item.id) is not None
+
+    def remove_id(self, item_id: str) -> Optional[T]:
+        """IDで要素を削除し、削除した要素を返す"""
+        position = self._index.pop(item_id, None)
+        if position is None:
+            return None
+
+        removed = self._items[position]
+        last = self._items.pop()
+        if position < len(self._items):
+            # 末尾の要素を空いた位置へ移す
+            self._items[position] = last
+            self._index[last.id] = position
+        return removed
+
+    def remove_many(self, item_ids: Iterable[str]) -> int:
+        """
+        複数のIDをまとめて削除
+
+        Returns:
+            削除した件数
+        """
+        return sum(1 for item_id in item_ids if self.remove_id(item_id) is not None)
+
+    def clear(self) -> None:
+        """全要素を削除"""
+        self._items.clear()
+        self._index.clear()
@@ -2,12 +2,24 @@
 学校エンティティ - ゲームの中心となるクラス
 """
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Union
+
+import numpy as np
 
 import config
 from src.entities.teacher import Teacher
 from src.entities.student import Student
+from src.entities.student_roster import StudentRoster
+from src.entities.cohort_population import CohortPopulation
 from src.entities.facility import Facility
+from src.entities.registry import Registry
+from src.entities.derived_cache import DerivedCache
+from src.systems.ledger import (
+    ACCOUNT_FACILITY_PURCHASE, ACCOUNT_OTHER_EXPENSE, ACCOUNT_OTHER_INCOME, Ledger,
+)
+
+# 代入を検知して派生値を無効化するフィールド
+_TRACKED_FIELDS = frozenset({'reputation', 'capacity', 'promotion_effect', 'students'})
 
 @dataclass
 class School:
@@ -17,45 +29,177 @@ class School:
     reputation: float = config.INITIAL_REPUTATION
     capacity: int = config.INITIAL_CAPACITY
 
-    teachers: List[Teacher] = field(default_factory=list)
-    students: List[Student] = field(default_factory=list)
+    teachers: Registry[Teacher] = field(default_factory=Registry)
+    students: Union[StudentRoster, CohortPopulation] = field(default_factory=StudentRoster)
     facilities: List[Facility] = field(default_factory=list)
 
     # 宣伝効果（0-100）
     promotion_effect: float = 0.0
 
-    # 統計用キャッシュ
-    _cached_education: Optional[float] = field(default=None, repr=False)
-    _cached_satisfaction: Optional[float] = field(default=None, repr=False)
+    # 集計モードへ切り替える生徒数（Noneなら切り替えない）
+    cohort_threshold: Optional[int] = config.COHORT_POPULATION_THRESHOLD
+
+    # 統計用キャッシュ（派生値ごとに依存する入力を管理）
+    _derived: Optional[DerivedCache] = field(default=None, init=False, repr=False, compare=False)
+
+    # 資金の仕訳帳（moneyは必ずspend/charge/receive経由で増減させる）
+    ledger: Optional[Ledger] = field(default=None, init=False, repr=False, compare=False)
+
+    # 集計値（雇用・解雇・建設・教師の成長時に差分更新）
+    _teacher_skill_sum: int = field(default=0, init=False, repr=False)
+    _teacher_salary_sum: int = field(default=0, init=False, repr=False)
+    _facility_counts: Dict[str, int] = field(default_factory=dict, init=False, repr=False)
+    _facility_education: int = field(default=0, init=False, repr=False)
+    _facility_satisfaction: int = field(default=0, init=False, repr=False)
+    _facility_maintenance: int = field(default=0, init=False, repr=False)
 
     def __post_init__(self):
-        pass
+        self._derived = DerivedCache()
+        self._derived.define('education', self._compute_education_quality,
+                             ('teachers', 'students', 'facilities'))
+        self._derived.define('satisfaction', self._compute_satisfaction,
+                             ('education', 'students', 'capacity', 'facilities'))
+        self._derived.define('income', self._compute_monthly_income,
+                             ('students', 'reputation', 'education'))
+        self._derived.define('expense', self._compute_monthly_expense,
+                             ('teachers', 'capacity', 'facilities', 'students'))
+        self._derived.define('balance', lambda: self.monthly_income - self.monthly_expense,
+                             ('income', 'expense'))
+        self._derived.define('projected_applicants', self._compute_projected_applicants,
+                             ('reputation', 'promotion_effect'))
+
+        self.ledger = Ledger(opening_balance=self.money)
+
+        if not isinstance(self.teachers, Registry):
+            self.teachers = Registry(self.teachers)
+        self.recalculate_aggregates()
+
+    def recalculate_aggregates(self) -> None:
+        """集計値を一から計算し直す（外部から一覧を直接変更した場合用）"""
+        self._teacher_skill_sum = sum(t.skill for t in self.teachers)
+        self._teacher_salary_sum = sum(t.salary for t in self.teachers)
+        self._facility_counts = {}
+        self._facility_education = 0
+        self._facility_satisfaction = 0
+        self._facility_maintenance = 0
+        for facility in self.facilities:
+            self._add_facility_totals(facility.type_id)
+        self.invalidate_cache()
+
+    def _add_facility_totals(self, type_id: str) -> None:
+        """施設1件分を集計値に加算"""
+        data = config.FACILITY_DATA.get(type_id, {})
+        self._facility_counts[type_id] = self._facility_counts.get(type_id, 0) + 1
+        self._facility_education += data.get('education', 0)
+        self._facility_satisfaction += data.get('satisfaction', 0)
+        self._facility_maintenance += data.get('maintenance', 0)
+
+    def _add_teacher_totals(self, teacher: Teacher, sign: int = 1) -> None:
+        """教師1人分を集計値に加算（sign=-1で減算）"""
+        self._teacher_skill_sum += sign * teacher.skill
+        self._teacher_salary_sum += sign * teacher.salary
+
+    def add_teacher_skill(self, delta: int) -> None:
+        """教師の成長によるスキル合計の変化を反映"""
+        if delta:
+            self._teacher_skill_sum += delta
+            self.mark_changed('teachers')
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in _TRACKED_FIELDS:
+            derived = self.__dict__.get('_derived')
+            if derived is not None:
+                derived.invalidate(name)
+
+    def mark_changed(self, *inputs: str) -> None:
+        """入力（'teachers', 'students', 'facilities' など）の変更を通知"""
+        self._derived.invalidate(*inputs)
 
     def invalidate_cache(self) -> None:
         """キャッシュを無効化"""
-        self._cached_education = None
-        self._cached_satisfaction = None
+        self._derived.invalidate_all()
+
+    def cache_stats(self):
+        """派生値ごとのキャッシュヒット・ミス回数"""
+        return self._derived.stats()
 
     @property
     def student_count(self) -> int:
         return len(self.students)
 
+    @property
+    def is_cohort_mode(self) -> bool:
+        """生徒を集計モードで保持しているか"""
+        return isinstance(self.students, CohortPopulation)
+
+    def use_cohort_population(self) -> None:
+        """個別名簿を学年×満足度区分の集計に切り替える（元には戻らない）"""
+        if not self.is_cohort_mode:
+            self.students = CohortPopulation.from_roster(self.students)
+
+    def update_population_mode(self) -> None:
+        """生徒数が閾値を超えたら集計モードへ切り替える"""
+        if self.cohort_threshold is not None and self.student_count > self.cohort_threshold:
+            self.use_cohort_population()
+
     @property
     def teacher_count(self) -> int:
         return len(self.teachers)
 
+    @property
+    def teacher_salary_total(self) -> int:
+        """教師給与の合計（月額）"""
+        return self._teacher_salary_sum
+
+    @property
+    def facility_maintenance_total(self) -> int:
+        """施設ごとの維持費の合計（月額）"""
+        return self._facility_maintenance
+
+    @property
+    def maintenance_total(self) -> int:
+        """キャパシティ分と施設ごとを合わせた維持費（月額）"""
+        return self.capacity * config.CAPACITY_MAINTENANCE_RATE + self._facility_maintenance
+
+    def facility_count(self, type_id: str) -> int:
+        """種類別の施設数"""
+        return self._facility_counts.get(type_id, 0)
+
     @property
     def education_quality(self) -> float:
-        """教育力を計算 (0-100)"""
-        if self._cached_education is not None:
-            return self._cached_education
+        """教育力 (0-100)"""
+        return self._derived.get('education')
+
+    @property
+    def satisfaction(self) -> float:
+        """満足度 (0-100)"""
+        return self._derived.get('satisfaction')
+
+    @property
+    def monthly_income(self) -> int:
+        return self._derived.get('income')
+
+    @property
+    def monthly_expense(self) -> int:
+        return self._derived.get('expense')
+
+    @property
+    def monthly_balance(self) -> int:
+        return self._derived.get('balance')
 
+    @property
+    def projected_applicants(self) -> int:
+        """次年度の予想応募者数"""
+        return self._derived.get('projected_applicants')
+
+    def _compute_education_quality(self) -> float:
+        """教育力を計算 (0-100)"""
         if not self.teachers:
-            self._cached_education = 10.0
-            return self._cached_education
+            return 10.0
 
         # 教師の平均スキル
-        teacher_skill_avg = sum(t.skill for t in self.teachers) / len(self.teachers)
+        teacher_skill_avg = self._teacher_skill_sum / len(self.teachers)
 
         # 教師比率効果
         student_count = max(self.student_count, 1)
@@ -63,21 +207,16 @@ class School:
         teacher_ratio = min(teacher_ratio, config.EDUCATION_RATIO_CAP)
 
         # 施設ボーナス計算
-        facility_bonus = sum(config.FACILITY_DATA.get(f.type_id, {}).get('education', 0) for f in self.facilities)
+        facility_bonus = self._facility_education
 
         # 教育力計算
         education = (teacher_skill_avg * teacher_ratio * config.EDUCATION_TEACHER_WEIGHT +
                      facility_bonus * config.EDUCATION_FACILITY_WEIGHT)
 
-        self._cached_education = max(0, min(100, education))
-        return self._cached_education
+        return max(0, min(100, education))
 
-    @property
-    def satisfaction(self) -> float:
+    def _compute_satisfaction(self) -> float:
         """満足度を計算 (0-100)"""
-        if self._cached_satisfaction is not None:
-            return self._cached_satisfaction
-
         education = self.education_quality
         student_count = self.student_count
         capacity = max(self.capacity, 1)
@@ -92,18 +231,16 @@ class School:
             density_factor = max(0.1, 0.7 - (density - config.DENSITY_THRESHOLD_HIGH) * 2.0)
 
         # 施設満足度計算
-        facility_satisfaction = sum(config.FACILITY_DATA.get(f.type_id, {}).get('satisfaction', 0) for f in self.facilities)
+        facility_satisfaction = self._facility_satisfaction
 
         # 満足度計算
         satisfaction = ((education * config.SATISFACTION_EDUCATION_WEIGHT +
                         facility_satisfaction * config.SATISFACTION_FACILITY_WEIGHT) *
                        density_factor + config.SATISFACTION_BASE)
 
-        self._cached_satisfaction = max(0, min(100, satisfaction))
-        return self._cached_satisfaction
+        return max(0, min(100, satisfaction))
 
-    @property
-    def monthly_income(self) -> int:
+    def _compute_monthly_income(self) -> int:
         student_count = self.student_count
         reputation = self.reputation
         education = self.education_quality
@@ -111,47 +248,91 @@ class School:
         subsidy = student_count * config.SUBSIDY_PER_STUDENT * education / 100
         return int(tuition + subsidy)
 
-    @property
-    def monthly_expense(self) -> int:
-        teacher_salary = sum(t.salary for t in self.teachers)
+    def _compute_monthly_expense(self) -> int:
+        teacher_salary = self._teacher_salary_sum
         
         # 施設維持費の計算
-        base_maintenance = self.capacity * config.CAPACITY_MAINTENANCE_RATE
-        facility_maintenance = sum(config.FACILITY_DATA.get(f.type_id, {}).get('maintenance', 0) for f in self.facilities)
+        maintenance = self.maintenance_total
         
         material_cost = self.student_count * config.MATERIAL_COST_PER_STUDENT
         fixed_cost = config.FIXED_MONTHLY_COST
-        return int(teacher_salary + base_maintenance + facility_maintenance + material_cost + fixed_cost)
+        return int(teacher_salary + maintenance + material_cost + fixed_cost)
 
-    @property
-    def monthly_balance(self) -> int:
-        return self.monthly_income - self.monthly_expense
+    def _compute_projected_applicants(self) -> int:
+        base = config.BASE_APPLICANTS + self.reputation * config.APPLICANTS_PER_REPUTATION
+        bonus = base * (self.promotion_effect / 100) * config.PROMOTION_BONUS_RATE
+        return int(base + bonus)
 
     def hire_teacher(self, teacher: Teacher) -> bool:
         self.teachers.append(teacher)
-        self.invalidate_cache()
+        self._add_teacher_totals(teacher)
+        self.mark_changed('teachers')
         return True
 
     def fire_teacher(self, teacher: Teacher) -> bool:
-        if teacher in self.teachers:
-            self.teachers.remove(teacher)
-            self.invalidate_cache()
+        removed = self.teachers.remove_id(teacher.id)
+        if removed is not None:
+            self._add_teacher_totals(removed, -1)
+            self.mark_changed('teachers')
             return True
         return False
 
+    def fire_teachers(self, teacher_ids: Iterable[str]) -> int:
+        """
+        複数の教師をIDでまとめて解雇（キャッシュ無効化は1回）
+
+        Returns:
+            解雇した人数
+        """
+        fired = 0
+        for teacher_id in teacher_ids:
+            removed = self.teachers.remove_id(teacher_id)
+            if removed is not None:
+                self._add_teacher_totals(removed, -1)
+                fired += 1
+        if fired:
+            self.mark_changed('teachers')
+        return fired
+
     def add_student(self, student: Student) -> bool:
         if self.student_count < self.capacity:
             self.students.append(student)
-            self.invalidate_cache()
+            self.update_population_mode()
+            self.mark_changed('students')
             return True
         return False
 
+    def add_students(self, count: int, grade: int, rng: np.random.Generator) -> int:
+        """
+        同じ学年の生徒をまとめて追加（キャパシティまで）
+
+        Returns:
+            追加した人数
+        """
+        count = max(0, min(count, self.capacity - self.student_count))
+        if count:
+            self.students.add_many(count, grade, rng)
+            self.update_population_mode()
+            self.mark_changed('students')
+        return count
+
     def remove_student(self, student: Student) -> bool:
-        if student in self.students:
-            self.students.remove(student)
-            self.invalidate_cache()
+        if self.students.remove(student):
+            self.mark_changed('students')
             return True
         return False
+
+    def remove_students(self, student_ids: Iterable[str]) -> int:
+        """
+        複数の生徒をIDでまとめて削除（キャッシュ無効化は1回）
+
+        Returns:
+            削除した人数
+        """
+        removed = self.students.remove_many(student_ids)
+        if removed:
+            self.mark_changed('students')
+        return removed
         
     def add_facility(self, type_id: str, grid_x: int, grid_y: int) -> bool:
         """施設を追加"""
@@ -162,14 +343,15 @@ class School:
         
         # can_affordを使ってチェック
         if self.can_afford(cost):
-            self.spend(cost) # spendを使って支払い
+            self.spend(cost, ACCOUNT_FACILITY_PURCHASE) # spendを使って支払い
             new_facility = Facility(type_id, grid_x, grid_y)
             self.facilities.append(new_facility)
+            self._add_facility_totals(type_id)
             
             # キャパシティ増加
             self.capacity += data.get('capacity', 0)
             
-            self.invalidate_cache()
+            self.mark_changed('facilities')
             return True
         return False
 
@@ -178,15 +360,21 @@ class School:
         """支払い可能かチェック"""
         return self.money >= cost
 
-    def spend(self, amount: int) -> bool:
-        """支出処理"""
+    def spend(self, amount: int, account: str = ACCOUNT_OTHER_EXPENSE) -> bool:
+        """支出処理（資金が足りなければ支払わない）"""
         if self.can_afford(amount):
-            self.money -= amount
+            self.charge(amount, account)
             return True
         return False
 
-    def receive(self, amount: int) -> None:
+    def charge(self, amount: int, account: str = ACCOUNT_OTHER_EXPENSE) -> None:
+        """支出処理（月々の経費など、資金が足りなくても支払う）"""
+        self.ledger.post(account, -amount)
+        self.money -= amount
+
+    def receive(self, amount: int, account: str = ACCOUNT_OTHER_INCOME) -> None:
         """収入処理"""
+        self.ledger.post(account, amount)
         self.money += amount
 
     def is_bankrupt(self) -> bool:
@@ -1,21 +1,24 @@
 """
 生徒エンティティ
 """
-from dataclasses import dataclass, field
-from uuid import uuid4
-import random
+from dataclasses import dataclass
 
 import config
 
+# 新入生の学力の範囲と、個別の値がない場合（集計モードなど）の代表値
+ACADEMIC_MIN = 30
+ACADEMIC_MAX = 70
+ACADEMIC_DEFAULT = (ACADEMIC_MIN + ACADEMIC_MAX) // 2
+
 
 @dataclass
 class Student:
     """生徒クラス"""
     grade: int              # 学年 (1-6: 中1-高3)
 
-    id: str = field(default_factory=lambda: uuid4().hex[:8])
+    id: str                         # 生徒ID（16進8桁）
     satisfaction: float = 50.0      # 個人満足度 (0-100)
-    academic: int = field(default_factory=lambda: random.randint(30, 70))  # 学力 (0-100)
+    academic: int = ACADEMIC_DEFAULT  # 学力 (0-100、省略時は乱数を使わず代表値の50)
     months_enrolled: int = 0        # 在籍月数
 
     def update_monthly(self, school_satisfaction: float) -> None:
@@ -24,38 +27,22 @@ class Student:
         # 個人満足度を学校満足度に近づける
         self.satisfaction = self.satisfaction * 0.8 + school_satisfaction * 0.2
 
-    def will_dropout(self, school_satisfaction: float) -> bool:
-        """退学判定"""
+    def will_dropout(self, school_satisfaction: float, rng) -> bool:
+        """退学判定（rngはシミュレーションの乱数ストリーム）"""
         dropout_rate = self._calculate_dropout_rate(school_satisfaction)
-        return random.random() < dropout_rate
+        return rng.random() < dropout_rate
 
     def _calculate_dropout_rate(self, satisfaction: float) -> float:
         """退学率計算"""
-        if satisfaction >= 80:
-            return config.DROPOUT_RATE_HIGH_SATISFACTION
-        elif satisfaction >= 50:
-            # 50-80の間で線形補間
-            ratio = (satisfaction - 50) / 30
-            return (config.DROPOUT_RATE_MEDIUM_SATISFACTION * (1 - ratio) +
-                    config.DROPOUT_RATE_HIGH_SATISFACTION * ratio)
-        elif satisfaction >= 20:
-            # 20-50の間で線形補間
-            ratio = (satisfaction - 20) / 30
-            return (config.DROPOUT_RATE_LOW_SATISFACTION * (1 - ratio) +
-                    config.DROPOUT_RATE_MEDIUM_SATISFACTION * ratio)
-        else:
-            # 0-20の間
-            ratio = satisfaction / 20
-            return (config.DROPOUT_RATE_VERY_LOW * (1 - ratio) +
-                    config.DROPOUT_RATE_LOW_SATISFACTION * ratio)
+        return calculate_dropout_rate(satisfaction)
 
-    def should_graduate(self) -> bool:
-        """卒業判定（3月時点で呼び出す）"""
+    def should_graduate(self, rng) -> bool:
+        """卒業判定（3月時点で呼び出す、rngはシミュレーションの乱数ストリーム）"""
         # 中3(grade=3)の30%が外部高校へ、高3(grade=6)は全員卒業
         if self.grade == 6:
             return True
         elif self.grade == 3:
-            return random.random() < 0.3
+            return rng.random() < config.JUNIOR_HIGH_OUTFLOW_RATE
         return False
 
     def advance_grade(self) -> None:
@@ -65,3 +52,24 @@ class Student:
 
     def __repr__(self) -> str:
         return f"Student(grade={self.grade}, academic={self.academic})"
+
+
+def calculate_dropout_rate(satisfaction: float) -> float:
+    """満足度から月次の退学率を計算"""
+    if satisfaction >= 80:
+        return config.DROPOUT_RATE_HIGH_SATISFACTION
+    elif satisfaction >= 50:
+        # 50-80の間で線形補間
+        ratio = (satisfaction - 50) / 30
+        return (config.DROPOUT_RATE_MEDIUM_SATISFACTION * (1 - ratio) +
+                config.DROPOUT_RATE_HIGH_SATISFACTION * ratio)
+    elif satisfaction >= 20:
+        # 20-50の間で線形補間
+        ratio = (satisfaction - 20) / 30
+        return (config.DROPOUT_RATE_LOW_SATISFACTION * (1 - ratio) +
+                config.DROPOUT_RATE_MEDIUM_SATISFACTION * ratio)
+    else:
+        # 0-20の間
+        ratio = satisfaction / 20
+        return (config.DROPOUT_RATE_VERY_LOW * (1 - ratio) +
+                config.DROPOUT_RATE_LOW_SATISFACTION * ratio)
@@ -0,0 +1,319 @@
+"""
+生徒名簿 - 生徒データを列指向（NumPy配列）で保持する
+"""
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+import config
+from src.entities.student import ACADEMIC_MAX, ACADEMIC_MIN, Student, calculate_dropout_rate
+
+
+# 列定義（列名, dtype）
+ROSTER_COLUMNS: Tuple[Tuple[str, type], ...] = (
+    ('ids', np.int64),
+    ('grade', np.int8),
+    ('satisfaction', np.float64),
+    ('academic', np.int16),
+    ('months_enrolled', np.int32),
+)
+
+# 一括追加で採番するIDの開始値（8桁16進のStudent.idと衝突しない）
+_GENERATED_ID_START = 1 << 32
+
+
+class StudentView:
+    """名簿の1行を参照する軽量ビュー（UI・互換用）
+
+    行番号を保持するだけなので、名簿が変更されたら作り直すこと。
+    """
+
+    __slots__ = ('_roster', '_row')
+
+    def __init__(self, roster: 'StudentRoster', row: int):
+        self._roster = roster
+        self._row = row
+
+    @property
+    def id(self) -> str:
+        return format(int(self._roster.ids[self._row]), '08x')
+
+    @property
+    def grade(self) -> int:
+        return int(self._roster.grade[self._row])
+
+    @property
+    def satisfaction(self) -> float:
+        return float(self._roster.satisfaction[self._row])
+
+    @property
+    def academic(self) -> int:
+        return int(self._roster.academic[self._row])
+
+    @property
+    def months_enrolled(self) -> int:
+        return int(self._roster.months_enrolled[self._row])
+
+    def to_student(self) -> Student:
+        """独立したStudentオブジェクトに変換"""
+        return Student(
+            grade=self.grade,
+            id=self.id,
+            satisfaction=self.satisfaction,
+            academic=self.academic,
+            months_enrolled=self.months_enrolled,
+        )
+
+    def __repr__(self) -> str:
+        return f"Student(grade={self.grade}, academic={self.academic})"
+
+
+class StudentRoster:
+    """列指向の生徒名簿（Struct of Arrays）"""
+
+    def __init__(self, initial_capacity: int = 256):
+        self._size = 0
+        self._next_id = _GENERATED_ID_START
+        # ID→行番号の索引（必要になった時点で構築する）
+        self._rows: Optional[Dict[int, int]] = None
+        self._data: Dict[str, np.ndarray] = {
+            name: np.empty(initial_capacity, dtype=dtype)
+            for name, dtype in ROSTER_COLUMNS
+        }
+
+    @classmethod
+    def from_columns(cls, columns: Dict[str, np.ndarray], next_id: int = _GENERATED_ID_START) -> 'StudentRoster':
+        """列データから名簿を作成（書き込み可能な連続配列ならコピーせずに保持する）"""
+        size = len(columns['ids'])
+        roster = cls(initial_capacity=0)
+        roster._data = {
+            name: np.require(columns[name], dtype=dtype, requirements=['C', 'W'])
+            for name, dtype in ROSTER_COLUMNS
+        }
+        roster._size = size
+        roster._next_id = next_id
+        return roster
+
+    @property
+    def next_id(self) -> int:
+        """次に一括追加で採番するID"""
+        return self._next_id
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        """有効行の列データ（コピーではなくビュー）"""
+        return {name: self._data[name][:self._size] for name, _ in ROSTER_COLUMNS}
+
+    # --- 列アクセス（有効行のみのビュー） ---
+    @property
+    def ids(self) -> np.ndarray:
+        return self._data['ids'][:self._size]
+
+    @property
+    def grade(self) -> np.ndarray:
+        return self._data['grade'][:self._size]
+
+    @property
+    def satisfaction(self) -> np.ndarray:
+        return self._data['satisfaction'][:self._size]
+
+    @property
+    def academic(self) -> np.ndarray:
+        return self._data['academic'][:self._size]
+
+    @property
+    def months_enrolled(self) -> np.ndarray:
+        return self._data['months_enrolled'][:self._size]
+
+    # --- コンテナとしての振る舞い ---
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[StudentView]:
+        for row in range(self._size):
+            yield StudentView(self, row)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [StudentView(self, row) for row in range(*index.indices(self._size))]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("生徒インデックスが範囲外です")
+        return StudentView(self, index)
+
+    def __contains__(self, student) -> bool:
+        return self._find_row(student.id) is not None
+
+    # --- 追加 ---
+    def _reserve(self, extra: int) -> None:
+        """extra行分の空きを確保（容量は倍々で拡張）"""
+        required = self._size + extra
+        capacity = len(self._data['ids'])
+        if required <= capacity:
+            return
+        new_capacity = max(required, capacity * 2)
+        for name, column in self._data.items():
+            grown = np.empty(new_capacity, dtype=column.dtype)
+            grown[:self._size] = column[:self._size]
+            self._data[name] = grown
+
+    def append(self, student: Student) -> None:
+        """Studentオブジェクトを1人追加"""
+        self._reserve(1)
+        row = self._size
+        self._data['ids'][row] = self._parse_id(student.id)
+        self._data['grade'][row] = student.grade
+        self._data['satisfaction'][row] = student.satisfaction
+        self._data['academic'][row] = student.academic
+        self._data['months_enrolled'][row] = student.months_enrolled
+        if self._rows is not None:
+            self._rows[int(self._data['ids'][row])] = row
+        self._size += 1
+
+    def add_many(self, count: int, grade: int, rng: np.random.Generator) -> None:
+        """同じ学年の新入生をまとめて追加"""
+        if count <= 0:
+            return
+        self._reserve(count)
+        rows = slice(self._size, self._size + count)
+        self._data['ids'][rows] = np.arange(self._next_id, self._next_id + count)
+        self._data['grade'][rows] = grade
+        self._data['satisfaction'][rows] = 50.0
+        self._data['academic'][rows] = rng.integers(ACADEMIC_MIN, ACADEMIC_MAX + 1, size=count)
+        self._data['months_enrolled'][rows] = 0
+        self._next_id += count
+        self._size += count
+        self._rows = None
+
+    # --- 削除 ---
+    def compact(self, keep: np.ndarray) -> int:
+        """
+        真偽マスクで残す行だけを前に詰める
+
+        Returns:
+            削除した人数
+        """
+        kept = int(np.count_nonzero(keep))
+        removed = self._size - kept
+        if removed == 0:
+            return 0
+        for name, column in self._data.items():
+            column[:kept] = column[:self._size][keep]
+        self._size = kept
+        self._rows = None
+        return removed
+
+    def remove(self, student) -> bool:
+        """生徒を1人削除"""
+        return self.remove_id(student.id)
+
+    def remove_id(self, student_id) -> bool:
+        """
+        IDで生徒を1人削除（末尾の行と入れ替えるのでO(1)）
+
+        Returns:
+            削除できたかどうか
+        """
+        target = self._to_int_id(student_id)
+        row = self._row_index().pop(target, None) if target is not None else None
+        if row is None:
+            return False
+
+        last = self._size - 1
+        if row != last:
+            for column in self._data.values():
+                column[row] = column[last]
+            self._rows[int(self._data['ids'][row])] = row
+        self._size = last
+        return True
+
+    def remove_many(self, student_ids: Iterable) -> int:
+        """
+        複数のIDをまとめて削除（1回の圧縮で処理）
+
+        Returns:
+            削除した人数
+        """
+        targets = [self._to_int_id(student_id) for student_id in student_ids]
+        targets = np.array([t for t in targets if t is not None], dtype=np.int64)
+        if len(targets) == 0:
+            return 0
+        return self.compact(~np.isin(self.ids, targets))
+
+    def clear(self) -> None:
+        """全員を削除"""
+        self._size = 0
+        self._rows = None
+
+    # --- 月次・年次処理（ベクトル化） ---
+    def update_monthly(self, school_satisfaction: float) -> None:
+        """在籍月数の加算と個人満足度の更新"""
+        self.months_enrolled[:] += 1
+        satisfaction = self.satisfaction
+        satisfaction *= 0.8
+        satisfaction += school_satisfaction * 0.2
+
+    def process_monthly(self, school_satisfaction: float, rng: np.random.Generator) -> int:
+        """
+        退学判定と月次更新をまとめて実行
+
+        Returns:
+            退学者数
+        """
+        dropout_rate = calculate_dropout_rate(school_satisfaction)
+        stays = rng.random(self._size) >= dropout_rate
+        dropouts = self.compact(stays)
+        self.update_monthly(school_satisfaction)
+        return dropouts
+
+    def process_graduation(self, rng: np.random.Generator) -> Tuple[int, int]:
+        """
+        卒業・進級処理（3月）
+
+        Returns:
+            (卒業者数, 進級者数)
+        """
+        grade = self.grade
+        graduates = grade == 6
+        junior_high_last = np.flatnonzero(grade == 3)
+        outflow = rng.random(len(junior_high_last)) < config.JUNIOR_HIGH_OUTFLOW_RATE
+        graduates[junior_high_last[outflow]] = True
+
+        graduated = self.compact(~graduates)
+        advanced = self._size
+        self.grade[:] += 1
+        return graduated, advanced
+
+    def grade_counts(self) -> List[int]:
+        """学年別の人数（1年〜6年）"""
+        return np.bincount(self.grade, minlength=7)[1:7].tolist()
+
+    # --- 内部処理 ---
+    def _parse_id(self, student_id: str) -> int:
+        parsed = self._to_int_id(student_id)
+        if parsed is None:
+            self._next_id += 1
+            return self._next_id - 1
+        return parsed
+
+    @staticmethod
+    def _to_int_id(student_id) -> Optional[int]:
+        """Student.id（16進文字列）または整数IDを整数に変換"""
+        if isinstance(student_id, (int, np.integer)):
+            return int(student_id)
+        try:
+            return int(student_id, 16)
+        except (TypeError, ValueError):
+            return None
+
+    def _row_index(self) -> Dict[int, int]:
+        """ID→行番号の索引を取得（無効化されていれば再構築）"""
+        if self._rows is None:
+            self._rows = dict(zip(self.ids.tolist(), range(self._size)))
+        return self._rows
+
+    def _find_row(self, student_id) -> Optional[int]:
+        target = self._to_int_id(student_id)
+        if target is None:
+            return None
+        return self._row_index().get(target)
@@ -1,8 +1,7 @@
 """
 教師エンティティ
 """
-from dataclasses import dataclass, field
-from uuid import uuid4
+from dataclasses import dataclass
 
 
 @dataclass
@@ -13,7 +12,7 @@ class Teacher:
     salary: int             # 月給（円）
     subject: str            # 担当教科
 
-    id: str = field(default_factory=lambda: uuid4().hex[:8])
+    id: str                 # 教師ID（乱数ストリームから生成する）
     experience: int = 0     # 勤続月数
     morale: float = 50.0    # 士気 (0-100)
 
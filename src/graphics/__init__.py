@@ -1,3 +1,6 @@
 from .colors import Colors, FontManager, get_font
+from .text_cache import TextCache, get_text_cache, render_text
+from .glyph_atlas import GlyphAtlas, draw_text, get_glyph_atlas, text_size
 
-__all__ = ['Colors', 'FontManager', 'get_font']
+__all__ = ['Colors', 'FontManager', 'get_font', 'TextCache', 'get_text_cache', 'render_text',
+           'GlyphAtlas', 'draw_text', 'get_glyph_atlas', 'text_size']
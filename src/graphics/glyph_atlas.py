@@ -0,0 +1,98 @@
+"""
+グリフ集 - 数字・記号・単位の文字を1文字ずつ描画しておき、数値の表示を貼り合わせで作る
+
+資金や日付のように毎フレーム変わる文字列は文字列単位のキャッシュが効かないため、
+変わる部分（数字など）はグリフの貼り合わせ、変わらない部分（見出しなど）は
+文字描画キャッシュから取り出して描く。
+"""
+from typing import Dict, Tuple
+
+import pygame
+
+from src.graphics.colors import get_font
+from src.graphics.text_cache import render_text
+
+# グリフ集に入れる文字
+GLYPH_CHARS = "0123456789,.+-/:%() 円年月日万人"
+
+
+class GlyphAtlas:
+    """1つのフォントサイズ・色のグリフ集"""
+
+    def __init__(self, size: int, color, antialias: bool = True, chars: str = GLYPH_CHARS):
+        font = get_font(size)
+        self.size = size
+        self.height = font.get_height()
+        self.glyphs: Dict[str, pygame.Surface] = {}
+        self.advances: Dict[str, int] = {}
+        for char in chars:
+            self.glyphs[char] = font.render(char, antialias, color)
+            self.advances[char] = font.size(char)[0]
+
+    def __contains__(self, char: str) -> bool:
+        return char in self.glyphs
+
+
+_atlases: Dict[Tuple[int, Tuple[int, ...], bool], GlyphAtlas] = {}
+
+
+def get_glyph_atlas(size: int, color, antialias: bool = True) -> GlyphAtlas:
+    """フォントサイズ・色ごとのグリフ集（UIで使う色は限られているので全て保持する）"""
+    key = (size, tuple(color), antialias)
+    atlas = _atlases.get(key)
+    if atlas is None:
+        atlas = _atlases[key] = GlyphAtlas(size, color, antialias)
+    return atlas
+
+
+def _layout(text: str, size: int, color, antialias: bool, x: int = 0, y: int = 0) -> Tuple[list, int, int]:
+    """
+    文字ごとの貼り付け位置を決める
+
+    Returns:
+        ([(Surface, (x, y)), ...], 右端のx座標, 高さ)
+    """
+    atlas = get_glyph_atlas(size, color, antialias)
+    glyphs = atlas.glyphs
+    advances = atlas.advances
+    blits = []
+    run_start = -1
+    for index, char in enumerate(text):
+        glyph = glyphs.get(char)
+        if glyph is None:
+            # グリフ集にない文字はまとめて文字描画キャッシュから取り出す
+            if run_start < 0:
+                run_start = index
+            continue
+        if run_start >= 0:
+            run_surface = render_text(text[run_start:index], size, color, antialias)
+            blits.append((run_surface, (x, y)))
+            x += run_surface.get_width()
+            run_start = -1
+        blits.append((glyph, (x, y)))
+        x += advances[char]
+    if run_start >= 0:
+        run_surface = render_text(text[run_start:], size, color, antialias)
+        blits.append((run_surface, (x, y)))
+        x += run_surface.get_width()
+    return blits, x, atlas.height
+
+
+def text_size(text: str, size: int, color, antialias: bool = True) -> Tuple[int, int]:
+    """draw_textで描いた時の大きさ"""
+    _, width, height = _layout(text, size, color, antialias)
+    return width, height
+
+
+def draw_text(surface: pygame.Surface, text: str, size: int, color, pos,
+              antialias: bool = True) -> pygame.Rect:
+    """
+    テキストを描画（数字などはグリフ集から、それ以外は文字描画キャッシュから貼る）
+
+    Returns:
+        描画した範囲
+    """
+    x, y = pos
+    blits, right, height = _layout(text, size, color, antialias, x, y)
+    surface.blits(blits, doreturn=False)
+    return pygame.Rect(x, y, right - x, height)
@@ -1,8 +1,14 @@
+from typing import List, Optional, Tuple
+
 import pygame
 from src.entities.school import School
 from src.entities.facility import Facility
 from src.graphics.colors import Colors
 
+# 静的レイヤーの余白（線の太さではみ出す分, px）と、何も描かない部分を埋める透過色
+_LAYER_MARGIN = 2
+_TRANSPARENT = (255, 0, 255)
+
 class MapRenderer:
     def __init__(self):
         self.tile_size = 32
@@ -19,31 +25,99 @@ class MapRenderer:
             self.map_height * self.tile_size
         )
 
+        # 背景と建設済み施設を描いた静的レイヤー（施設が増えた時だけ描き足す）
+        self._layer: Optional[pygame.Surface] = None
+        self._layer_rect = self.map_rect.inflate(_LAYER_MARGIN * 2, _LAYER_MARGIN * 2)
+        self._layer_facilities: Optional[List[Facility]] = None
+        self._layer_count = 0
+
     def draw(self, surface: pygame.Surface, school: School):
-        """マップ全体を描画"""
+        """マップ全体を描画（静的レイヤーを1回貼るだけ）"""
+        self._update_layer(school.facilities)
+        surface.blit(self._layer, self._layer_rect.topleft)
+
+    def layer_bounds(self, school: School) -> pygame.Rect:
+        """マップの描画範囲（施設の追加を反映してから返す）"""
+        self._update_layer(school.facilities)
+        return self._layer_rect
+
+    def invalidate(self) -> None:
+        """静的レイヤーを次の描画で作り直す"""
+        self._layer = None
+
+    def _update_layer(self, facilities: List[Facility]) -> None:
+        """施設の追加を反映（追加分の矩形だけ描き足し、それ以外の変化は作り直す）"""
+        added = facilities[self._layer_count:]
+        if (self._layer is None or facilities is not self._layer_facilities
+                or len(facilities) < self._layer_count
+                or not all(self._layer_rect.contains(self._facility_bounds(f)) for f in added)):
+            self._rebuild_layer(facilities)
+            return
+        for facility in added:
+            self._draw_facility(self._layer, facility)
+        self._layer_count = len(facilities)
+
+    def _rebuild_layer(self, facilities: List[Facility]) -> None:
+        # 右端・下端のグリッド線や屋根のライン、マップからはみ出た施設も元どおり描けるように
+        # マップより広く作り、何も描かない部分は透過色で埋めておく
+        layer_rect = self.map_rect.inflate(_LAYER_MARGIN * 2, _LAYER_MARGIN * 2)
+        layer_rect.unionall_ip([self._facility_bounds(f) for f in facilities])
+        layer = pygame.Surface(layer_rect.size)
+        layer.fill(_TRANSPARENT)
+        layer.set_colorkey(_TRANSPARENT)
+        self._layer = layer
+        self._layer_rect = layer_rect
+
+        ox, oy = self.offset_x - layer_rect.x, self.offset_y - layer_rect.y
+        local_rect = self.map_rect.move(-layer_rect.x, -layer_rect.y)
+
         # 1. 背景（芝生）
-        pygame.draw.rect(surface, (144, 238, 144), self.map_rect)  # 明るい緑
-        pygame.draw.rect(surface, Colors.DARK_GRAY, self.map_rect, 2) # 枠線
+        pygame.draw.rect(layer, (144, 238, 144), local_rect)  # 明るい緑
+        pygame.draw.rect(layer, Colors.DARK_GRAY, local_rect, 2) # 枠線
 
         # 2. グリッド線（薄く）
         for x in range(self.map_width + 1):
-            px = self.offset_x + x * self.tile_size
-            pygame.draw.line(surface, (120, 200, 120), (px, self.offset_y), (px, self.offset_y + self.map_rect.height))
+            px = ox + x * self.tile_size
+            pygame.draw.line(layer, (120, 200, 120), (px, oy), (px, oy + local_rect.height))
         for y in range(self.map_height + 1):
-            py = self.offset_y + y * self.tile_size
-            pygame.draw.line(surface, (120, 200, 120), (self.offset_x, py), (self.offset_x + self.map_rect.width, py))
+            py = oy + y * self.tile_size
+            pygame.draw.line(layer, (120, 200, 120), (ox, py), (ox + local_rect.width, py))
 
         # 3. 建設済み施設
-        for facility in school.facilities:
-            rect = self._get_screen_rect(facility)
-            self._draw_facility_body(surface, rect, facility.color, facility.name)
+        for facility in facilities:
+            self._draw_facility(layer, facility)
+
+        self._layer_facilities = facilities
+        self._layer_count = len(facilities)
+
+    def _draw_facility(self, layer: pygame.Surface, facility: Facility) -> None:
+        """レイヤー上に施設を描く"""
+        rect = self._get_screen_rect(facility).move(-self._layer_rect.x, -self._layer_rect.y)
+        self._draw_facility_body(layer, rect, facility.color, facility.name)
+
+    def _facility_bounds(self, facility: Facility) -> pygame.Rect:
+        """施設の描画範囲（屋根のラインの太さ分を含む）"""
+        return self._get_screen_rect(facility).inflate(_LAYER_MARGIN * 2, _LAYER_MARGIN * 2)
 
     def draw_preview(self, surface: pygame.Surface, type_id: str, mouse_pos: tuple):
         """建設プレビュー（半透明）"""
+        preview = self.preview_rect(type_id, mouse_pos)
+        if preview is None: return
+        rect, color = preview
+
+        # 半透明描画
+        s = pygame.Surface((rect.width, rect.height))
+        s.set_alpha(150)
+        s.fill(color)
+        surface.blit(s, (rect.x, rect.y))
+        pygame.draw.rect(surface, (50, 50, 50), rect, 1)
+
+    def preview_rect(self, type_id: str, mouse_pos: tuple) -> Optional[Tuple[pygame.Rect, Tuple[int, int, int]]]:
+        """建設プレビューの矩形と色（マップ外ならNone）"""
         grid_x, grid_y = self._screen_to_grid(mouse_pos)
         
         # マップ外なら描画しない
-        if grid_x < 0: return
+        if grid_x < 0: return None
 
         # 仮のFacilityを作ってサイズを取得
         temp_facility = Facility(type_id, grid_x, grid_y)
@@ -55,13 +129,7 @@ class MapRenderer:
             color = (255, 100, 100) # 赤（建設不可）
         else:
             color = (100, 255, 100) # 緑（建設可能）
-
-        # 半透明描画
-        s = pygame.Surface((rect.width, rect.height))
-        s.set_alpha(150)
-        s.fill(color)
-        surface.blit(s, (rect.x, rect.y))
-        pygame.draw.rect(surface, (50, 50, 50), rect, 1)
+        return rect, color
 
     def _draw_facility_body(self, surface, rect, color, name):
         """建物の見た目"""
@@ -0,0 +1,99 @@
+"""
+文字描画キャッシュ - font.renderの結果を使い回す（日本語のラスタライズは重いため）
+"""
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+import pygame
+
+import config
+from src.graphics.colors import get_font
+
+# (テキスト, フォントサイズ, 色, アンチエイリアス)
+TextKey = Tuple[str, int, Tuple[int, ...], bool]
+
+
+class TextCache:
+    """描画済みテキストのLRUキャッシュ（Surfaceの合計バイト数で上限を決める）"""
+
+    def __init__(self, budget_bytes: int = config.TEXT_CACHE_BUDGET_BYTES):
+        self.budget_bytes = budget_bytes
+        self.used_bytes = 0
+        self._surfaces: 'OrderedDict[TextKey, pygame.Surface]' = OrderedDict()
+
+        # 計測用カウンター
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+    def render(self, text: str, size: int, color, antialias: bool = True) -> pygame.Surface:
+        """
+        テキストを描画したSurfaceを取得（キャッシュになければ描画）
+
+        返したSurfaceは他の呼び出し元と共有するので、書き換えないこと。
+        """
+        key = (text, size, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = get_font(size).render(text, antialias, color)
+        nbytes = _surface_bytes(surface)
+        if nbytes > self.budget_bytes:
+            # 上限より大きいものはキャッシュしない
+            return surface
+
+        self._surfaces[key] = surface
+        self.used_bytes += nbytes
+        while self.used_bytes > self.budget_bytes:
+            _, evicted = self._surfaces.popitem(last=False)
+            self.used_bytes -= _surface_bytes(evicted)
+            self.evictions += 1
+        return surface
+
+    def clear(self) -> None:
+        """全て破棄（フォントを変えた場合など）"""
+        self._surfaces.clear()
+        self.used_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """ヒット・ミス回数と使用量"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self._surfaces),
+            'bytes': self.used_bytes,
+        }
+
+    def reset_stats(self) -> None:
+        """カウンターをリセット"""
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+
+def _surface_bytes(surface: pygame.Surface) -> int:
+    return surface.get_pitch() * surface.get_height()
+
+
+_text_cache: Optional[TextCache] = None
+
+
+def get_text_cache() -> TextCache:
+    """共有の文字描画キャッシュ"""
+    global _text_cache
+    if _text_cache is None:
+        _text_cache = TextCache()
+    return _text_cache
+
+
+def render_text(text: str, size: int, color, antialias: bool = True) -> pygame.Surface:
+    """グローバルヘルパー関数（get_font(size).render の代わりに使う）"""
+    return get_text_cache().render(text, size, color, antialias)
@@ -2,23 +2,25 @@
 ゲームマネージャー - ゲーム全体の状態管理
 """
 import pygame
-import random
-from typing import Optional
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Dict, List, Optional
 
 import config
+from src.core.autosave import AutosaveService
 from src.core.game_state import GameState
+from src.core.journal import ActionJournal
+from src.core import preview
+from src.core.simulation import Simulation
 from src.entities.school import School
 from src.entities.teacher import Teacher
-from src.entities.student import Student
 from src.systems.time_manager import TimeManager
 from src.systems.economy_system import EconomySystem, MonthlyReport
 from src.systems.education_system import EducationSystem
 from src.systems.enrollment_system import EnrollmentSystem
-from src.data.teacher_data import generate_random_teacher
 from src.ui.screens.title_screen import TitleScreen
 from src.ui.screens.game_screen import GameScreen
 from src.ui.dialogs.hire_dialog import HireDialog
-from src.graphics.colors import get_font
+from src.graphics.text_cache import render_text
 
 
 class GameManager:
@@ -26,6 +28,7 @@ class GameManager:
 
     def __init__(self):
         self.state: GameState = GameState.TITLE
+        self.simulation: Optional[Simulation] = None
         self.school: Optional[School] = None
         self.time_manager: Optional[TimeManager] = None
 
@@ -42,6 +45,12 @@ class GameManager:
         # 月次レポート
         self.current_report: Optional[MonthlyReport] = None
 
+        # オートセーブ（書き込みは別スレッド）
+        self.autosave: Optional[AutosaveService] = None
+
+        # 建設ダイアログの試算（別プロセス、初めて使う時に起動）
+        self.preview_executor: Optional[ProcessPoolExecutor] = None
+
     def initialize(self) -> None:
         """ゲーム初期化"""
         # タイトル画面
@@ -52,25 +61,19 @@ class GameManager:
 
     def _start_game(self) -> None:
         """ゲームを開始"""
-        # 学校初期化
-        self.school = School()
-        self.time_manager = TimeManager()
-
-        # 初期教師配置
-        for _ in range(config.INITIAL_TEACHERS):
-            teacher = generate_random_teacher()
-            self.school.hire_teacher(teacher)
-
-        # 初期生徒配置（学年バランスを考慮）
-        for _ in range(config.INITIAL_STUDENTS):
-            grade = random.randint(1, 6)
-            student = Student(grade=grade)
-            self.school.students.append(student)
-
-        # システム初期化
-        self.economy_system = EconomySystem(self.school)
-        self.education_system = EducationSystem(self.school)
-        self.enrollment_system = EnrollmentSystem(self.school)
+        # シミュレーション初期化（学校・時間・各システム）
+        self.simulation = Simulation.new_game()
+        self.simulation.journal = ActionJournal.create(config.JOURNAL_PATH, self.simulation.rng.seed)
+        self.school = self.simulation.school
+        self.time_manager = self.simulation.time_manager
+
+        # システム
+        self.economy_system = self.simulation.economy_system
+        self.education_system = self.simulation.education_system
+        self.enrollment_system = self.simulation.enrollment_system
+
+        if self.autosave is None:
+            self.autosave = AutosaveService()
 
         # ゲーム画面初期化
         self.game_screen = GameScreen(
@@ -80,6 +83,8 @@ class GameManager:
             on_fire=self._fire_teacher,
             on_promote=self._run_promotion,
             on_speed_change=self._change_speed,
+            on_build=self._build_facility,
+            on_preview_build=self._preview_builds,
         )
 
         self.state = GameState.PLAYING
@@ -94,6 +99,7 @@ class GameManager:
             school=self.school,
             on_close=self._close_hire_dialog,
             on_hire=self._hire_teacher,
+            rng=self.simulation.rng.stream('candidates'),
         )
         self.state = GameState.HIRE_DIALOG
 
@@ -104,21 +110,36 @@ class GameManager:
 
     def _hire_teacher(self, teacher: Teacher) -> None:
         """教師を雇用"""
-        self.school.hire_teacher(teacher)
+        self.simulation.hire_teacher(teacher)
 
     def _fire_teacher(self) -> None:
         """教師を解雇（最後に雇った教師）"""
         if self.school.teachers:
             teacher = self.school.teachers[-1]
-            self.school.fire_teacher(teacher)
+            self.simulation.fire_teacher(teacher.id)
 
     def _run_promotion(self) -> None:
         """宣伝実行（ポスター）"""
-        self.enrollment_system.run_promotion('poster')
+        self.simulation.run_promotion('poster')
 
     def _change_speed(self, speed: float) -> None:
         """ゲーム速度変更"""
-        self.time_manager.set_speed(speed)
+        self.simulation.set_speed(speed)
+
+    def _build_facility(self, type_id: str, grid_x: int, grid_y: int) -> bool:
+        """施設建設"""
+        return self.simulation.build_facility(type_id, grid_x, grid_y)
+
+    def _preview_builds(self) -> Dict[str, Future]:
+        """各施設を今建設した場合の試算を依頼（建設ダイアログ用、結果は別プロセスで計算）"""
+        if self.preview_executor is None:
+            self.preview_executor = ProcessPoolExecutor(max_workers=config.BUILD_PREVIEW_WORKERS)
+        options = {
+            type_id: [preview.build_action(type_id, 0, 0)]
+            for type_id in config.FACILITY_DATA
+        }
+        return preview.submit_compare(self.simulation, options, config.BUILD_PREVIEW_MONTHS,
+                                      self.preview_executor)
 
     def handle_event(self, event: pygame.event.Event) -> None:
         """イベント処理"""
@@ -155,51 +176,48 @@ class GameManager:
 
     def _update_playing(self, dt: float) -> None:
         """ゲームプレイ中の更新"""
-        # 時間経過
-        month_passed, year_passed = self.time_manager.update(dt)
-
-        # 月次処理
-        if month_passed:
-            self._process_monthly()
-
-        # 年次処理
-        if year_passed or (month_passed and self.time_manager.is_april()):
-            self._process_yearly()
+        # 時間経過（イベントスケジューラが月次・年次処理を実行）
+        for report in self.simulation.update(dt):
+            self._process_monthly(report)
 
         # 画面更新
         self.game_screen.update(dt)
 
         # ゲームオーバー判定
-        if self.school.is_bankrupt():
+        if self.simulation.is_game_over():
             self.state = GameState.GAME_OVER
 
-    def _process_monthly(self) -> None:
-        """月次処理"""
-        # 評判更新
-        self.education_system.update_reputation()
+    def _process_monthly(self, report: MonthlyReport) -> None:
+        """月次処理後の画面側の処理"""
+        self.current_report = report
+        if self.autosave:
+            self.autosave.on_month_end(self.simulation)
+
+    def shutdown(self) -> None:
+        """終了処理（オートセーブの書き込み完了を待ち、ジャーナルと試算用のプロセスを閉じる）"""
+        if self.simulation and self.simulation.journal:
+            self.simulation.journal.close(self.time_manager.absolute_day)
+        if self.autosave:
+            self.autosave.close()
+            self.autosave = None
+        if self.preview_executor:
+            self.preview_executor.shutdown(wait=False, cancel_futures=True)
+            self.preview_executor = None
+
+    def render(self, surface: pygame.Surface) -> Optional[List[pygame.Rect]]:
+        """
+        描画処理
+
+        Returns:
+            描き直した範囲（Noneなら画面全体）
+        """
+        if self.state == GameState.PLAYING and config.DIRTY_RECT_RENDERING:
+            return self.game_screen.render_dirty(surface)
+
+        if self.game_screen:
+            # オーバーレイなどで全体を描いた後は、差分描画も全体から始める
+            self.game_screen.invalidate()
 
-        # 教師月次更新
-        self.education_system.update_teachers_monthly()
-
-        # 入退学処理
-        satisfaction = self.school.satisfaction
-        self.enrollment_system.process_monthly(satisfaction)
-
-        # 経済処理
-        self.current_report = self.economy_system.process_monthly()
-
-        # 3月なら卒業処理
-        if self.time_manager.is_march():
-            self.enrollment_system.process_yearly_graduation()
-
-    def _process_yearly(self) -> None:
-        """年次処理（4月）"""
-        if self.time_manager.is_april():
-            # 新入生入学
-            self.enrollment_system.process_yearly_enrollment()
-
-    def render(self, surface: pygame.Surface) -> None:
-        """描画処理"""
         if self.state == GameState.TITLE:
             self.title_screen.render(surface)
 
@@ -221,14 +239,15 @@ class GameManager:
         elif self.state == GameState.GAME_OVER:
             self._render_game_over(surface)
 
+        return None
+
     def _render_pause_overlay(self, surface: pygame.Surface) -> None:
         """一時停止オーバーレイ"""
         overlay = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT), pygame.SRCALPHA)
         overlay.fill((0, 0, 0, 100))
         surface.blit(overlay, (0, 0))
 
-        font = get_font(config.FONT_SIZE_HUGE)
-        text = font.render("一時停止", True, (255, 255, 255))
+        text = render_text("一時停止", config.FONT_SIZE_HUGE, (255, 255, 255))
         text_rect = text.get_rect(center=(config.SCREEN_WIDTH // 2, config.SCREEN_HEIGHT // 2))
         surface.blit(text, text_rect)
 
@@ -251,12 +270,10 @@ class GameManager:
         pygame.draw.rect(surface, (50, 50, 60), (panel_x, panel_y, panel_width, panel_height))
         pygame.draw.rect(surface, (100, 100, 110), (panel_x, panel_y, panel_width, panel_height), 2)
 
-        font = get_font(config.FONT_SIZE_NORMAL)
-        title_font = get_font(config.FONT_SIZE_LARGE)
         y = panel_y + 20
 
         # タイトル
-        title = title_font.render(f"月次レポート - {self.time_manager.month_string}", True, (255, 255, 255))
+        title = render_text(f"月次レポート - {self.time_manager.month_string}", config.FONT_SIZE_LARGE, (255, 255, 255))
         surface.blit(title, (panel_x + 20, y))
         y += 45
 
@@ -272,7 +289,7 @@ class GameManager:
         ]
 
         for text, color in lines:
-            line_surface = font.render(text, True, color)
+            line_surface = render_text(text, config.FONT_SIZE_NORMAL, color)
             surface.blit(line_surface, (panel_x + 20, y))
             y += 28
 
@@ -280,16 +297,15 @@ class GameManager:
         # 収支
         balance_color = (100, 200, 100) if report.balance >= 0 else (200, 100, 100)
         balance_sign = "+" if report.balance >= 0 else ""
-        balance_text = font.render(f"収支: {balance_sign}{report.balance:,}円", True, balance_color)
+        balance_text = render_text(f"収支: {balance_sign}{report.balance:,}円", config.FONT_SIZE_NORMAL, balance_color)
         surface.blit(balance_text, (panel_x + 20, y))
 
         y += 35
-        total_text = font.render(f"総資金: {report.total_money:,}円", True, (255, 255, 255))
+        total_text = render_text(f"総資金: {report.total_money:,}円", config.FONT_SIZE_NORMAL, (255, 255, 255))
         surface.blit(total_text, (panel_x + 20, y))
 
         # クリックで閉じる指示
-        hint_font = get_font(config.FONT_SIZE_SMALL)
-        hint = hint_font.render("クリックで続行", True, (150, 150, 150))
+        hint = render_text("クリックで続行", config.FONT_SIZE_SMALL, (150, 150, 150))
         hint_rect = hint.get_rect(center=(panel_x + panel_width // 2, panel_y + panel_height - 25))
         surface.blit(hint, hint_rect)
 
@@ -297,17 +313,14 @@ class GameManager:
         """ゲームオーバー画面"""
         surface.fill((30, 30, 40))
 
-        font = get_font(config.FONT_SIZE_HUGE)
-        text = font.render("ゲームオーバー", True, (200, 100, 100))
+        text = render_text("ゲームオーバー", config.FONT_SIZE_HUGE, (200, 100, 100))
         text_rect = text.get_rect(center=(config.SCREEN_WIDTH // 2, config.SCREEN_HEIGHT // 2 - 50))
         surface.blit(text, text_rect)
 
-        sub_font = get_font(config.FONT_SIZE_LARGE)
-        sub_text = sub_font.render("学校が破産しました", True, (200, 200, 200))
+        sub_text = render_text("学校が破産しました", config.FONT_SIZE_LARGE, (200, 200, 200))
         sub_rect = sub_text.get_rect(center=(config.SCREEN_WIDTH // 2, config.SCREEN_HEIGHT // 2 + 30))
         surface.blit(sub_text, sub_rect)
 
-        hint_font = get_font(config.FONT_SIZE_NORMAL)
-        hint = hint_font.render("ESCキーで終了", True, (150, 150, 150))
+        hint = render_text("ESCキーで終了", config.FONT_SIZE_NORMAL, (150, 150, 150))
         hint_rect = hint.get_rect(center=(config.SCREEN_WIDTH // 2, config.SCREEN_HEIGHT // 2 + 90))
         surface.blit(hint, hint_rect)
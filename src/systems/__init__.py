@@ -2,5 +2,7 @@ from .time_manager import TimeManager
 from .economy_system import EconomySystem
 from .education_system import EducationSystem
 from .enrollment_system import EnrollmentSystem
+from .kpi_store import KPIStore
+from .ledger import Ledger
 
-__all__ = ['TimeManager', 'EconomySystem', 'EducationSystem', 'EnrollmentSystem']
+__all__ = ['TimeManager', 'EconomySystem', 'EducationSystem', 'EnrollmentSystem', 'KPIStore', 'Ledger']
@@ -2,7 +2,13 @@
 経済システム - 収入・支出の計算と処理
 """
 from dataclasses import dataclass, field
-from typing import List, TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING
+
+from src.systems.kpi_store import KPIStore
+from src.systems.ledger import (
+    ACCOUNT_FACILITY_MAINTENANCE, ACCOUNT_FIXED_COST, ACCOUNT_MATERIAL, ACCOUNT_OTHER_EXPENSE,
+    ACCOUNT_SUBSIDY, ACCOUNT_TEACHER_SALARY, ACCOUNT_TUITION,
+)
 
 if TYPE_CHECKING:
     from src.entities.school import School
@@ -30,10 +36,15 @@ class EconomySystem:
 
     def __init__(self, school: 'School'):
         self.school = school
-        self.monthly_reports: List[MonthlyReport] = []
+        self.history = KPIStore()
+
+    def process_monthly(self, month_index: Optional[int] = None) -> MonthlyReport:
+        """
+        月次経済処理を実行し、レポートを返す
 
-    def process_monthly(self) -> MonthlyReport:
-        """月次経済処理を実行し、レポートを返す"""
+        Args:
+            month_index: 履歴に記録する通算月数（Noneなら前回の次の月）
+        """
         import config
 
         # 収入計算
@@ -47,15 +58,21 @@ class EconomySystem:
         income = tuition + subsidy
 
         # 支出計算
-        teacher_salary = sum(t.salary for t in self.school.teachers)
-        facility_maintenance = self.school.capacity * config.CAPACITY_MAINTENANCE_RATE
+        teacher_salary = self.school.teacher_salary_total
+        facility_maintenance = self.school.maintenance_total
         material_cost = student_count * config.MATERIAL_COST_PER_STUDENT
         fixed_cost = config.FIXED_MONTHLY_COST
         expense = teacher_salary + facility_maintenance + material_cost + fixed_cost
 
-        # 収支を反映
+        # 収支を反映（科目ごとに記帳）
         balance = income - expense
-        self.school.money += balance
+        school = self.school
+        school.receive(tuition, ACCOUNT_TUITION)
+        school.receive(subsidy, ACCOUNT_SUBSIDY)
+        school.charge(teacher_salary, ACCOUNT_TEACHER_SALARY)
+        school.charge(facility_maintenance, ACCOUNT_FACILITY_MAINTENANCE)
+        school.charge(material_cost, ACCOUNT_MATERIAL)
+        school.charge(fixed_cost, ACCOUNT_FIXED_COST)
 
         # レポート作成
         report = MonthlyReport(
@@ -71,25 +88,38 @@ class EconomySystem:
             subsidy_income=subsidy,
         )
 
-        self.monthly_reports.append(report)
-
-        # 履歴は最大24ヶ月分保持
-        if len(self.monthly_reports) > 24:
-            self.monthly_reports.pop(0)
+        self._record_history(report, month_index)
 
         return report
 
+    def _record_history(self, report: MonthlyReport, month_index: Optional[int]) -> None:
+        """KPI履歴に記録"""
+        if month_index is None:
+            last_month = self.history.last_month
+            month_index = 0 if last_month is None else last_month + 1
+        school = self.school
+        self.history.record(
+            month_index,
+            money=report.total_money,
+            income=report.income,
+            expense=report.expense,
+            balance=report.balance,
+            reputation=school.reputation,
+            education=school.education_quality,
+            satisfaction=school.satisfaction,
+            students=school.student_count,
+            teachers=len(school.teachers),
+            promotion_effect=school.promotion_effect,
+        )
+
     def get_average_balance(self, months: int = 6) -> float:
         """直近N ヶ月の平均収支"""
-        if not self.monthly_reports:
-            return 0.0
-        recent = self.monthly_reports[-months:]
-        return sum(r.balance for r in recent) / len(recent)
+        return self.history.rolling_mean('balance', months)
 
     def can_afford(self, cost: int) -> bool:
         """支払い可能かチェック"""
         return self.school.can_afford(cost)
 
-    def spend(self, amount: int, description: str = "") -> bool:
-        """支出処理"""
-        return self.school.spend(amount)
+    def spend(self, amount: int, description: str = "", *, account: str = ACCOUNT_OTHER_EXPENSE) -> bool:
+        """支出処理（accountは帳簿の科目）"""
+        return self.school.spend(amount, account)
@@ -57,15 +57,17 @@ class EducationSystem:
 
         # 範囲制限
         self.school.reputation = max(0, min(100, new_reputation))
-        self.school.invalidate_cache()
 
         return self.school.reputation
 
     def update_teachers_monthly(self) -> None:
         """教師の月次更新"""
+        skill_gain = 0
         for teacher in self.school.teachers:
+            skill_before = teacher.skill
             teacher.update_monthly()
-        self.school.invalidate_cache()
+            skill_gain += teacher.skill - skill_before
+        self.school.add_teacher_skill(skill_gain)
 
     def get_teacher_student_ratio(self) -> float:
         """教師一人あたりの生徒数"""
@@ -2,12 +2,11 @@
 入退学システム - 生徒の入学・退学・卒業処理
 """
 from dataclasses import dataclass
-from typing import List, TYPE_CHECKING
-import random
-import math
+from typing import Optional, TYPE_CHECKING
 
 import config
-from src.entities.student import Student
+from src.core.rng import RandomStream
+from src.systems.ledger import ACCOUNT_PROMOTION
 
 if TYPE_CHECKING:
     from src.entities.school import School
@@ -25,8 +24,9 @@ class EnrollmentReport:
 class EnrollmentSystem:
     """入学・退学管理システム"""
 
-    def __init__(self, school: 'School'):
+    def __init__(self, school: 'School', rng: Optional[RandomStream] = None):
         self.school = school
+        self.rng = rng or RandomStream()
 
     def process_monthly_dropouts(self, satisfaction: float) -> int:
         """
@@ -35,16 +35,10 @@ class EnrollmentSystem:
         Returns:
             退学者数
         """
-        dropouts = 0
-
-        # 退学判定（リストのコピーを作成して反復）
-        for student in self.school.students[:]:
-            if student.will_dropout(satisfaction):
-                self.school.remove_student(student)
-                dropouts += 1
-            else:
-                # 月次更新
-                student.update_monthly(satisfaction)
+        # 退学判定と月次更新（名簿全体をまとめて処理）
+        dropouts = self.school.students.process_monthly(satisfaction, self.rng.generator)
+        if dropouts:
+            self.school.mark_changed('students')
 
         return dropouts
 
@@ -61,17 +55,8 @@ class EnrollmentSystem:
         Returns:
             (卒業者数, 進級者数)
         """
-        graduates = 0
-        advanced = 0
-
-        # 卒業・進級判定（リストのコピーを作成）
-        for student in self.school.students[:]:
-            if student.should_graduate():
-                self.school.remove_student(student)
-                graduates += 1
-            else:
-                student.advance_grade()
-                advanced += 1
+        graduates, advanced = self.school.students.process_graduation(self.rng.generator)
+        self.school.mark_changed('students')
 
         return graduates, advanced
 
@@ -82,15 +67,11 @@ class EnrollmentSystem:
         Returns:
             入学者数
         """
-        reputation = self.school.reputation
-        promotion = self.school.promotion_effect
         capacity = self.school.capacity
         current_students = self.school.student_count
 
         # 応募者数計算
-        base_applicants = config.BASE_APPLICANTS + reputation * config.APPLICANTS_PER_REPUTATION
-        promotion_bonus = base_applicants * (promotion / 100) * config.PROMOTION_BONUS_RATE
-        total_applicants = int(base_applicants + promotion_bonus)
+        total_applicants = self.school.projected_applicants
 
         # 空きキャパシティを超えない
         available = capacity - current_students
@@ -98,11 +79,7 @@ class EnrollmentSystem:
         new_students = max(0, new_students)
 
         # 新入生を追加（中1 = grade 1）
-        for _ in range(new_students):
-            student = Student(grade=1)
-            self.school.add_student(student)
-
-        return new_students
+        return self.school.add_students(new_students, grade=1, rng=self.rng.generator)
 
     def run_promotion(self, promotion_type: str) -> bool:
         """
@@ -124,7 +101,7 @@ class EnrollmentSystem:
         if not self.school.can_afford(cost):
             return False
 
-        self.school.spend(cost)
+        self.school.spend(cost, ACCOUNT_PROMOTION)
 
         # 効果は加算（ただし100が上限）
         self.school.promotion_effect = min(100, self.school.promotion_effect + effect)
@@ -145,10 +122,4 @@ class EnrollmentSystem:
 
     def get_projected_applicants(self) -> int:
         """次年度の予想応募者数"""
-        reputation = self.school.reputation
-        promotion = self.school.promotion_effect
-
-        base = config.BASE_APPLICANTS + reputation * config.APPLICANTS_PER_REPUTATION
-        bonus = base * (promotion / 100) * config.PROMOTION_BONUS_RATE
-
-        return int(base + bonus)
+        return self.school.projected_applicants
@@ -0,0 +1,108 @@
+"""
+イベントスケジューラ - ゲーム内日付順に処理を実行する優先度付きキュー
+"""
+import heapq
+import itertools
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional
+
+# コールバックは発生日（通算日数）を受け取る
+EventCallback = Callable[[int], None]
+
+
+@dataclass(order=True)
+class ScheduledEvent:
+    """予定されたイベント"""
+    day: int                    # 発生日（TimeManager.absolute_day と同じ通算日数）
+    priority: int               # 同じ日の実行順（小さいほど先）
+    sequence: int               # 登録順（同順位の並びを安定させる）
+    name: str = field(compare=False)
+    callback: EventCallback = field(compare=False, repr=False)
+    interval: Optional[int] = field(default=None, compare=False)   # 繰り返し間隔（日数）
+    cancelled: bool = field(default=False, compare=False)
+
+
+class EventScheduler:
+    """発生日順にイベントを実行するスケジューラ（ヒープで管理）"""
+
+    def __init__(self):
+        self._queue: List[ScheduledEvent] = []
+        self._sequence = itertools.count()
+
+    def __len__(self) -> int:
+        return sum(1 for event in self._queue if not event.cancelled)
+
+    def schedule(
+        self,
+        day: int,
+        callback: EventCallback,
+        name: str = "",
+        priority: int = 0,
+        interval: Optional[int] = None,
+    ) -> ScheduledEvent:
+        """
+        イベントを登録
+
+        Args:
+            day: 発生日（通算日数）
+            callback: 発生時に呼ぶ関数（発生日を受け取る）
+            name: イベント名（デバッグ・保存用）
+            priority: 同じ日の実行順（小さいほど先）
+            interval: 繰り返し間隔（日数、Noneなら1回のみ）
+        """
+        event = ScheduledEvent(day, priority, next(self._sequence), name, callback, interval)
+        heapq.heappush(self._queue, event)
+        return event
+
+    def cancel(self, event: ScheduledEvent) -> None:
+        """イベントを取り消す（キューからは実行時に取り除く）"""
+        event.cancelled = True
+
+    def cancel_by_name(self, name: str) -> int:
+        """名前が一致するイベントを全て取り消す"""
+        cancelled = 0
+        for event in self._queue:
+            if event.name == name and not event.cancelled:
+                event.cancelled = True
+                cancelled += 1
+        return cancelled
+
+    def events(self) -> List[ScheduledEvent]:
+        """取り消されていないイベントの一覧（発生順）"""
+        return sorted(event for event in self._queue if not event.cancelled)
+
+    def next_day(self) -> Optional[int]:
+        """次のイベントの発生日"""
+        self._drop_cancelled()
+        return self._queue[0].day if self._queue else None
+
+    def run_day(self, day: int) -> int:
+        """
+        指定日までに発生する全イベントを実行
+
+        Returns:
+            実行したイベント数
+        """
+        executed = 0
+        while True:
+            self._drop_cancelled()
+            if not self._queue or self._queue[0].day > day:
+                return executed
+
+            event = heapq.heappop(self._queue)
+            event_day = event.day
+            if event.interval is not None:
+                # 繰り返しイベントは同じオブジェクトを次回の日付で再登録（取り消しが効くように）
+                event.day += event.interval
+                event.sequence = next(self._sequence)
+                heapq.heappush(self._queue, event)
+            event.callback(event_day)
+            executed += 1
+
+    def clear(self) -> None:
+        """全イベントを削除"""
+        self._queue.clear()
+
+    def _drop_cancelled(self) -> None:
+        while self._queue and self._queue[0].cancelled:
+            heapq.heappop(self._queue)
@@ -0,0 +1,227 @@
+"""
+KPI履歴 - 指標ごとのNumPy配列に月次の値を記録し、古い期間は粗い粒度で保持する
+
+粒度（段）:
+    monthly   : 毎月（直近5年分）
+    quarterly : 四半期（直近50年分）
+    yearly    : 年（全期間）
+ストック量（資金・評判など）は期間の最後の値、フロー量（収入・収支など）は期間の平均を残す。
+"""
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# 記録する指標と、粗い段での集計方法（True: 期間の最後の値, False: 期間の平均）
+METRICS: Tuple[Tuple[str, bool], ...] = (
+    ('money', True),
+    ('income', False),
+    ('expense', False),
+    ('balance', False),
+    ('reputation', True),
+    ('education', True),
+    ('satisfaction', True),
+    ('students', True),
+    ('teachers', True),
+    ('promotion_effect', True),
+)
+METRIC_NAMES = tuple(name for name, _ in METRICS)
+
+# (段の名前, 1サンプルあたりの月数, 保持するサンプル数（Noneなら無制限）)
+TIERS: Tuple[Tuple[str, int, Optional[int]], ...] = (
+    ('monthly', 1, 60),
+    ('quarterly', 3, 200),
+    ('yearly', 12, None),
+)
+
+
+class _Tier:
+    """1つの粒度のリングバッファ（capacityがNoneなら伸長する配列）"""
+
+    def __init__(self, name: str, period: int, capacity: Optional[int], metric_count: int):
+        self.name = name
+        self.period = period
+        self.capacity = capacity
+        size = capacity or 16
+        self.months = np.zeros(size, dtype=np.int32)
+        self.values = np.zeros((size, metric_count), dtype=np.float64)
+        self.start = 0
+        self.count = 0
+
+    def push(self, month_index: int, row: np.ndarray) -> None:
+        size = len(self.months)
+        if self.count < size:
+            position = (self.start + self.count) % size
+            self.count += 1
+        elif self.capacity is None:
+            self.months = np.resize(self.months, size * 2)
+            self.values = np.resize(self.values, (size * 2, self.values.shape[1]))
+            position = self.count
+            self.count += 1
+        else:
+            # 満杯なら最も古いサンプルを上書き
+            position = self.start
+            self.start = (self.start + 1) % size
+        self.months[position] = month_index
+        self.values[position] = row
+
+    def order(self) -> np.ndarray:
+        """古い順のインデックス"""
+        return (self.start + np.arange(self.count)) % len(self.months)
+
+
+class KPIStore:
+    """月次KPIの履歴（指標ごとの列で保持）"""
+
+    def __init__(self, tiers: Sequence[Tuple[str, int, Optional[int]]] = TIERS):
+        """
+        Args:
+            tiers: 細かい順の段の定義（最初の段は毎月・保持数ありにすること）
+        """
+        metric_count = len(METRICS)
+        self._is_stock = np.array([stock for _, stock in METRICS])
+        self._columns = {name: index for index, name in enumerate(METRIC_NAMES)}
+        self._tiers = {name: _Tier(name, period, capacity, metric_count)
+                       for name, period, capacity in tiers}
+        self._base = self._tiers[tiers[0][0]]
+
+        # 粗い段の集計途中の値
+        self._pending = {
+            name: {'bucket': None, 'sum': np.zeros(metric_count), 'last': np.zeros(metric_count), 'count': 0}
+            for name, period, _ in tiers if period > 1
+        }
+
+        # 移動集計用の累積和（最初の段の保持数+1 のリング）
+        self._prefix = np.zeros((self._base.capacity + 1, metric_count))
+        self._recorded = 0
+
+    def __len__(self) -> int:
+        """これまでに記録した月数"""
+        return self._recorded
+
+    @property
+    def tier_names(self) -> List[str]:
+        return list(self._tiers)
+
+    @property
+    def last_month(self) -> Optional[int]:
+        """最後に記録した通算月数"""
+        base = self._base
+        if base.count == 0:
+            return None
+        return int(base.months[(base.start + base.count - 1) % len(base.months)])
+
+    def record(self, month_index: int, **values: float) -> None:
+        """
+        1ヶ月分の値を記録
+
+        Args:
+            month_index: 通算月数
+            **values: 指標名 → 値（METRICSの全指標）
+        """
+        row = np.array([values[name] for name in METRIC_NAMES], dtype=np.float64)
+
+        self._push_base(month_index, row)
+
+        for name, pending in self._pending.items():
+            tier = self._tiers[name]
+            bucket = month_index // tier.period
+            if pending['count'] and bucket != pending['bucket']:
+                self._flush(tier, pending)
+            pending['bucket'] = bucket
+            pending['sum'] += row
+            pending['last'] = row
+            pending['count'] += 1
+            if (month_index + 1) % tier.period == 0:
+                self._flush(tier, pending)
+
+    def _push_base(self, month_index: int, row: np.ndarray) -> None:
+        self._base.push(month_index, row)
+        size = len(self._prefix)
+        self._prefix[(self._recorded + 1) % size] = self._prefix[self._recorded % size] + row
+        self._recorded += 1
+
+    def _flush(self, tier: _Tier, pending: dict) -> None:
+        aggregated = np.where(self._is_stock, pending['last'], pending['sum'] / pending['count'])
+        tier.push(pending['bucket'] * tier.period, aggregated)
+        pending['sum'] = np.zeros_like(pending['sum'])
+        pending['count'] = 0
+
+    # === 参照 ===
+    def series(self, metric: str, tier: str = 'monthly') -> Tuple[np.ndarray, np.ndarray]:
+        """
+        指標の推移（古い順）
+
+        Returns:
+            (通算月数の配列, 値の配列)
+        """
+        data = self._tiers[tier]
+        order = data.order()
+        return data.months[order], data.values[order, self._columns[metric]]
+
+    def latest(self, metric: str) -> Optional[float]:
+        """最新の値"""
+        base = self._base
+        if base.count == 0:
+            return None
+        position = (base.start + base.count - 1) % len(base.months)
+        return float(base.values[position, self._columns[metric]])
+
+    def rolling_sum(self, metric: str, window: int) -> float:
+        """直近window ヶ月の合計（記録が少なければある分だけ、O(1)）"""
+        window = min(window, self._base.count)
+        if window <= 0:
+            return 0.0
+        size = len(self._prefix)
+        column = self._columns[metric]
+        return float(self._prefix[self._recorded % size, column]
+                     - self._prefix[(self._recorded - window) % size, column])
+
+    def rolling_mean(self, metric: str, window: int) -> float:
+        """直近window ヶ月の平均（記録が少なければある分だけ、O(1)）"""
+        window = min(window, self._base.count)
+        if window <= 0:
+            return 0.0
+        return self.rolling_sum(metric, window) / window
+
+    # === 保存・復元 ===
+    def get_state(self) -> dict:
+        """保存用の状態（配列はコピー）"""
+        tiers = {}
+        for name, tier in self._tiers.items():
+            order = tier.order()
+            tiers[name] = {'months': tier.months[order], 'values': tier.values[order]}
+        pending = {
+            name: {'bucket': -1 if state['bucket'] is None else state['bucket'],
+                   'sum': state['sum'].copy(), 'last': np.array(state['last']), 'count': state['count']}
+            for name, state in self._pending.items()
+        }
+        return {'metrics': METRIC_NAMES, 'recorded': self._recorded, 'tiers': tiers, 'pending': pending}
+
+    @classmethod
+    def from_state(cls, state: dict) -> 'KPIStore':
+        """get_stateで取得した状態から復元（指標の構成が違う場合は空の履歴）"""
+        store = cls()
+        if tuple(state['metrics']) != METRIC_NAMES:
+            return store
+
+        # 累積和は保持している分から作り直す（記録数の位置をそろえる）
+        base_rows = state['tiers'][store._base.name]
+        store._recorded = state['recorded'] - len(base_rows['months'])
+        for month_index, row in zip(base_rows['months'], base_rows['values']):
+            store._push_base(int(month_index), row)
+
+        for name, rows in state['tiers'].items():
+            if name == store._base.name or name not in store._tiers:
+                continue
+            for month_index, row in zip(rows['months'], rows['values']):
+                store._tiers[name].push(int(month_index), row)
+
+        for name, pending in state['pending'].items():
+            if name in store._pending:
+                store._pending[name] = {
+                    'bucket': None if pending['bucket'] < 0 else pending['bucket'],
+                    'sum': np.array(pending['sum'], dtype=np.float64),
+                    'last': np.array(pending['last'], dtype=np.float64),
+                    'count': pending['count'],
+                }
+        return store
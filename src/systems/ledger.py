@@ -0,0 +1,229 @@
+"""
+会計帳簿 - 資金の出入りを複式で記録する追記専用の仕訳帳
+
+仕訳は (通算日, 借方勘定, 貸方勘定, 金額) の固定長レコードとしてNumPy配列に追記する。
+勘定ごとの借方・貸方の合計を持つので残高はO(1)、勘定ごとの累計の列を持つので
+期間を指定した集計は二分探索でO(log n)で求められる。
+全勘定の残高（借方 - 貸方）の合計は常に0で、現金勘定の残高は学校の資金と一致する。
+"""
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+# 勘定の種類
+KIND_ASSET = 'asset'
+KIND_EQUITY = 'equity'
+KIND_INCOME = 'income'
+KIND_EXPENSE = 'expense'
+
+ACCOUNT_CASH = 'cash'
+ACCOUNT_CAPITAL = 'capital'
+ACCOUNT_TUITION = 'tuition'
+ACCOUNT_SUBSIDY = 'subsidy'
+ACCOUNT_OTHER_INCOME = 'other_income'
+ACCOUNT_TEACHER_SALARY = 'teacher_salary'
+ACCOUNT_FACILITY_MAINTENANCE = 'facility_maintenance'
+ACCOUNT_MATERIAL = 'material'
+ACCOUNT_FIXED_COST = 'fixed_cost'
+ACCOUNT_FACILITY_PURCHASE = 'facility_purchase'
+ACCOUNT_PROMOTION = 'promotion'
+ACCOUNT_OTHER_EXPENSE = 'other_expense'
+
+# (勘定, 表示名, 種類) ― 並び順が配列上の勘定番号になる
+ACCOUNTS: Tuple[Tuple[str, str, str], ...] = (
+    (ACCOUNT_CASH, '現金', KIND_ASSET),
+    (ACCOUNT_CAPITAL, '元入金', KIND_EQUITY),
+    (ACCOUNT_TUITION, '授業料', KIND_INCOME),
+    (ACCOUNT_SUBSIDY, '補助金', KIND_INCOME),
+    (ACCOUNT_OTHER_INCOME, 'その他収入', KIND_INCOME),
+    (ACCOUNT_TEACHER_SALARY, '教師給与', KIND_EXPENSE),
+    (ACCOUNT_FACILITY_MAINTENANCE, '施設維持費', KIND_EXPENSE),
+    (ACCOUNT_MATERIAL, '教材費', KIND_EXPENSE),
+    (ACCOUNT_FIXED_COST, '固定費', KIND_EXPENSE),
+    (ACCOUNT_FACILITY_PURCHASE, '施設建設', KIND_EXPENSE),
+    (ACCOUNT_PROMOTION, '宣伝費', KIND_EXPENSE),
+    (ACCOUNT_OTHER_EXPENSE, 'その他支出', KIND_EXPENSE),
+)
+ACCOUNT_NAMES = tuple(name for name, _, _ in ACCOUNTS)
+ACCOUNT_LABELS = {name: label for name, label, _ in ACCOUNTS}
+ACCOUNT_KINDS = {name: kind for name, _, kind in ACCOUNTS}
+
+ENTRY_DTYPE = np.dtype([
+    ('day', '<i4'),
+    ('debit', 'u1'),
+    ('credit', 'u1'),
+    ('amount', '<i8'),
+])
+
+_CODES = {name: code for code, name in enumerate(ACCOUNT_NAMES)}
+_CASH = _CODES[ACCOUNT_CASH]
+
+
+def _code(account: str) -> int:
+    """勘定番号（未知の勘定はValueError）"""
+    code = _CODES.get(account)
+    if code is None:
+        raise ValueError(f"不明な勘定です: {account!r}")
+    return code
+
+
+class _AccountIndex:
+    """1つの勘定の累計（通算日と、その仕訳までの借方 - 貸方）"""
+
+    def __init__(self, days: Optional[np.ndarray] = None, running: Optional[np.ndarray] = None):
+        if days is None:
+            self.days = np.zeros(16, dtype=np.int32)
+            self.running = np.zeros(16, dtype=np.int64)
+            self.count = 0
+        else:
+            self.count = len(days)
+            size = max(16, self.count)
+            self.days = np.zeros(size, dtype=np.int32)
+            self.running = np.zeros(size, dtype=np.int64)
+            self.days[:self.count] = days
+            self.running[:self.count] = running
+
+    @property
+    def total(self) -> int:
+        return int(self.running[self.count - 1]) if self.count else 0
+
+    def append(self, day: int, delta: int) -> None:
+        if self.count == len(self.days):
+            self.days = np.resize(self.days, self.count * 2)
+            self.running = np.resize(self.running, self.count * 2)
+        self.days[self.count] = day
+        self.running[self.count] = self.total + delta
+        self.count += 1
+
+    def total_before(self, day: int) -> int:
+        """指定した通算日より前の累計"""
+        position = int(np.searchsorted(self.days[:self.count], day, side='left'))
+        return int(self.running[position - 1]) if position else 0
+
+
+class Ledger:
+    """資金の仕訳帳（追記のみ）"""
+
+    def __init__(self, opening_balance: int = 0, clock: Optional[Callable[[], int]] = None):
+        """
+        Args:
+            opening_balance: 開始時の資金（元入金として記帳）
+            clock: 現在の通算日を返す関数（Noneなら常に0日目）
+        """
+        self.clock = clock
+        self._entries = np.zeros(64, dtype=ENTRY_DTYPE)
+        self._count = 0
+        self._accounts = [_AccountIndex() for _ in ACCOUNT_NAMES]
+        if opening_balance:
+            self.post(ACCOUNT_CAPITAL, opening_balance)
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def entries(self) -> np.ndarray:
+        """記帳済みの仕訳（古い順、読み取り専用のビュー）"""
+        view = self._entries[:self._count]
+        view.flags.writeable = False
+        return view
+
+    @property
+    def cash(self) -> int:
+        """現金勘定の残高"""
+        return self._accounts[_CASH].total
+
+    # === 記帳 ===
+    def post(self, account: str, amount: int) -> None:
+        """
+        現金の増減を記帳（相手勘定はaccount）
+
+        Args:
+            account: 相手勘定（収入・支出の科目）
+            amount: 現金の増減（正: 入金、負: 出金、0なら記帳しない）
+        """
+        _code(account)
+        amount = int(amount)
+        if amount > 0:
+            self.transfer(ACCOUNT_CASH, account, amount)
+        elif amount < 0:
+            self.transfer(account, ACCOUNT_CASH, -amount)
+
+    def transfer(self, debit: str, credit: str, amount: int) -> None:
+        """借方・貸方を指定して記帳"""
+        if amount < 0:
+            raise ValueError(f"金額は0以上にしてください: {amount}")
+        debit_code = _code(debit)
+        credit_code = _code(credit)
+        day = self.clock() if self.clock is not None else 0
+
+        if self._count == len(self._entries):
+            self._entries = np.resize(self._entries, self._count * 2)
+        self._entries[self._count] = (day, debit_code, credit_code, amount)
+        self._count += 1
+
+        self._accounts[debit_code].append(day, amount)
+        self._accounts[credit_code].append(day, -amount)
+
+    # === 集計 ===
+    def balance(self, account: str) -> int:
+        """勘定の残高（借方 - 貸方、O(1)）"""
+        return self._accounts[_code(account)].total
+
+    def total(self, account: str, start_day: Optional[int] = None, end_day: Optional[int] = None) -> int:
+        """
+        勘定の期間合計（収入は受け取った額、支出は支払った額を正で返す、O(log n)）
+
+        Args:
+            start_day: 集計開始の通算日（この日を含む、Noneなら最初から）
+            end_day: 集計終了の通算日（この日を含まない、Noneなら最後まで）
+        """
+        index = self._accounts[_code(account)]
+        end = index.total if end_day is None else index.total_before(end_day)
+        start = 0 if start_day is None else index.total_before(start_day)
+        amount = end - start
+        return -amount if ACCOUNT_KINDS[account] in (KIND_INCOME, KIND_EQUITY) else amount
+
+    def totals(self, kind: Optional[str] = None, start_day: Optional[int] = None,
+               end_day: Optional[int] = None) -> Dict[str, int]:
+        """勘定ごとの期間合計（kindで収入・支出などに絞り込む）"""
+        return {
+            name: self.total(name, start_day, end_day)
+            for name, _, account_kind in ACCOUNTS
+            if name != ACCOUNT_CASH and (kind is None or account_kind == kind)
+        }
+
+    def spending_by_category(self, start_day: Optional[int] = None,
+                             end_day: Optional[int] = None) -> Dict[str, int]:
+        """科目別の支出"""
+        return self.totals(KIND_EXPENSE, start_day, end_day)
+
+    def income_by_category(self, start_day: Optional[int] = None,
+                           end_day: Optional[int] = None) -> Dict[str, int]:
+        """科目別の収入"""
+        return self.totals(KIND_INCOME, start_day, end_day)
+
+    def entries_between(self, start_day: int, end_day: int) -> np.ndarray:
+        """期間内の仕訳（start_day以上end_day未満）"""
+        days = self._entries['day'][:self._count]
+        start, end = np.searchsorted(days, (start_day, end_day), side='left')
+        return self.entries[start:end]
+
+    # === 保存・復元 ===
+    @classmethod
+    def from_entries(cls, entries: np.ndarray, clock: Optional[Callable[[], int]] = None) -> 'Ledger':
+        """仕訳の配列から復元（勘定ごとの累計はまとめて計算し直す）"""
+        ledger = cls(clock=clock)
+        count = len(entries)
+        ledger._entries = np.zeros(max(64, count), dtype=ENTRY_DTYPE)
+        ledger._entries[:count] = entries
+        ledger._count = count
+
+        days = ledger._entries['day'][:count]
+        debit = ledger._entries['debit'][:count]
+        credit = ledger._entries['credit'][:count]
+        amount = ledger._entries['amount'][:count]
+        for code in range(len(ACCOUNT_NAMES)):
+            mask = (debit == code) | (credit == code)
+            delta = np.where(debit[mask] == code, amount[mask], -amount[mask])
+            ledger._accounts[code] = _AccountIndex(days[mask], np.cumsum(delta))
+        return ledger
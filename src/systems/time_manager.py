@@ -2,7 +2,8 @@
 時間管理システム
 """
 from dataclasses import dataclass, field
-from typing import Tuple
+from typing import List, Tuple
+import math
 
 import config
 
@@ -30,6 +31,22 @@ class TimeManager:
         """年月文字列"""
         return f"{self.year}年{self.month}月"
 
+    @property
+    def absolute_day(self) -> int:
+        """暦の起点（0年1月1日）からの通算日数"""
+        return self.month_index * config.DAYS_PER_MONTH + (self.day - 1)
+
+    @property
+    def month_index(self) -> int:
+        """暦の起点からの通算月数"""
+        return self.year * config.MONTHS_PER_YEAR + (self.month - 1)
+
+    @staticmethod
+    def month_from_index(month_index: int) -> Tuple[int, int]:
+        """通算月数を(年, 月)に変換"""
+        year, month = divmod(month_index, config.MONTHS_PER_YEAR)
+        return year, month + 1
+
     def update(self, dt: float) -> Tuple[bool, bool]:
         """
         時間を更新
@@ -40,33 +57,76 @@ class TimeManager:
         Returns:
             (月が変わったか, 年が変わったか)
         """
+        crossed = self.tick(dt)
+        month_changed = bool(crossed)
+        year_changed = any(month == 1 for _, month in crossed)
+        return month_changed, year_changed
+
+    def tick(self, dt: float) -> List[Tuple[int, int]]:
+        """
+        フレームの経過時間だけ時間を進める
+
+        Args:
+            dt: デルタタイム（秒）
+
+        Returns:
+            通過した月初の(年, 月)のリスト（古い順）
+        """
+        return self.advance_days(self.consume(dt))
+
+    def consume(self, dt: float) -> int:
+        """
+        経過時間を蓄積し、進めるべき日数を返す（暦はまだ進めない）
+
+        Args:
+            dt: デルタタイム（秒）
+        """
         if self.paused:
-            return False, False
+            return 0
 
-        month_changed = False
-        year_changed = False
+        # 最高速: 日単位の蓄積をせず月単位で進める
+        if math.isinf(self.game_speed):
+            self._day_accumulator = 0.0
+            target_month = self.month_index + config.MAX_SPEED_MONTHS_PER_FRAME
+            return target_month * config.DAYS_PER_MONTH - self.absolute_day
 
-        # 時間を蓄積
+        # 時間を蓄積（1秒 = 1日）
         self._day_accumulator += dt * self.game_speed
+        days = int(self._day_accumulator)
+        self._day_accumulator -= days
+        return days
 
-        # 1秒 = 1日として処理
-        while self._day_accumulator >= 1.0:
-            self._day_accumulator -= 1.0
-            self.day += 1
+    def advance_days(self, days: int) -> List[Tuple[int, int]]:
+        """
+        指定日数だけ時間を進める（日ごとのループなし）
 
-            # 月末処理
-            if self.day > config.DAYS_PER_MONTH:
-                self.day = 1
-                self.month += 1
-                month_changed = True
+        Returns:
+            通過した月初の(年, 月)のリスト（古い順）
+        """
+        if days <= 0:
+            return []
 
-                # 年末処理
-                if self.month > config.MONTHS_PER_YEAR:
-                    self.month = 1
-                    self.year += 1
-                    year_changed = True
+        start_month_index = self.month_index
+        month_index, day_index = divmod(self.absolute_day + days, config.DAYS_PER_MONTH)
+        self.year, self.month = self.month_from_index(month_index)
+        self.day = day_index + 1
 
-        return month_changed, year_changed
+        return [self.month_from_index(index)
+                for index in range(start_month_index + 1, month_index + 1)]
+
+    def advance_to(self, year: int, month: int) -> List[Tuple[int, int]]:
+        """
+        指定した年月の1日まで時間を進める（過去の年月なら何もしない）
+
+        Returns:
+            通過した月初の(年, 月)のリスト（古い順）
+        """
+        return self.advance_to_index(year * config.MONTHS_PER_YEAR + (month - 1))
+
+    def advance_to_index(self, month_index: int) -> List[Tuple[int, int]]:
+        """通算月数で指定した月の1日まで時間を進める"""
+        days = month_index * config.DAYS_PER_MONTH - self.absolute_day
+        return self.advance_days(days)
 
     def is_april(self) -> bool:
         """4月かどうか（入学シーズン）"""
@@ -5,6 +5,7 @@ import pygame
 from typing import Callable, Optional, Tuple
 
 from src.graphics.colors import Colors, get_font
+from src.graphics.text_cache import render_text
 
 
 class Button:
@@ -73,6 +74,19 @@ class Button:
 
         return False
 
+    @property
+    def bounds(self) -> pygame.Rect:
+        """描画範囲（テキストがボタンからはみ出す分を含む）"""
+        text_rect = pygame.Rect((0, 0), self.font.size(self.text))
+        text_rect.center = self.rect.center
+        # TextButtonのアンダーライン分
+        return self.rect.union(text_rect.inflate(0, 6))
+
+    def state_key(self) -> tuple:
+        """描画内容を表す値（前回と同じなら描き直さなくてよい）"""
+        return (tuple(self.rect), self.text, self.font_size, self.color, self.hover_color,
+                self.text_color, self.is_enabled, self.is_pressed, self.is_hovered)
+
     def update(self) -> None:
         """更新処理"""
         # マウス位置でホバー状態を更新
@@ -96,7 +110,7 @@ class Button:
         pygame.draw.rect(surface, Colors.UI_BORDER, self.rect, 2)
 
         # テキスト
-        text_surface = self.font.render(self.text, True, self.text_color)
+        text_surface = render_text(self.text, self.font_size, self.text_color)
         text_rect = text_surface.get_rect(center=self.rect.center)
         surface.blit(text_surface, text_rect)
 
@@ -117,7 +131,7 @@ class TextButton(Button):
         else:
             color = self.text_color
 
-        text_surface = self.font.render(self.text, True, color)
+        text_surface = render_text(self.text, self.font_size, color)
         text_rect = text_surface.get_rect(center=self.rect.center)
         surface.blit(text_surface, text_rect)
 
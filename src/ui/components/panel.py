@@ -2,14 +2,16 @@
 パネルUIコンポーネント
 """
 import pygame
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from src.graphics.colors import Colors, get_font
+from src.graphics.glyph_atlas import draw_text, text_size
+from src.graphics.text_cache import render_text
 import config
 
 
 class Panel:
-    """情報表示用パネル"""
+    """情報表示用パネル（内容が変わった時だけ描き直した画像を保持する）"""
 
     def __init__(
         self,
@@ -30,6 +32,11 @@ class Panel:
         self.padding = 10
         self.line_height = 26
 
+        # 合成済みの画像（背景・枠・タイトル・各行）と、その内容・パネルからのずれ
+        self._composed: Optional[pygame.Surface] = None
+        self._composed_key: Optional[tuple] = None
+        self._composed_offset = (0, 0)
+
     @property
     def font(self) -> pygame.font.Font:
         return get_font(config.FONT_SIZE_NORMAL)
@@ -50,35 +57,82 @@ class Panel:
         """区切り線を追加"""
         self.lines.append(("---", Colors.UI_BORDER))
 
+    def set_lines(self, lines: List[Tuple[str, Tuple[int, int, int]]]) -> bool:
+        """
+        表示内容をまとめて設定（clear/add_lineを毎フレーム呼ぶ代わりに使う）
+
+        Returns:
+            内容が変わったかどうか
+        """
+        if lines == self.lines:
+            return False
+        self.lines = list(lines)
+        return True
+
     def set_position(self, x: int, y: int) -> None:
         """位置を設定"""
         self.rect.x = x
         self.rect.y = y
 
+    @property
+    def bounds(self) -> pygame.Rect:
+        """描画範囲（行がパネルからはみ出す分を含む）"""
+        composed = self._compose()
+        return composed.get_rect(topleft=(self.rect.x + self._composed_offset[0],
+                                          self.rect.y + self._composed_offset[1]))
+
+    def state_key(self) -> tuple:
+        """描画内容を表す値（前回と同じなら描き直さなくてよい）"""
+        return (tuple(self.rect), self._content_key())
+
+    def _content_key(self) -> tuple:
+        return (self.rect.size, self.title, tuple(self.lines), self.bg_color, self.alpha)
+
     def render(self, surface: pygame.Surface) -> None:
-        """描画"""
+        """描画（合成済みの画像を1回貼るだけ）"""
+        composed = self._compose()
+        surface.blit(composed, (self.rect.x + self._composed_offset[0], self.rect.y + self._composed_offset[1]))
+
+    def _compose(self) -> pygame.Surface:
+        """内容が変わっていれば合成し直す"""
+        key = self._content_key()
+        if self._composed is not None and key == self._composed_key:
+            return self._composed
+
+        width, height = self.rect.size
+        line_top = self.padding + (self.line_height + 15 if self.title else 0)
+
+        # 行がパネルからはみ出す場合はその分も含めて作る
+        area = pygame.Rect(0, 0, width, height)
+        y_offset = line_top
+        for text, color in self.lines:
+            if text != "---":
+                text_width, text_height = text_size(text, config.FONT_SIZE_NORMAL, color)
+                area.union_ip(pygame.Rect(self.padding, y_offset, text_width, text_height))
+            y_offset += self.line_height
+
+        composed = pygame.Surface(area.size, pygame.SRCALPHA)
+        ox, oy = -area.x, -area.y
+
         # 半透明パネル背景
-        panel_surface = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
-        panel_surface.fill((*self.bg_color, self.alpha))
+        composed.fill((*self.bg_color, self.alpha), (ox, oy, width, height))
 
         # 枠線
-        pygame.draw.rect(panel_surface, Colors.UI_BORDER, (0, 0, self.rect.width, self.rect.height), 2)
-
-        surface.blit(panel_surface, self.rect.topleft)
+        pygame.draw.rect(composed, Colors.UI_BORDER, (ox, oy, width, height), 2)
 
         # タイトル
         y_offset = self.padding
         if self.title:
-            title_surface = self.title_font.render(self.title, True, Colors.UI_TEXT)
-            surface.blit(title_surface, (self.rect.x + self.padding, self.rect.y + y_offset))
+            title_surface = render_text(self.title, config.FONT_SIZE_LARGE, Colors.UI_TEXT)
+            composed.blit(title_surface, (ox + self.padding, oy + y_offset))
             y_offset += self.line_height + 5
 
             # タイトル下の区切り線
             pygame.draw.line(
-                surface,
+                composed,
                 Colors.UI_BORDER,
-                (self.rect.x + self.padding, self.rect.y + y_offset),
-                (self.rect.x + self.rect.width - self.padding, self.rect.y + y_offset),
+                (ox + self.padding, oy + y_offset),
+                (ox + width - self.padding, oy + y_offset),
                 1
             )
             y_offset += 10
@@ -88,17 +142,21 @@ class Panel:
             if text == "---":
                 # 区切り線
                 pygame.draw.line(
-                    surface,
+                    composed,
                     color,
-                    (self.rect.x + self.padding, self.rect.y + y_offset + self.line_height // 2),
-                    (self.rect.x + self.rect.width - self.padding, self.rect.y + y_offset + self.line_height // 2),
+                    (ox + self.padding, oy + y_offset + self.line_height // 2),
+                    (ox + width - self.padding, oy + y_offset + self.line_height // 2),
                     1
                 )
             else:
-                text_surface = self.font.render(text, True, color)
-                surface.blit(text_surface, (self.rect.x + self.padding, self.rect.y + y_offset))
+                draw_text(composed, text, config.FONT_SIZE_NORMAL, color, (ox + self.padding, oy + y_offset))
             y_offset += self.line_height
 
+        self._composed = composed
+        self._composed_key = key
+        self._composed_offset = (area.x, area.y)
+        return composed
+
 
 class StatusBar:
     """ステータスバー（プログレスバー付き）"""
@@ -125,10 +183,22 @@ class StatusBar:
         """値を設定"""
         self.value = max(0, min(self.max_value, value))
 
+    @property
+    def bounds(self) -> pygame.Rect:
+        """描画範囲（値テキストがバーからはみ出す分を含む）"""
+        bar_rect = pygame.Rect(self.rect.x, self.rect.y + 20, self.rect.width, self.rect.height - 20)
+        return self.rect.union(self._value_rect(bar_rect))
+
+    def state_key(self) -> tuple:
+        """描画内容を表す値（バーの長さ・色・表示する数値が同じなら同じ）"""
+        fill_width = int(self.rect.width * (self.value / self.max_value))
+        return (tuple(self.rect), self.label, fill_width, Colors.get_status_color(self.value),
+                self._value_text())
+
     def render(self, surface: pygame.Surface) -> None:
         """描画"""
         # ラベル
-        label_surface = self.font.render(self.label, True, Colors.UI_TEXT)
+        label_surface = render_text(self.label, config.FONT_SIZE_SMALL, Colors.UI_TEXT)
         surface.blit(label_surface, (self.rect.x, self.rect.y))
 
         # バー背景
@@ -152,7 +222,14 @@ class StatusBar:
         pygame.draw.rect(surface, Colors.UI_BORDER, bar_rect, 1)
 
         # 値テキスト
-        value_text = f"{self.value:.0f}/{self.max_value:.0f}"
-        value_surface = self.font.render(value_text, True, Colors.UI_TEXT)
-        value_rect = value_surface.get_rect(center=bar_rect.center)
-        surface.blit(value_surface, value_rect)
+        value_rect = self._value_rect(bar_rect)
+        draw_text(surface, self._value_text(), config.FONT_SIZE_SMALL, Colors.UI_TEXT, value_rect.topleft)
+
+    def _value_text(self) -> str:
+        return f"{self.value:.0f}/{self.max_value:.0f}"
+
+    def _value_rect(self, bar_rect: pygame.Rect) -> pygame.Rect:
+        """値テキストの範囲（バーの中央）"""
+        value_rect = pygame.Rect((0, 0), text_size(self._value_text(), config.FONT_SIZE_SMALL, Colors.UI_TEXT))
+        value_rect.center = bar_rect.center
+        return value_rect
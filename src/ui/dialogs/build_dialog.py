@@ -1,12 +1,15 @@
 import pygame
 import config
-from src.graphics.colors import Colors, get_font
+from src.graphics.colors import Colors
+from src.graphics.text_cache import render_text
 from src.ui.components.button import Button
 
 class BuildDialog:
-    def __init__(self, on_select_callback, on_close_callback):
+    def __init__(self, on_select_callback, on_close_callback, previews=None):
         self.on_select = on_select_callback
         self.on_close = on_close_callback
+        # 建設した場合の試算（'baseline' と施設IDごとの、Projectionを返すFuture）
+        self.previews = previews
         
         self.width = 600
         self.height = 500
@@ -28,6 +31,8 @@ class BuildDialog:
 
         # 施設リストボタン
         y = self.rect.top + 80
+        button_width = 330 if self.previews else 500
+        self.facility_buttons = []
         for key, data in config.FACILITY_DATA.items():
             # ボタンテキストを作成（名称 + 価格）
             text = f"{data['name']} (¥{data['cost']//10000}万)"
@@ -37,11 +42,12 @@ class BuildDialog:
                 return lambda: self.on_select(k)
 
             btn = Button(
-                self.rect.left + 50, y, 500, 50, text,
+                self.rect.left + 50, y, button_width, 50, text,
                 callback=make_callback(key),
                 color=Colors.UI_PANEL_BG
             )
             self.buttons.append(btn)
+            self.facility_buttons.append((key, btn))
             y += 60
 
     def handle_event(self, event):
@@ -60,12 +66,46 @@ class BuildDialog:
         pygame.draw.rect(surface, Colors.UI_BORDER, self.rect, 2)
 
         # タイトル
-        title = get_font(32).render("施設建設", True, Colors.UI_TEXT)
+        title = render_text("施設建設", 32, Colors.UI_TEXT)
         surface.blit(title, (self.rect.left + 20, self.rect.top + 20))
 
         # ボタン
         for btn in self.buttons:
             btn.render(surface)
-            
-            # 効果の説明などをボタンの右に表示（簡易版）
-            # ここでは省略
\ No newline at end of file
+
+        # 建設した場合の試算をボタンの右に表示
+        if self.previews:
+            self._render_previews(surface)
+
+    def cancel_previews(self):
+        """まだ始まっていない試算を取り消す（ダイアログを閉じる時）"""
+        if self.previews:
+            for future in self.previews.values():
+                future.cancel()
+
+    def _render_previews(self, surface):
+        baseline_future = self.previews['baseline']
+        baseline = baseline_future.result() if baseline_future.done() and not baseline_future.cancelled() else None
+        for key, btn in self.facility_buttons:
+            future = self.previews.get(key)
+            if future is None or future.cancelled():
+                continue
+            x = btn.rect.right + 10
+            if baseline is None or not future.done():
+                surface.blit(render_text("試算中...", config.FONT_SIZE_SMALL, Colors.UI_TEXT), (x, btn.rect.top + 14))
+                continue
+            projection = future.result()
+            months = len(baseline.money)
+            if not projection.applied:
+                surface.blit(render_text("資金不足", config.FONT_SIZE_SMALL, Colors.STATUS_BAD), (x, btn.rect.top + 14))
+                continue
+
+            money_diff = (projection.final_money - baseline.final_money) // 10000
+            reputation_diff = projection.final_reputation - baseline.final_reputation
+            color = Colors.STATUS_GOOD if money_diff >= 0 else Colors.STATUS_BAD
+            lines = [
+                (f"{months}ヶ月後 資金{money_diff:+,}万", color),
+                (f"評判{reputation_diff:+.1f}" + (" 破産" if projection.bankruptcy_month else ""), Colors.UI_TEXT),
+            ]
+            for i, (text, text_color) in enumerate(lines):
+                surface.blit(render_text(text, config.FONT_SIZE_SMALL, text_color), (x, btn.rect.top + 4 + i * 22))
\ No newline at end of file
@@ -6,6 +6,8 @@ from typing import Callable, List, TYPE_CHECKING
 
 import config
 from src.graphics.colors import Colors, get_font
+from src.graphics.glyph_atlas import draw_text
+from src.graphics.text_cache import render_text
 from src.ui.components.button import Button
 from src.entities.teacher import Teacher
 from src.data.teacher_data import generate_teacher_candidates
@@ -22,10 +24,12 @@ class HireDialog:
         school: 'School',
         on_close: Callable,
         on_hire: Callable[[Teacher], None],
+        rng,
     ):
         self.school = school
         self.on_close = on_close
         self.on_hire = on_hire
+        self.rng = rng  # 候補者生成用の乱数ストリーム
 
         # ダイアログサイズ（日本語に合わせて拡大）
         self.width = 650
@@ -54,7 +58,7 @@ class HireDialog:
 
     def refresh_candidates(self) -> None:
         """候補者リストを更新"""
-        self.candidates = generate_teacher_candidates(4)
+        self.candidates = generate_teacher_candidates(4, self.rng)
 
     def _init_ui(self) -> None:
         """UI初期化"""
@@ -162,13 +166,12 @@ class HireDialog:
         pygame.draw.rect(surface, Colors.UI_BORDER, dialog_rect, 3)
 
         # タイトル
-        title = self.title_font.render("教師を雇用する", True, Colors.UI_TEXT)
+        title = render_text("教師を雇用する", config.FONT_SIZE_LARGE, Colors.UI_TEXT)
         surface.blit(title, (self.x + 20, self.y + 15))
 
         # 現在の資金
         money_text = f"利用可能資金: {self.school.money:,}円"
-        money_surface = self.font.render(money_text, True, Colors.MONEY_POSITIVE)
-        surface.blit(money_surface, (self.x + 20, self.y + 55))
+        draw_text(surface, money_text, config.FONT_SIZE_NORMAL, Colors.MONEY_POSITIVE, (self.x + 20, self.y + 55))
 
         # 候補者リスト
         for i, candidate in enumerate(self.candidates):
@@ -189,18 +192,18 @@ class HireDialog:
         pygame.draw.rect(surface, Colors.UI_BORDER, bg_rect, 1)
 
         # 名前
-        name_text = self.font.render(teacher.name, True, Colors.UI_TEXT)
+        name_text = render_text(teacher.name, config.FONT_SIZE_NORMAL, Colors.UI_TEXT)
         surface.blit(name_text, (self.x + 20, y + 10))
 
         # 教科
-        subject_text = self.font.render(f"担当: {teacher.subject}", True, Colors.LIGHT_GRAY)
+        subject_text = render_text(f"担当: {teacher.subject}", config.FONT_SIZE_NORMAL, Colors.LIGHT_GRAY)
         surface.blit(subject_text, (self.x + 220, y + 10))
 
         # スキル
         skill_color = Colors.get_status_color(teacher.skill, 40, 70)
-        skill_text = self.font.render(f"教育力: {teacher.skill}", True, skill_color)
+        skill_text = render_text(f"教育力: {teacher.skill}", config.FONT_SIZE_NORMAL, skill_color)
         surface.blit(skill_text, (self.x + 20, y + 40))
 
         # 給与
-        salary_text = self.font.render(f"月給: {teacher.salary:,}円", True, Colors.MONEY_NEGATIVE)
+        salary_text = render_text(f"月給: {teacher.salary:,}円", config.FONT_SIZE_NORMAL, Colors.MONEY_NEGATIVE)
         surface.blit(salary_text, (self.x + 220, y + 40))
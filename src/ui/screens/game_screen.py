@@ -2,7 +2,7 @@
 メインゲーム画面（建設機能付き）
 """
 import pygame
-from typing import Callable, TYPE_CHECKING, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 import config
 from src.graphics.colors import Colors, get_font
@@ -12,6 +12,7 @@ from src.graphics.map_renderer import MapRenderer  # 追加
 from src.ui.dialogs.build_dialog import BuildDialog # 追加
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
     from src.entities.school import School
     from src.systems.time_manager import TimeManager
 
@@ -27,6 +28,8 @@ class GameScreen:
         on_fire: Callable,
         on_promote: Callable,
         on_speed_change: Callable,
+        on_build: Callable[[str, int, int], bool],
+        on_preview_build: Optional[Callable[[], Dict[str, 'Future']]] = None,
     ):
         self.school = school
         self.time_manager = time_manager
@@ -45,6 +48,11 @@ class GameScreen:
         self.on_fire = on_fire
         self.on_promote = on_promote
         self.on_speed_change = on_speed_change
+        self.on_build = on_build
+        self.on_preview_build = on_preview_build
+
+        # 差分描画: 部品ごとの前回の描画範囲と描画内容（空なら次は全体を描く）
+        self._drawn: Dict[Any, Tuple[pygame.Rect, Any]] = {}
 
         # UI初期化
         self._init_panels()
@@ -86,14 +94,28 @@ class GameScreen:
             callback=self._open_build_dialog, color=(255, 140, 0), # オレンジ
         )
 
-        # 速度ボタン
+        # 速度ボタン（右端から並べる）
         speed_y = button_y
-        self.speed_buttons = [
-            Button(config.SCREEN_WIDTH - 180, speed_y, 50, 45, "1x", callback=lambda: self.on_speed_change(1.0)),
-            Button(config.SCREEN_WIDTH - 125, speed_y, 50, 45, "3x", callback=lambda: self.on_speed_change(3.0)),
-            Button(config.SCREEN_WIDTH - 70, speed_y, 60, 45, "10x", callback=lambda: self.on_speed_change(10.0)),
+        speed_presets = [
+            ("1x", config.GAME_SPEED_NORMAL, 50),
+            ("3x", config.GAME_SPEED_FAST, 50),
+            ("10x", config.GAME_SPEED_FASTER, 60),
+            ("100x", config.GAME_SPEED_ULTRA, 70),
+            ("1000x", config.GAME_SPEED_HYPER, 80),
+            ("MAX", config.GAME_SPEED_MAX, 65),
         ]
 
+        def make_speed_callback(speed):
+            return lambda: self.on_speed_change(speed)
+
+        self.speed_buttons = []
+        speed_x = config.SCREEN_WIDTH - 10 - sum(width + 5 for _, _, width in speed_presets) + 5
+        for label, speed, width in speed_presets:
+            self.speed_buttons.append(
+                Button(speed_x, speed_y, width, 45, label, callback=make_speed_callback(speed))
+            )
+            speed_x += width + 5
+
     def _init_status_bars(self) -> None:
         # ステータスバーをマップの上に被らない位置へ（とりあえず右上に）
         # マップが右側を占有するので、バーは左パネルの上に重ねるか、マップの上にオーバーレイするか
@@ -111,10 +133,13 @@ class GameScreen:
         self.is_build_mode = False # ダイアログが開くときはモード解除
         self.build_dialog = BuildDialog(
             on_select_callback=self._on_building_selected,
-            on_close_callback=self._close_build_dialog
+            on_close_callback=self._close_build_dialog,
+            previews=self.on_preview_build() if self.on_preview_build else None,
         )
     
     def _close_build_dialog(self):
+        if self.build_dialog:
+            self.build_dialog.cancel_previews()
         self.show_build_dialog = False
         self.build_dialog = None
 
@@ -136,7 +161,7 @@ class GameScreen:
                 grid_x, grid_y = self.map_renderer._screen_to_grid(event.pos)
                 if grid_x >= 0:
                     # 建設実行！
-                    if self.school.add_facility(self.selected_building_type, grid_x, grid_y):
+                    if self.on_build(self.selected_building_type, grid_x, grid_y):
                         # 成功したらモード継続（連続建設）するか、終了するか
                         # ここではモード解除
                         self.is_build_mode = False
@@ -175,24 +200,28 @@ class GameScreen:
         self.reputation_bar.set_value(self.school.reputation)
 
     def _update_info_panel(self) -> None:
-        self.info_panel.clear()
-        self.info_panel.add_line(f"{self.time_manager.date_string}")
-        self.info_panel.add_line(f"生徒: {self.school.student_count}/{self.school.capacity}")
-        self.info_panel.add_line(f"教師: {self.school.teacher_count}")
+        # 内容が前回と同じならパネルは描き直さない
+        self.info_panel.set_lines([
+            (f"{self.time_manager.date_string}", Colors.UI_TEXT),
+            (f"生徒: {self.school.student_count}/{self.school.capacity}", Colors.UI_TEXT),
+            (f"教師: {self.school.teacher_count}", Colors.UI_TEXT),
+        ])
 
     def _update_finance_panel(self) -> None:
-        self.finance_panel.clear()
         money_color = Colors.get_money_color(self.school.money)
-        self.finance_panel.add_line(f"資金: {self.school.money:,}", money_color)
         income = self.school.monthly_income
         expense = self.school.monthly_expense
         balance = self.school.monthly_balance
-        self.finance_panel.add_line(f"収支: {balance:+,}", Colors.get_money_color(balance))
+        self.finance_panel.set_lines([
+            (f"資金: {self.school.money:,}", money_color),
+            (f"収支: {balance:+,}", Colors.get_money_color(balance)),
+        ])
 
     def _update_teacher_panel(self) -> None:
-        self.teacher_panel.clear()
-        for teacher in self.school.teachers[:4]:
-            self.teacher_panel.add_line(f"{teacher.name} ({teacher.subject})", Colors.UI_TEXT)
+        self.teacher_panel.set_lines([
+            (f"{teacher.name} ({teacher.subject})", Colors.UI_TEXT)
+            for teacher in self.school.teachers[:4]
+        ])
 
     def render(self, surface: pygame.Surface) -> None:
         surface.fill(Colors.BACKGROUND)
@@ -224,4 +253,97 @@ class GameScreen:
 
         # 4. ダイアログ（最前面）
         if self.show_build_dialog and self.build_dialog:
-            self.build_dialog.render(surface)
\ No newline at end of file
+            self.build_dialog.render(surface)
+
+    # --- 差分描画 ---
+    def invalidate(self) -> None:
+        """次の差分描画で画面全体を描き直す"""
+        self._drawn.clear()
+
+    def render_dirty(self, surface: pygame.Surface) -> List[pygame.Rect]:
+        """
+        前回から変化した部品の範囲だけ描き直す
+
+        変化した範囲ごとに背景で塗り直し、その範囲に重なる部品を奥から順に描く。
+
+        Returns:
+            描き直した範囲（pygame.display.updateに渡す）
+        """
+        if self.show_build_dialog and self.build_dialog:
+            # ダイアログ表示中は毎回全体を描く
+            self.render(surface)
+            self._drawn.clear()
+            return [surface.get_rect()]
+
+        layers = self._dirty_layers()
+        if not self._drawn:
+            self.render(surface)
+            self._drawn = {key: (rect, state) for key, rect, state, _ in layers}
+            return [surface.get_rect()]
+
+        dirty: List[pygame.Rect] = []
+        current = {}
+        for key, rect, state, _ in layers:
+            current[key] = (rect, state)
+            previous = self._drawn.get(key)
+            if previous is None:
+                dirty.append(rect)
+            elif previous[1] != state or previous[0] != rect:
+                dirty.append(previous[0])
+                dirty.append(rect)
+        for key, (rect, _) in self._drawn.items():
+            if key not in current:
+                dirty.append(rect)
+        self._drawn = current
+
+        dirty = _merge_rects([rect.clip(surface.get_rect()) for rect in dirty if rect.width and rect.height])
+        for area in dirty:
+            surface.set_clip(area)
+            surface.fill(Colors.BACKGROUND, area)
+            for _, rect, _, draw in layers:
+                if rect.colliderect(area):
+                    draw(surface)
+        surface.set_clip(None)
+        return dirty
+
+    def _dirty_layers(self) -> List[Tuple[Any, pygame.Rect, Any, Callable[[pygame.Surface], None]]]:
+        """描画順（奥から）の部品一覧: (識別子, 描画範囲, 描画内容, 描画関数)"""
+        map_bounds = self.map_renderer.layer_bounds(self.school)
+        layers = [(
+            'map', map_bounds, (tuple(map_bounds), len(self.school.facilities)),
+            lambda surface: self.map_renderer.draw(surface, self.school),
+        )]
+
+        if self.is_build_mode and self.selected_building_type:
+            type_id = self.selected_building_type
+            mouse_pos = pygame.mouse.get_pos()
+            preview = self.map_renderer.preview_rect(type_id, mouse_pos)
+            if preview is not None:
+                rect, color = preview
+                layers.append((
+                    'preview', rect, color,
+                    lambda surface: self.map_renderer.draw_preview(surface, type_id, mouse_pos),
+                ))
+
+        widgets = [
+            self.info_panel, self.finance_panel, self.teacher_panel,
+            self.education_bar, self.satisfaction_bar, self.reputation_bar,
+            self.hire_button, self.fire_button, self.promote_button, self.build_button,
+            *self.speed_buttons,
+        ]
+        for widget in widgets:
+            layers.append((widget, widget.bounds, widget.state_key(), widget.render))
+        return layers
+
+
+def _merge_rects(rects: List[pygame.Rect]) -> List[pygame.Rect]:
+    """重なる矩形をまとめる（同じ範囲を2回描かないように）"""
+    merged: List[pygame.Rect] = []
+    for rect in rects:
+        rect = rect.copy()
+        index = rect.collidelist(merged)
+        while index >= 0:
+            rect.union_ip(merged.pop(index))
+            index = rect.collidelist(merged)
+        merged.append(rect)
+    return merged
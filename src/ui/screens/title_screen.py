@@ -6,6 +6,7 @@ from typing import Callable
 
 import config
 from src.graphics.colors import Colors, get_font
+from src.graphics.text_cache import render_text
 from src.ui.components.button import Button
 
 
@@ -69,13 +70,13 @@ class TitleScreen:
 
         # タイトル
         title_text = "青稜中学校・高等学校"
-        title_surface = self.title_font.render(title_text, True, Colors.UI_TEXT_DARK)
+        title_surface = render_text(title_text, config.FONT_SIZE_HUGE, Colors.UI_TEXT_DARK)
         title_rect = title_surface.get_rect(center=(config.SCREEN_WIDTH // 2, config.SCREEN_HEIGHT // 3 - 20))
         surface.blit(title_surface, title_rect)
 
         # サブタイトル
         subtitle_text = "〜 学校経営シミュレーション 〜"
-        subtitle_surface = self.subtitle_font.render(subtitle_text, True, Colors.GRAY)
+        subtitle_surface = render_text(subtitle_text, config.FONT_SIZE_TITLE, Colors.GRAY)
         subtitle_rect = subtitle_surface.get_rect(center=(config.SCREEN_WIDTH // 2, config.SCREEN_HEIGHT // 3 + 50))
         surface.blit(subtitle_surface, subtitle_rect)
 
@@ -85,5 +86,5 @@ class TitleScreen:
 
         # バージョン
         version_text = "v0.1.0 - 経営コアシステム"
-        version_surface = self.small_font.render(version_text, True, Colors.GRAY)
+        version_surface = render_text(version_text, config.FONT_SIZE_SMALL, Colors.GRAY)
         surface.blit(version_surface, (10, config.SCREEN_HEIGHT - 30))
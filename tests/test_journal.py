@@ -0,0 +1,36 @@
+"""
+操作ジャーナルの記録と再生のテスト
+"""
+from src.core.journal import ActionJournal, replay
+from src.core.simulation import Simulation
+
+
+def _summary(simulation: Simulation) -> tuple:
+    school = simulation.school
+    return (
+        simulation.time_manager.absolute_day,
+        school.money,
+        school.reputation,
+        school.student_count,
+        [teacher.id for teacher in school.teachers],
+    )
+
+
+def test_new_game_teacher_ids_are_seeded():
+    first = Simulation.new_game(seed=5)
+    second = Simulation.new_game(seed=5)
+
+    assert [t.id for t in first.school.teachers] == [t.id for t in second.school.teachers]
+
+
+def test_replay_fire_starting_teacher():
+    simulation = Simulation.new_game(seed=5)
+    simulation.journal = ActionJournal(simulation.rng.seed)
+    simulation.run_months(2)
+    assert simulation.fire_teacher(simulation.school.teachers[-1].id)
+    simulation.advance_days(45)
+    simulation.journal.close(simulation.time_manager.absolute_day)
+
+    replayed = replay(simulation.journal)
+
+    assert _summary(replayed) == _summary(simulation)
@@ -0,0 +1,32 @@
+"""
+もしも試算のテスト
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.core import preview
+from src.core.simulation import Simulation
+
+
+@pytest.mark.parametrize('months', [preview.MIN_PREVIEW_MONTHS - 1, preview.MAX_PREVIEW_MONTHS + 1])
+def test_months_out_of_range_raises(months):
+    simulation = Simulation.new_game(seed=6)
+
+    with pytest.raises(ValueError):
+        preview.project(simulation, months)
+    with pytest.raises(ValueError):
+        preview.compare(simulation, {}, months)
+
+
+def test_compare_with_executor_matches_sequential():
+    simulation = Simulation.new_game(seed=7)
+    simulation.run_months(2)
+    teacher_id = simulation.school.teachers[-1].id
+    options = {f'option{i}': [preview.fire_action(teacher_id)] if i % 2 else [] for i in range(4)}
+
+    sequential = preview.compare(simulation, options)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        parallel = preview.compare(simulation, options, executor=executor)
+
+    assert parallel == sequential
@@ -0,0 +1,66 @@
+"""
+セーブデータの保存・復元と分岐のテスト
+"""
+from src.core.simulation import Simulation
+from src.core.snapshot import dumps, loads
+from src.entities.teacher import Teacher
+
+
+def _state(simulation: Simulation) -> tuple:
+    school = simulation.school
+    return (
+        simulation.time_manager.absolute_day,
+        school.money,
+        school.reputation,
+        school.student_count,
+        sorted((t.id, t.name, t.subject, t.skill, t.experience) for t in school.teachers),
+        school.ledger.entries.tobytes(),
+    )
+
+
+def test_round_trip_keeps_state():
+    simulation = Simulation.new_game(seed=1)
+    simulation.run_months(3)
+
+    restored = loads(dumps(simulation))
+
+    assert _state(restored) == _state(simulation)
+    assert restored.recurring_event_days() == simulation.recurring_event_days()
+
+
+def test_round_trip_keeps_long_teacher_strings():
+    simulation = Simulation.new_game(seed=2)
+    teacher = Teacher(name='長谷川・フォン・シュタインベルク・エリザベート', skill=70, salary=300000,
+                      subject='情報・プログラミング・データサイエンス', id='teacher-long-id')
+    assert simulation.hire_teacher(teacher, record=False)
+
+    restored = loads(dumps(simulation, compress=False))
+
+    loaded = restored.school.teachers.get('teacher-long-id')
+    assert loaded.name == teacher.name
+    assert loaded.subject == teacher.subject
+    assert restored.fire_teacher('teacher-long-id', record=False)
+    assert restored.school.teachers.get('teacher-long-id') is None
+
+
+def test_fork_is_deterministic():
+    simulation = Simulation.new_game(seed=3)
+    simulation.run_months(2)
+
+    first = simulation.fork()
+    second = simulation.fork()
+    first.run_months(12)
+    second.run_months(12)
+    simulation.run_months(12)
+
+    assert _state(first) == _state(second) == _state(simulation)
+
+
+def test_fork_is_independent():
+    simulation = Simulation.new_game(seed=4)
+    before = _state(simulation)
+
+    forked = simulation.fork()
+    forked.run_months(6)
+
+    assert _state(simulation) == before
@@ -0,0 +1,29 @@
+"""
+時間管理のテスト
+"""
+import config
+from src.systems.time_manager import TimeManager
+
+
+def test_advance_to_returns_crossed_months():
+    time_manager = TimeManager(year=2024, month=11, day=10)
+
+    crossed = time_manager.advance_to(2025, 3)
+
+    assert crossed == [(2024, 12), (2025, 1), (2025, 2), (2025, 3)]
+    assert (time_manager.year, time_manager.month, time_manager.day) == (2025, 3, 1)
+
+
+def test_advance_to_past_month_does_nothing():
+    time_manager = TimeManager(year=2024, month=6, day=1)
+
+    assert time_manager.advance_to(2024, 4) == []
+    assert (time_manager.year, time_manager.month) == (2024, 6)
+
+
+def test_update_reports_month_and_year_change():
+    time_manager = TimeManager(year=2024, month=12, day=1, game_speed=1.0)
+
+    assert time_manager.update(1.0) == (False, False)
+    assert time_manager.update(float(config.DAYS_PER_MONTH)) == (True, True)
+    assert (time_manager.year, time_manager.month, time_manager.day) == (2025, 1, 2)